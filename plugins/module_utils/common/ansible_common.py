@@ -98,8 +98,20 @@ def convert_hex_to_dec(hex):
         return None
 
 
-def dicts_to_dataclass_list(data: List[dict], clsName: type) -> List:
+def dicts_to_dataclass_list(
+    data: List[dict], clsName: type, compact: bool = False
+) -> List:
+    """
+    Builds a clsName instance per dict. With compact, the instances are slotted
+    records (see compact_record), meant for long lists of SingleBaseClass models.
+    """
     if data is not None:
+        if compact:
+            try:
+                from ..model.common_base_models import compact_record
+            except ImportError:
+                from model.common_base_models import compact_record
+            clsName = compact_record(clsName)
         return [clsName(**item) for item in data]
     return None
 
@@ -20,6 +20,11 @@ TELEMETRY_FILE_PATH = os.getenv(
     "HV_TELEMETRY_FILE_PATH",
     os.path.expanduser(f"~/ansible/{NAMESPACE}/{PROJECT_NAME}/usages"),
 )
+TELEMETRY_BATCH_MODE = os.getenv("HV_TELEMETRY_BATCH_MODE", "false").lower() in (
+    "true",
+    "1",
+    "yes",
+)
 REGISTRATION_FILE_PATH = os.getenv(
     "HV_REGISTRATION_FILE_PATH",
     os.path.expanduser(f"~/ansible/{NAMESPACE}/{PROJECT_NAME}/registration"),
@@ -36,6 +41,75 @@ ENABLE_AUDIT_LOG = os.getenv("HV_ENABLE_AUDIT_LOG", "true").lower() in (
     "yes",
 )
 
+# SESSION CACHE CONSTANTS
+ENABLE_SESSION_CACHE = os.getenv("HV_ENABLE_SESSION_CACHE", "false").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+SESSION_CACHE_PATH = os.getenv(
+    "HV_SESSION_CACHE_PATH",
+    os.path.expanduser(f"~/ansible/{NAMESPACE}/{PROJECT_NAME}/sessions"),
+)
+SESSION_ALIVE_TIME = int(os.getenv("HV_SESSION_ALIVE_TIME", "300"))
+
+# HTTP RETRY CONSTANTS
+# Applies to requests rejected with 503 Service Unavailable
+HTTP_RETRY_MAX_ATTEMPTS = int(os.getenv("HV_HTTP_RETRY_MAX_ATTEMPTS", "8"))
+HTTP_RETRY_BASE_DELAY = float(os.getenv("HV_HTTP_RETRY_BASE_DELAY", "2"))
+HTTP_RETRY_MAX_DELAY = float(os.getenv("HV_HTTP_RETRY_MAX_DELAY", "120"))
+HTTP_RETRY_CEILING = float(os.getenv("HV_HTTP_RETRY_CEILING", "600"))
+
+# JOB POLLING CONSTANTS
+JOB_POLL_INITIAL_INTERVAL = float(os.getenv("HV_JOB_POLL_INITIAL_INTERVAL", "0.5"))
+JOB_POLL_MAX_INTERVAL = float(os.getenv("HV_JOB_POLL_MAX_INTERVAL", "10"))
+JOB_WAIT_TIMEOUT = int(os.getenv("HV_JOB_WAIT_TIMEOUT", "180300"))
+PEGASUS_JOB_WAIT_TIMEOUT = int(os.getenv("HV_PEGASUS_JOB_WAIT_TIMEOUT", "600"))
+JOB_RUNNING_STATE_TIMEOUT = int(os.getenv("HV_JOB_RUNNING_STATE_TIMEOUT", "600"))
+# Seconds to wait for a resource group to show the requested lock state
+RG_LOCK_WAIT_TIMEOUT = int(os.getenv("HV_RG_LOCK_WAIT_TIMEOUT", "210"))
+
+# PAIR STATE POLLING CONSTANTS
+# Pair status is read after 1s, then the interval doubles up to the maximum
+PAIR_STATE_POLL_INITIAL_INTERVAL = float(
+    os.getenv("HV_PAIR_STATE_POLL_INITIAL_INTERVAL", "1")
+)
+PAIR_STATE_POLL_MAX_INTERVAL = float(os.getenv("HV_PAIR_STATE_POLL_MAX_INTERVAL", "20"))
+# Seconds to wait for snapshot pairs to be split or resynchronized, and restored
+SNAPSHOT_PAIR_WAIT_TIMEOUT = int(os.getenv("HV_SNAPSHOT_PAIR_WAIT_TIMEOUT", "600"))
+SNAPSHOT_RESTORE_WAIT_TIMEOUT = int(os.getenv("HV_SNAPSHOT_RESTORE_WAIT_TIMEOUT", "60"))
+
+# SDS BLOCK LIST CONSTANTS
+# Number of items requested per page from paginated SDS Block list endpoints
+SDSB_PAGE_SIZE = int(os.getenv("HV_SDSB_PAGE_SIZE", "500"))
+
+# DOWNLOAD CONSTANTS
+# Files are copied to disk in chunks of this many bytes
+DOWNLOAD_CHUNK_SIZE = int(os.getenv("HV_DOWNLOAD_CHUNK_SIZE", str(1024 * 1024)))
+DOWNLOAD_ATTEMPTS = int(os.getenv("HV_DOWNLOAD_ATTEMPTS", "3"))
+# Files in multipart request bodies are sent in chunks of this many bytes
+UPLOAD_CHUNK_SIZE = int(os.getenv("HV_UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+
+# CONNECTION POOL CONSTANTS
+ENABLE_CONNECTION_POOL = os.getenv("HV_ENABLE_CONNECTION_POOL", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+CONNECTION_POOL_MAX_SIZE = int(os.getenv("HV_CONNECTION_POOL_MAX_SIZE", "10"))
+CONNECTION_POOL_IDLE_TIMEOUT = float(os.getenv("HV_CONNECTION_POOL_IDLE_TIMEOUT", "30"))
+
+# GET CACHE CONSTANTS
+# The TTL is kept below the shortest polling interval (5s) of the modules
+# that wait for a resource state, so polling always reads fresh data
+ENABLE_GET_CACHE = os.getenv("HV_ENABLE_GET_CACHE", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+GET_CACHE_TTL = float(os.getenv("HV_GET_CACHE_TTL", "3"))
+GET_CACHE_MAX_ENTRIES = int(os.getenv("HV_GET_CACHE_MAX_ENTRIES", "256"))
+
 # File Name Constants
 TELEMETRY_FILE_NAME = "usages.json"
 REGISTRATION_FILE_NAME = "registration.txt"
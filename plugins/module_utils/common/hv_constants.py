@@ -206,6 +206,7 @@ class VSPHostGroupConstant:
     STATE_SET_HOST_MODE = "set_host_mode_and_hmo"
     STATE_ADD_WWN = "add_wwn"
     STATE_REMOVE_WWN = "remove_wwn"
+    MAX_LUN_NUMBER = 2047
 
 
 class VSPIscsiTargetConstant:
@@ -0,0 +1,107 @@
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    from .ansible_common_constants import (
+        GET_CACHE_TTL,
+        GET_CACHE_MAX_ENTRIES,
+    )
+except ImportError:
+    from common.ansible_common_constants import (
+        GET_CACHE_TTL,
+        GET_CACHE_MAX_ENTRIES,
+    )
+
+
+class _InFlightCall:
+    def __init__(self, generation):
+        self.generation = generation
+        self.event = threading.Event()
+        self.result = None
+        self.text = None
+        self.error = None
+
+
+class GetCache:
+    """
+    Read-through cache of GET responses shared by all the connections of a
+    run.
+
+    Concurrent reads of the same key are coalesced, only the first one is
+    sent and the others wait for its response. Responses are kept for ttl
+    seconds as JSON text, every caller gets its own copy so the cached value
+    can not be changed by a caller. invalidate() drops every entry, a read
+    sent before the invalidation is neither joined nor stored.
+    """
+
+    def __init__(self, ttl=GET_CACHE_TTL, max_entries=GET_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._in_flight = {}
+        self._generation = 0
+
+    def get(self, key, fetch):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                text = entry[1]
+            else:
+                text = None
+                if entry is not None:
+                    del self._entries[key]
+                call = self._in_flight.get(key)
+                # a read sent before the last invalidation is not joined
+                leader = call is None or call.generation != self._generation
+                if leader:
+                    call = _InFlightCall(self._generation)
+                    self._in_flight[key] = call
+        if text is not None:
+            return json.loads(text)
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            if call.text is not None:
+                return json.loads(call.text)
+            return copy.deepcopy(call.result)
+
+        try:
+            result = fetch()
+        except Exception as e:
+            call.error = e
+            with self._lock:
+                self._finish(key, call)
+            call.event.set()
+            raise
+
+        if isinstance(result, (dict, list)):
+            call.text = json.dumps(result)
+        call.result = result
+        with self._lock:
+            self._finish(key, call)
+            if (
+                call.text is not None
+                and self.ttl > 0
+                and call.generation == self._generation
+            ):
+                self._entries[key] = (time.monotonic() + self.ttl, call.text)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        call.event.set()
+        return result
+
+    def _finish(self, key, call):
+        if self._in_flight.get(key) is call:
+            del self._in_flight[key]
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
@@ -19,6 +19,7 @@ try:
     )
     from ansible_collections.hitachivantara.vspone_block.plugins.module_utils.gateway.ansible_url import (
         open_url,
+        telemetry_caller,
     )
 except ImportError:
     from common.hv_log import Log
@@ -26,7 +27,7 @@ except ImportError:
         Http,
         LogMessages,
     )
-    from gateway.ansible_url import open_url
+    from gateway.ansible_url import open_url, telemetry_caller
 
 
 def get_with_log(class_name=""):
@@ -139,18 +140,19 @@ class HTTPClient(object):
                 logger.writeDebug(params)
                 params = urllib.parse.urlencode(params)
                 url = "{}?{}".format(url, params)
-            response = open_url(
-                url=url,
-                headers=headers,
-                # url_username=params.user if (params.session_id is None) else None,
-                # url_password=params.password if (params.session_id is None) else None,
-                method=method,
-                # force_basic_auth=True if (params.session_id is None) else False,
-                validate_certs=HTTPClient._is_validate_certs(json),
-                timeout=Http.OPEN_URL_TIMEOUT,
-                http_agent=Http.USER_AGENT,
-                data=data,
-            )
+            with telemetry_caller(HTTPClient.__name__, method.lower()):
+                response = open_url(
+                    url=url,
+                    headers=headers,
+                    # url_username=params.user if (params.session_id is None) else None,
+                    # url_password=params.password if (params.session_id is None) else None,
+                    method=method,
+                    # force_basic_auth=True if (params.session_id is None) else False,
+                    validate_certs=HTTPClient._is_validate_certs(json),
+                    timeout=Http.OPEN_URL_TIMEOUT,
+                    http_agent=Http.USER_AGENT,
+                    data=data,
+                )
             return HTTPClient._load_response(response, bytes)
         except urllib_error.HTTPError as err:
 
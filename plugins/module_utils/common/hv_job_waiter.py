@@ -0,0 +1,109 @@
+import math
+import time
+
+try:
+    from .ansible_common_constants import (
+        JOB_POLL_INITIAL_INTERVAL,
+        JOB_POLL_MAX_INTERVAL,
+    )
+except ImportError:
+    from common.ansible_common_constants import (
+        JOB_POLL_INITIAL_INTERVAL,
+        JOB_POLL_MAX_INTERVAL,
+    )
+
+
+class JobTimeoutError(Exception):
+    """Raised when a job does not finish before the deadline."""
+
+
+class JobWaiter:
+    """
+    Polls asynchronous storage jobs until they finish or a deadline passes.
+
+    A job is described by a probe, a callable returning the job result once
+    the job has finished and None while it is still running. Probes raise to
+    report a failed job. The first probe is sent right away, after that the
+    interval grows exponentially up to max_interval. Past that it keeps
+    growing with the time waited, as the linear backoff it replaced did (the
+    n-th probe after about n*n/2 seconds), so long jobs are not probed more
+    often than before.
+    """
+
+    def __init__(
+        self,
+        timeout,
+        initial_interval=JOB_POLL_INITIAL_INTERVAL,
+        max_interval=JOB_POLL_MAX_INTERVAL,
+        backoff_factor=2.0,
+    ):
+        self.timeout = timeout
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+
+    def timeout_message(self):
+        return f"Timeout Error! The tasks was not completed in {self.timeout // 60:g} minutes"
+
+    def intervals(self):
+        start = time.monotonic()
+        interval = self.initial_interval
+        while True:
+            yield max(interval, math.sqrt(2 * (time.monotonic() - start)))
+            interval = min(interval * self.backoff_factor, self.max_interval)
+
+    def wait(self, probe):
+        deadline = time.monotonic() + self.timeout
+        for interval in self.intervals():
+            result = probe()
+            if result is not None:
+                return result
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise JobTimeoutError(self.timeout_message())
+            time.sleep(min(interval, remaining))
+
+    def wait_all(self, probes, probe_many=None):
+        """
+        Waits for several jobs at once and returns a (result, error) tuple per
+        probe, in the order the probes were given. Every outstanding job is
+        checked once per interval. probe_many, if given, receives the indexes
+        of the outstanding probes and returns a dict of index to result so the
+        status of all of them can be fetched with a single query.
+        """
+        results = [None] * len(probes)
+        outstanding = list(range(len(probes)))
+        deadline = time.monotonic() + self.timeout
+        for interval in self.intervals():
+            if probe_many is not None:
+                try:
+                    finished = probe_many(outstanding)
+                except Exception as e:
+                    finished = {index: e for index in outstanding}
+            else:
+                finished = {}
+                for index in outstanding:
+                    try:
+                        finished[index] = probes[index]()
+                    except Exception as e:
+                        finished[index] = e
+
+            still_running = []
+            for index in outstanding:
+                result = finished.get(index)
+                if result is None:
+                    still_running.append(index)
+                elif isinstance(result, Exception):
+                    results[index] = (None, result)
+                else:
+                    results[index] = (result, None)
+            outstanding = still_running
+            if not outstanding:
+                return results
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                for index in outstanding:
+                    results[index] = (None, JobTimeoutError(self.timeout_message()))
+                return results
+            time.sleep(min(interval, remaining))
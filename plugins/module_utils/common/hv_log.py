@@ -3,7 +3,6 @@ import os
 import sys
 import configparser
 import ast
-import inspect
 import uuid
 import logging.config
 import logging.handlers
@@ -142,6 +141,29 @@ def setup_logging(logger, audit_logger):
         audit_logger.addHandler(audit_log_handler)
 
 
+class LazyLogMessage:
+    """
+    Log message that is only formatted when a handler emits the record.
+    Keeps the "filename - funcName - lineno - message" layout of the write* methods.
+    """
+
+    __slots__ = ("frame_info", "messageID", "args")
+
+    def __init__(self, frame_info, messageID, args):
+        self.frame_info = frame_info
+        self.messageID = messageID
+        self.args = args
+
+    def __str__(self):
+        messageID = self.messageID
+        if self.args:
+            messageID = messageID.format(*self.args)
+        frame_info = self.frame_info
+        if frame_info:
+            return f"{frame_info['filename']} - {frame_info['funcName']} - {frame_info['lineno']} - {messageID}"
+        return messageID
+
+
 class Log:
 
     logger = None
@@ -197,19 +219,20 @@ class Log:
                 )
         self.loadMessageIDs()
 
-    def get_previous_frame_info(self):
-        frame = inspect.currentframe()
-        outer_frames = inspect.getouterframes(frame)
-        if len(outer_frames) > 2:
+    def get_previous_frame_info(self, depth=2):
+        # sys._getframe only walks frame pointers, unlike inspect.getouterframes
+        # which reads the source context of every frame on the stack
+        try:
             # Get the previous frame (two levels up)
-            previous_frame = outer_frames[2]
-            frame_info = {
-                "filename": os.path.basename(previous_frame.filename),
-                "funcName": previous_frame.function,
-                "lineno": previous_frame.lineno,
-            }
-            return frame_info
-        return None
+            previous_frame = sys._getframe(depth)
+        except ValueError:
+            return None
+        frame_info = {
+            "filename": os.path.basename(previous_frame.f_code.co_filename),
+            "funcName": previous_frame.f_code.co_name,
+            "lineno": previous_frame.f_lineno,
+        }
+        return frame_info
 
     def ensure_log_dirs(self, config_file):
         config = configparser.ConfigParser()
@@ -320,50 +343,30 @@ class Log:
         self.audit_logger.info(messageID)
 
     def writeInfo(self, messageID, *args):
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         frame_info = self.get_previous_frame_info()
-        if args:
-            messageID = messageID.format(*args)
-        msg = (
-            f"{frame_info['filename']} - {frame_info['funcName']} - {frame_info['lineno']} - {messageID}"
-            if frame_info
-            else messageID
-        )
-        self.logger.info(msg)
+        self.logger.info(LazyLogMessage(frame_info, messageID, args))
 
     def writeDebug(self, messageID, *args):
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         frame_info = self.get_previous_frame_info()
-        if args:
-            messageID = messageID.format(*args)
-        msg = (
-            f"{frame_info['filename']} - {frame_info['funcName']} - {frame_info['lineno']} - {messageID}"
-            if frame_info
-            else messageID
-        )
-        self.logger.debug(msg)
+        self.logger.debug(LazyLogMessage(frame_info, messageID, args))
 
     def writeError(self, messageID, *args):
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
         frame_info = self.get_previous_frame_info()
         messageID = self.getMessageIDString(messageID, "E", "ERROR")
-        if args:
-            messageID = messageID.format(*args)
-        msg = (
-            f"{frame_info['filename']} - {frame_info['funcName']} - {frame_info['lineno']} - {messageID}"
-            if frame_info
-            else messageID
-        )
-        self.logger.error(msg)
+        self.logger.error(LazyLogMessage(frame_info, messageID, args))
 
     def writeWarning(self, messageID, *args):
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
         frame_info = self.get_previous_frame_info()
         messageID = self.getMessageIDString(messageID, "W", "WARN")
-        if args:
-            messageID = messageID.format(*args)
-        msg = (
-            f"{frame_info['filename']} - {frame_info['funcName']} - {frame_info['lineno']} - {messageID}"
-            if frame_info
-            else messageID
-        )
-        self.logger.warning(msg)
+        self.logger.warning(LazyLogMessage(frame_info, messageID, args))
 
     def writeEnter(self, messageID, *args):
         if args:
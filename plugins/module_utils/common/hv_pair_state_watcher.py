@@ -0,0 +1,52 @@
+try:
+    from .hv_job_waiter import JobWaiter, JobTimeoutError
+    from .ansible_common_constants import (
+        PAIR_STATE_POLL_INITIAL_INTERVAL,
+        PAIR_STATE_POLL_MAX_INTERVAL,
+    )
+except ImportError:
+    from common.hv_job_waiter import JobWaiter, JobTimeoutError
+    from common.ansible_common_constants import (
+        PAIR_STATE_POLL_INITIAL_INTERVAL,
+        PAIR_STATE_POLL_MAX_INTERVAL,
+    )
+
+
+class PairStateWatcher(JobWaiter):
+    """
+    Polls copy pairs until they reach a status or the deadline passes.
+
+    The first read is sent right away, after that the interval grows from
+    initial_interval up to max_interval, so a pair that changes state in a
+    second is seen in about a second while a long copy is not polled more
+    often than before.
+    """
+
+    def __init__(
+        self,
+        timeout,
+        initial_interval=PAIR_STATE_POLL_INITIAL_INTERVAL,
+        max_interval=PAIR_STATE_POLL_MAX_INTERVAL,
+    ):
+        super().__init__(timeout, initial_interval, max_interval)
+
+    def watch(self, read, status):
+        """
+        read returns a pair or a list of pairs, each with a status attribute.
+        Returns a (pairs, reached) tuple with the last value read and whether
+        every pair reached status before the deadline.
+        """
+        last = [None]
+
+        def probe():
+            pairs = read()
+            last[0] = pairs
+            items = pairs if isinstance(pairs, list) else [pairs]
+            if all(pair.status == status for pair in items):
+                return pairs
+            return None
+
+        try:
+            return self.wait(probe), True
+        except JobTimeoutError:
+            return last[0], False
@@ -0,0 +1,105 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+try:
+    from .ansible_common_constants import (
+        HTTP_RETRY_MAX_ATTEMPTS,
+        HTTP_RETRY_BASE_DELAY,
+        HTTP_RETRY_MAX_DELAY,
+        HTTP_RETRY_CEILING,
+    )
+except ImportError:
+    from common.ansible_common_constants import (
+        HTTP_RETRY_MAX_ATTEMPTS,
+        HTTP_RETRY_BASE_DELAY,
+        HTTP_RETRY_MAX_DELAY,
+        HTTP_RETRY_CEILING,
+    )
+
+
+class RetryPolicy:
+    """
+    Backoff settings for retrying requests the storage system rejected as busy.
+
+    The policy itself holds no state, every request takes its own RetryBudget
+    through new_budget() so retries are never shared between requests.
+    """
+
+    def __init__(
+        self,
+        max_attempts=HTTP_RETRY_MAX_ATTEMPTS,
+        base_delay=HTTP_RETRY_BASE_DELAY,
+        max_delay=HTTP_RETRY_MAX_DELAY,
+        ceiling=HTTP_RETRY_CEILING,
+        retry_status_codes=(503,),
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.ceiling = ceiling
+        self.retry_status_codes = retry_status_codes
+
+    def is_retryable(self, status_code):
+        return status_code in self.retry_status_codes
+
+    def backoff(self, attempt):
+        """Exponential backoff with full jitter for the given 0 based attempt."""
+        return random.uniform(
+            0, min(self.max_delay, self.base_delay * (2**attempt))
+        )  # nosec
+
+    def new_budget(self):
+        return RetryBudget(self)
+
+
+class RetryBudget:
+    """Retry state of a single request."""
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.attempt = 0
+        self.waited = 0.0
+
+    @staticmethod
+    def retry_after(err):
+        """Returns the Retry-After header of an HTTPError in seconds, if any."""
+        headers = getattr(err, "headers", None)
+        value = headers.get("Retry-After") if headers is not None else None
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def next_delay(self, err=None):
+        """
+        Returns the number of seconds to wait before the next attempt, or
+        None when the request has used up its attempts or its time ceiling.
+        """
+        if self.attempt >= self.policy.max_attempts:
+            return None
+        remaining = self.policy.ceiling - self.waited
+        if remaining <= 0:
+            return None
+        delay = self.retry_after(err)
+        if delay is None:
+            delay = self.policy.backoff(self.attempt)
+        return min(delay, remaining)
+
+    def wait(self, err=None):
+        """Sleeps before the next attempt, returns False if no retry is left."""
+        delay = self.next_delay(err)
+        if delay is None:
+            return False
+        self.attempt += 1
+        self.waited += delay
+        time.sleep(delay)
+        return True
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
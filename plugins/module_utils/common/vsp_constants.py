@@ -80,6 +80,9 @@ class Endpoints(object):
     POST_QOS_UPDATE = "v1/objects/ldevs/{}/actions/set-qos/invoke"
     GET_LDEV_EXT_VOL = "v1/objects/ldevs/{}?detailInfoType=externalVolume"
     GET_QOS_SETTINGS = "v1/objects/ldevs?headLdevId={}&count=1&detailInfoType=qos"
+    GET_QOS_SETTINGS_RANGE = (
+        "v1/objects/ldevs?headLdevId={}&count={}&detailInfoType=qos"
+    )
     SALAMENDER_GET_QOS_SETTINGS = "simple/v1/objects/volumes/{}/qos-setting"
     GET_CMD_DEVICE = "v1/objects/ldevs?headLdevId={}&count=1&detailInfoType=class"
     RECLAIM_ZERO_PAGES = "v1/objects/ldevs/{}/actions/discard-zero-page/invoke"
@@ -480,6 +483,10 @@ class AutomationConstants(object):
     LDEV_ID_MAX = 65279
     LDEV_ID_MAX_FULL = 65535
     LDEV_MAX_NUMBER = 16384
+    LDEV_PAGE_SIZE = 1000
+    LDEV_PAGE_ATTEMPTS = 3
+    # LDEV IDs at most this far apart are read with one range query
+    LDEV_BATCH_MAX_GAP = 64
     LDEV_MAX_MU_NUMBER = 1023
     ISCSI_NAME_LEN_MIN = 1
     ISCSI_NAME_LEN_MAX = 32
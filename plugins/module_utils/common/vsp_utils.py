@@ -367,10 +367,33 @@ class VSPParametersManager:
         return input_spec
 
     def set_volume_spec(self):
+        if self.params.get("spec") is None:
+            raise ValueError(VSPVolValidationMsg.SPEC_OR_VOLUMES_REQD.value)
         input_spec = CreateVolumeSpec(**self.params["spec"])
         VSPSpecValidators().validate_volume_spec(self.get_state(), input_spec)
         return input_spec
 
+    def set_volume_specs(self):
+        """Returns a (state, spec) tuple per item of the volumes option."""
+        if (self.params.get("spec") is None) == (self.params.get("volumes") is None):
+            raise ValueError(VSPVolValidationMsg.SPEC_OR_VOLUMES_REQD.value)
+        items = []
+        ldev_ids = set()
+        for volume in self.params["volumes"]:
+            state = volume.get("state") or self.get_state()
+            input_spec = CreateVolumeSpec(**volume["spec"])
+            VSPSpecValidators().validate_volume_spec(state, input_spec)
+            if input_spec.ldev_id is not None:
+                if input_spec.ldev_id in ldev_ids:
+                    raise ValueError(
+                        VSPVolValidationMsg.DUPLICATE_LDEV_IN_VOLUMES.value.format(
+                            input_spec.ldev_id
+                        )
+                    )
+                ldev_ids.add(input_spec.ldev_id)
+            items.append((state, input_spec))
+        return items
+
     def get_host_group_spec(self):
         if "spec" in self.params and self.params["spec"] is not None:
             input_spec = GetHostGroupSpec(**self.params["spec"])
@@ -1413,8 +1436,27 @@ class VSPVolumeArguments:
             },
         }
 
-        cls.common_arguments["spec"]["options"] = spec_options
-        return cls.common_arguments
+        args = copy.deepcopy(cls.common_arguments)
+        args["spec"]["options"] = spec_options
+        args["spec"]["required"] = False
+        args["volumes"] = {
+            "required": False,
+            "type": "list",
+            "elements": "dict",
+            "options": {
+                "spec": {
+                    "required": True,
+                    "type": "dict",
+                    "options": spec_options,
+                },
+                "state": {
+                    "required": False,
+                    "type": "str",
+                    "choices": ["present", "absent", "assign_virtual_ldev"],
+                },
+            },
+        }
+        return args
 
 
 class VSPHostGroupArguments:
@@ -4843,6 +4885,11 @@ class VSPResourceGroupLockArguments:
                 "required": False,
                 "type": "int",
             },
+            "refresh_storage_cache": {
+                "required": False,
+                "type": "bool",
+                "default": False,
+            },
             # "name": {
             #     "required": False,
             #     "type": "str",
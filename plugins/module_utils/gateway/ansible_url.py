@@ -1,11 +1,16 @@
+import atexit
+import contextvars
 import fcntl
+import functools
+import queue
+import sys
 import uuid
 import json
 import re
 import os
 import time
-import inspect
-from ansible.module_utils.urls import open_url as open_request
+from contextlib import contextmanager
+from ansible.module_utils.urls import open_url as ansible_open_url
 from datetime import datetime
 import threading
 
@@ -20,10 +25,12 @@ try:
         CONSENT_FILE_NAME,
         APIG_URL,
         ENABLE_AUDIT_LOG,
+        TELEMETRY_BATCH_MODE,
     )
     from ..common.uaig_constants import Endpoints as UAIGEndpoints
     from ..model.common_base_models import APIGRequestModel
     from ..common.hv_constants import IGNORED_APIS
+    from .http_connection_pool import open_url as open_request
 except ImportError:
     from common.hv_log import Log
     from common.vsp_constants import Endpoints
@@ -35,12 +42,15 @@ except ImportError:
         CONSENT_FILE_NAME,
         APIG_URL,
         ENABLE_AUDIT_LOG,
+        TELEMETRY_BATCH_MODE,
     )
     from common.uaig_constants import Endpoints as UAIGEndpoints
     from model.common_base_models import APIGRequestModel
     from common.hv_constants import IGNORED_APIS
+    from gateway.http_connection_pool import open_url as open_request
 
 MODEL_INFO = None
+MODULE_NAME = None
 
 AWS_UPDATE_THREADS = []
 AUDIT_THREADS = []
@@ -50,6 +60,37 @@ SITE_ID = "common_site_id"
 
 logger = Log()
 
+# (connection manager class, gateway method) of the requests in flight, set
+# by the connection manager methods the gateways call, see telemetry_entry
+TELEMETRY_CALLER = contextvars.ContextVar("hv_telemetry_caller", default=None)
+
+
+@contextmanager
+def telemetry_caller(class_name, gateway_method):
+    """Attributes the requests sent inside the block to gateway_method."""
+    token = TELEMETRY_CALLER.set((class_name, gateway_method))
+    try:
+        yield
+    finally:
+        TELEMETRY_CALLER.reset(token)
+
+
+def telemetry_entry(func):
+    """
+    Decorates the connection manager methods the gateways call. The outermost
+    call records the connection manager class and the function that called
+    it, the requests of nested calls are attributed to that function too.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if TELEMETRY_CALLER.get() is not None:
+            return func(self, *args, **kwargs)
+        with telemetry_caller(type(self).__name__, sys._getframe(1).f_code.co_name):
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
 
 def open_url(*args, **kwargs):
 
@@ -103,12 +144,21 @@ class OpenUrlWithTelemetry:
                     return match.group(1)
         return None
 
-    def _dig_calling_class(self, stack):
-        for i in range(6):
-            class_name = type(stack[i].frame.f_locals.get("self", None)).__name__
-            if class_name in self.class_map.keys():
-                return class_name
-        return "CommonConnectionManager"
+    def _resolve_module_name(self):
+        """
+        The calling Ansible module does not change within a process, so the
+        stack is only searched until it is found once.
+        """
+        global MODULE_NAME
+        if MODULE_NAME is None:
+            file_names = []
+            frame = sys._getframe()
+            while frame is not None:
+                file_names.append(frame.f_code.co_filename)
+                frame = frame.f_back
+            del frame
+            MODULE_NAME = self._extract_module_name(file_names)
+        return MODULE_NAME
 
     def open(self, *args, **kwargs):
         """
@@ -124,32 +174,17 @@ class OpenUrlWithTelemetry:
         success = True
         exception_message = Exception()
 
-        # Backtrack calling context
-        stack = inspect.stack()
-        file_names = [stack.filename for stack in stack]
-        module_name = self._extract_module_name(file_names)
-        is_old_module = any("hv_http_client.py" in filename for filename in file_names)
-
-        try:
-            gateway_method = stack[6].function
+        module_name = self._resolve_module_name()
+        class_name, gateway_method = TELEMETRY_CALLER.get() or (
+            "CommonConnectionManager",
+            "Unknown",
+        )
+        if class_name == "HTTPClient":
+            task_type, storage_list_name = "gatewayTasks", "gatewayStorageSystems"
+        else:
+            task_type = self.class_map.get(class_name, "unknown")
+            storage_list_name = self.storage_map.get(class_name, "unknown")
 
-            class_name = self._dig_calling_class(stack)
-            task_type = (
-                self.class_map.get(class_name, "unknown")
-                if not is_old_module
-                else "gatewayTasks"
-            )
-            storage_list_name = (
-                self.storage_map.get(class_name, "unknown")
-                if not is_old_module
-                else "gatewayStorageSystems"
-            )
-        except Exception:
-            task_type, gateway_method, storage_list_name = (
-                "Unknown",
-                "Unknown",
-                "Unknown",
-            )
         # Attempt to call    `open_url`
         try:
             result = open_request(*args, **kwargs)
@@ -161,93 +196,185 @@ class OpenUrlWithTelemetry:
         end_time = time.time()
         elapsed_time = float(f"{end_time - start_time:.2f}")
 
+        if gateway_method in self.skip_methods:
+            return result
+
+        if TELEMETRY_BATCH_MODE:
+            self._track_batched(
+                module_name,
+                gateway_method,
+                task_type,
+                storage_list_name,
+                success,
+                elapsed_time,
+                result,
+                args,
+                kwargs,
+            )
+        else:
+            self._track(
+                module_name,
+                gateway_method,
+                task_type,
+                storage_list_name,
+                success,
+                elapsed_time,
+                result,
+                args,
+                kwargs,
+            )
+        if not success:
+            # Exception(f"open_url failed: {exception_message}")
+            raise exception_message
+
+        return result
+
+    def _build_apig_request(
+        self,
+        module_name,
+        gateway_method,
+        task_type,
+        storage_list_name,
+        success,
+        elapsed_time,
+    ):
+        return APIGRequestModel(
+            module_name=module_name,
+            operation_name=gateway_method,
+            storage_model=MODEL_INFO.get("model", ""),
+            storage_serial=int(MODEL_INFO.get("serialNumber", None)),
+            storage_type=(0 if storage_list_name == "sdsBlockStorageSystems" else 1),
+            connection_type=1 if task_type == "directConnectTasks" else 0,
+            operation_status=1 if success else 0,
+            process_time=elapsed_time,
+        )
+
+    def _track(
+        self,
+        module_name,
+        gateway_method,
+        task_type,
+        storage_list_name,
+        success,
+        elapsed_time,
+        result,
+        args,
+        kwargs,
+    ):
+        """
+        Updates usages.json and starts the APIG and audit log threads for a single call.
+        """
         # Update tracking data
         self._load_existing_data()
         if task_type not in self.data:
             self.data[task_type] = {}
-        if gateway_method not in self.skip_methods:
-            task_key_name = f"{module_name}.{gateway_method}"
-            if task_key_name not in self.data[task_type]:
-                self.data[task_type][task_key_name] = {
-                    "success": 0,
-                    "failure": 0,
-                    "averageTimeInSec": 0,
-                }
-
-            method_data = self.data[task_type][task_key_name]
-
-            if success:
-                method_data["success"] += 1
-            else:
-                method_data["failure"] += 1
+        task_key_name = f"{module_name}.{gateway_method}"
+        if task_key_name not in self.data[task_type]:
+            self.data[task_type][task_key_name] = {
+                "success": 0,
+                "failure": 0,
+                "averageTimeInSec": 0,
+            }
+
+        method_data = self.data[task_type][task_key_name]
+
+        if success:
+            method_data["success"] += 1
+        else:
+            method_data["failure"] += 1
 
-            if not MODEL_INFO:
-                model_details = self._fetch_storage_info(
-                    storage_list_name, *args, **kwargs
-                )
+        if not MODEL_INFO:
+            model_details = self._fetch_storage_info(storage_list_name, *args, **kwargs)
 
-                try:
-                    if model_details and model_details not in self.data.get(
-                        storage_list_name, []
-                    ):
-                        if isinstance(self.data.get(storage_list_name), list):
-                            self.data[storage_list_name].append(model_details)
-                        else:  # If the data is not a list, create a new list with the model details
-                            self.data[storage_list_name] = [model_details]
-                except Exception as e:
-                    self.log.writeDebug(
-                        f"Error fetching storage info in the telemetry: {e}"
-                    )
-                    pass
             try:
-                total_calls = method_data["success"] + method_data["failure"]
-                method_data["averageTimeInSec"] = round(
-                    (
-                        (method_data["averageTimeInSec"] * (total_calls - 1))
-                        + elapsed_time
-                    )
-                    / total_calls,
-                    2,
-                )
-            except ZeroDivisionError:
-                method_data["averageTimeInSec"] = 0
-
-            if MODEL_INFO:
-                apig_request = APIGRequestModel(
-                    module_name=module_name,
-                    operation_name=gateway_method,
-                    storage_model=MODEL_INFO.get("model", ""),
-                    storage_serial=int(MODEL_INFO.get("serialNumber", None)),
-                    storage_type=(
-                        0 if storage_list_name == "sdsBlockStorageSystems" else 1
-                    ),
-                    connection_type=1 if task_type == "directConnectTasks" else 0,
-                    operation_status=1 if success else 0,
-                    process_time=elapsed_time,
-                )
-                # will update the threading part later
-                thread = threading.Thread(target=process_request, args=(apig_request,))
-                AWS_UPDATE_THREADS.append(thread)
-                # thread.daemon = True
-                thread.start()
-                # Write updated data to file
-                self._write_to_file()
-
-            if ENABLE_AUDIT_LOG:
-                # write_to_audit_log(url=url, kwargs=kwargs)
-                audit_thread = threading.Thread(
-                    target=write_to_audit_log, args=(url, kwargs, result)
+                if model_details and model_details not in self.data.get(
+                    storage_list_name, []
+                ):
+                    if isinstance(self.data.get(storage_list_name), list):
+                        self.data[storage_list_name].append(model_details)
+                    else:  # If the data is not a list, create a new list with the model details
+                        self.data[storage_list_name] = [model_details]
+            except Exception as e:
+                self.log.writeDebug(
+                    f"Error fetching storage info in the telemetry: {e}"
                 )
-                AUDIT_THREADS.append(audit_thread)
-                audit_thread.daemon = True
-                audit_thread.start()
-            if not success:
-                # Exception(f"open_url failed: {exception_message}")
-                raise exception_message
+                pass
+        try:
+            total_calls = method_data["success"] + method_data["failure"]
+            method_data["averageTimeInSec"] = round(
+                ((method_data["averageTimeInSec"] * (total_calls - 1)) + elapsed_time)
+                / total_calls,
+                2,
+            )
+        except ZeroDivisionError:
+            method_data["averageTimeInSec"] = 0
+
+        if MODEL_INFO:
+            apig_request = self._build_apig_request(
+                module_name,
+                gateway_method,
+                task_type,
+                storage_list_name,
+                success,
+                elapsed_time,
+            )
+            # will update the threading part later
+            thread = threading.Thread(target=process_request, args=(apig_request,))
+            AWS_UPDATE_THREADS.append(thread)
+            # thread.daemon = True
+            thread.start()
+            # Write updated data to file
+            self._write_to_file()
+
+        if ENABLE_AUDIT_LOG:
+            # write_to_audit_log(url=url, kwargs=kwargs)
+            audit_thread = threading.Thread(
+                target=write_to_audit_log, args=(kwargs.get("url", ""), kwargs, result)
+            )
+            AUDIT_THREADS.append(audit_thread)
+            audit_thread.daemon = True
+            audit_thread.start()
+
+    def _track_batched(
+        self,
+        module_name,
+        gateway_method,
+        task_type,
+        storage_list_name,
+        success,
+        elapsed_time,
+        result,
+        args,
+        kwargs,
+    ):
+        """
+        Records the call in memory, TelemetryBatch writes usages.json once at exit.
+        """
+        batch = TelemetryBatch.get_instance()
+        batch.record(
+            task_type, f"{module_name}.{gateway_method}", success, elapsed_time
+        )
 
-            return result
-        else:
-            return result
+        if not MODEL_INFO:
+            model_details = self._fetch_storage_info(storage_list_name, *args, **kwargs)
+            if model_details:
+                batch.add_storage(storage_list_name, model_details)
+
+        if MODEL_INFO:
+            batch.submit(
+                process_request,
+                self._build_apig_request(
+                    module_name,
+                    gateway_method,
+                    task_type,
+                    storage_list_name,
+                    success,
+                    elapsed_time,
+                ),
+            )
+
+        if ENABLE_AUDIT_LOG:
+            batch.submit(write_to_audit_log, kwargs.get("url", ""), kwargs, result)
 
     def _fetch_storage_info(self, storage_type, *args, **kwargs):
         """
@@ -421,6 +548,132 @@ class OpenUrlWithTelemetry:
             )
 
 
+class TelemetryBatch:
+    """
+    In-memory usage counters for HV_TELEMETRY_BATCH_MODE.
+
+    Counters are merged into usages.json once at process exit, and the APIG
+    posts and audit log entries are handed to a single writer thread instead
+    of a new thread per request.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.usage = {}
+        self.storage = {}
+        self.queue = queue.Queue()
+        self.worker = None
+        atexit.register(self.flush)
+
+    def record(self, task_type, task_key_name, success, elapsed_time):
+        with self.lock:
+            method_data = self.usage.setdefault(task_type, {}).setdefault(
+                task_key_name, {"success": 0, "failure": 0, "totalTimeInSec": 0.0}
+            )
+            method_data["success" if success else "failure"] += 1
+            method_data["totalTimeInSec"] += elapsed_time
+
+    def add_storage(self, storage_list_name, model_details):
+        with self.lock:
+            details = self.storage.setdefault(storage_list_name, [])
+            if model_details not in details:
+                details.append(model_details)
+
+    def submit(self, func, *args):
+        with self.lock:
+            if self.worker is None:
+                self.worker = threading.Thread(target=self._run, daemon=True)
+                self.worker.start()
+        self.queue.put((func, args))
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            func, args = item
+            try:
+                func(*args)
+            except Exception as e:
+                logger.writeDebug(f"TelemetryBatch writer error: {e}")
+
+    def flush(self):
+        if self.worker is not None:
+            self.queue.put(None)
+            self.worker.join(timeout=60)
+        with self.lock:
+            usage, self.usage = self.usage, {}
+            storage, self.storage = self.storage, {}
+        if not MODEL_INFO or not (usage or storage):
+            return
+        self._merge_into_file(usage, storage)
+
+    def _merge_into_file(self, usage, storage):
+        telemetry = OpenUrlWithTelemetry()
+        output_file = telemetry.output_file
+        lock_file = f"{output_file}.lock"
+        temp_file = f"{output_file}.hidden.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(os.path.dirname(output_file), exist_ok=True)
+            # Hold the lock across read, merge and replace so concurrent
+            # tasks flushing at the same time do not lose each other's counts
+            with open(lock_file, "w") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                try:
+                    telemetry._load_existing_data()
+                    data = telemetry.data
+                    for task_type, methods in usage.items():
+                        task_data = data.setdefault(task_type, {})
+                        for task_key_name, counts in methods.items():
+                            method_data = task_data.setdefault(
+                                task_key_name,
+                                {"success": 0, "failure": 0, "averageTimeInSec": 0},
+                            )
+                            old_calls = method_data["success"] + method_data["failure"]
+                            new_calls = counts["success"] + counts["failure"]
+                            method_data["success"] += counts["success"]
+                            method_data["failure"] += counts["failure"]
+                            method_data["averageTimeInSec"] = round(
+                                (
+                                    method_data["averageTimeInSec"] * old_calls
+                                    + counts["totalTimeInSec"]
+                                )
+                                / (old_calls + new_calls),
+                                2,
+                            )
+                    for storage_list_name, details in storage.items():
+                        if not isinstance(data.get(storage_list_name), list):
+                            data[storage_list_name] = []
+                        for model_details in details:
+                            if model_details not in data[storage_list_name]:
+                                data[storage_list_name].append(model_details)
+
+                    with open(temp_file, "w") as file:
+                        json.dump(data, file, indent=4)
+                    os.replace(temp_file, output_file)
+                finally:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+        except Exception as e:
+            logger.writeDebug(f"Error writing to file {output_file}: {e}")
+        finally:
+            try:
+                if os.path.exists(temp_file):
+                    os.remove(temp_file)
+            except Exception:
+                pass
+
+
 def process_request(apig_body):
     log = Log()
     # Set the site_id for the request
@@ -435,7 +688,7 @@ def process_request(apig_body):
         # log.writeDebug(f"Processing request body {body}")
 
         # Make a request using open_url from Ansible module
-        response = open_request(
+        response = ansible_open_url(
             url=APIG_URL,
             method="POST",
             data=body,
@@ -3,20 +3,43 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from abc import ABC, abstractmethod
+import contextvars
+import hashlib
+import http.client
 import json
 import time
 import urllib.error as urllib_error
 from ansible.module_utils.urls import socket
 
 import os
-import mimetypes
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from ..common.ansible_common import mask_token
     from ..common.hv_api_constants import API
     from ..common.hv_log import Log
     from ..common.vsp_constants import Endpoints
-    from .ansible_url import open_url
+    from ..common.hv_retry_policy import DEFAULT_RETRY_POLICY
+    from ..common.hv_job_waiter import JobWaiter, JobTimeoutError
+    from ..common.hv_get_cache import GetCache
+    from ..common.ansible_common_constants import (
+        MAX_WORKER_THREADS,
+        SDSB_PAGE_SIZE,
+        DOWNLOAD_CHUNK_SIZE,
+        DOWNLOAD_ATTEMPTS,
+        JOB_WAIT_TIMEOUT,
+        PEGASUS_JOB_WAIT_TIMEOUT,
+        JOB_RUNNING_STATE_TIMEOUT,
+        ENABLE_GET_CACHE,
+    )
+    from .ansible_url import (
+        TELEMETRY_CALLER,
+        open_url,
+        telemetry_caller,
+        telemetry_entry,
+    )
+    from .multipart_encoder import MultipartEncoder
     from .vsp_session_manager import SessionManager
     from ..model.common_base_models import ConnectionInfo
 except ImportError:
@@ -24,7 +47,26 @@ except ImportError:
     from common.hv_api_constants import API
     from common.hv_log import Log
     from common.vsp_constants import Endpoints
-    from .ansible_url import open_url
+    from common.hv_retry_policy import DEFAULT_RETRY_POLICY
+    from common.hv_job_waiter import JobWaiter, JobTimeoutError
+    from common.hv_get_cache import GetCache
+    from common.ansible_common_constants import (
+        MAX_WORKER_THREADS,
+        SDSB_PAGE_SIZE,
+        DOWNLOAD_CHUNK_SIZE,
+        DOWNLOAD_ATTEMPTS,
+        JOB_WAIT_TIMEOUT,
+        PEGASUS_JOB_WAIT_TIMEOUT,
+        JOB_RUNNING_STATE_TIMEOUT,
+        ENABLE_GET_CACHE,
+    )
+    from .ansible_url import (
+        TELEMETRY_CALLER,
+        open_url,
+        telemetry_caller,
+        telemetry_entry,
+    )
+    from .multipart_encoder import MultipartEncoder
     from .vsp_session_manager import SessionManager
     from model.common_base_models import ConnectionInfo
 
@@ -40,7 +82,8 @@ class SessionObject:
 
 
 class ConnectionManager(ABC):
-    retryCount = 0
+    retry_policy = DEFAULT_RETRY_POLICY
+    job_waiter = JobWaiter(JOB_WAIT_TIMEOUT)
     server_busy_msg = "The server might be temporarily busy"
 
     def __init__(self, address, username=None, password=None, token=None):
@@ -128,65 +171,68 @@ class ConnectionManager(ABC):
 
         MAX_TIME_OUT = 300
 
-        try:
-            response = open_url(
-                url=url,
-                method=method,
-                headers=headers,
-                data=data,
-                use_proxy=False,
-                timeout=MAX_TIME_OUT,
-                url_username=self.username,
-                url_password=self.password,
-                force_basic_auth=True,
-                validate_certs=False,
-            )
-        except socket.timeout as t_err:
-            logger.writeError(f"ConnectionManager._make_request - TimeoutError {t_err}")
-            raise Exception(t_err)
-        except urllib_error.HTTPError as err:
-            logger.writeError(f"ConnectionManager._make_request - HTTPError {err}")
-
-            if err.code == 503:
-                # 503 Service Unavailable
-                # wait for 5 mins and try to re-authenticate, we will retry 5 times
-                if self.retryCount < 5:
-                    logger.writeDebug(
-                        f"{self.server_busy_msg}, wait for 5 mins and try to generate session token again."
-                    )
-                    time.sleep(300)
-                    self.retryCount += 1
-                    return self._make_request(method, end_point, data)
-
-            if hasattr(err, "read"):
-                error_resp = json.loads(err.read().decode())
-                logger.writeDebug(
-                    f"ConnectionManager.error_resp - error_resp {error_resp}"
+        retry_budget = self.retry_policy.new_budget()
+        while True:
+            try:
+                response = open_url(
+                    url=url,
+                    method=method,
+                    headers=headers,
+                    data=data,
+                    use_proxy=False,
+                    timeout=MAX_TIME_OUT,
+                    url_username=self.username,
+                    url_password=self.password,
+                    force_basic_auth=True,
+                    validate_certs=False,
                 )
-                error_dtls = (
-                    error_resp.get("message")
-                    if error_resp.get("message")
-                    else error_resp.get("errorMessage")
+                break
+            except socket.timeout as t_err:
+                logger.writeError(
+                    f"ConnectionManager._make_request - TimeoutError {t_err}"
                 )
-                if error_resp.get("cause"):
-                    error_dtls = error_dtls + " " + error_resp.get("cause")
-
-                if error_resp.get("solution"):
-                    error_dtls = error_dtls + " " + error_resp.get("solution")
-
-                raise Exception(error_dtls)
-            # if err.code == 400:
-            #     error_resp = json.loads(err.read().decode())
-            #     logger.writeDebug(
-            #         f"ConnectionManager.error_resp - error_resp {error_resp}"
-            #     )
-            #     raise Exception(error_resp)
-            else:
-                raise Exception(err)
-        except Exception as err:
-            logger.writeException(err)
-            logger.writeDebug("Failed err: {}", err)
-            raise err
+                raise Exception(t_err)
+            except urllib_error.HTTPError as err:
+                logger.writeError(f"ConnectionManager._make_request - HTTPError {err}")
+
+                if err.code == 503:
+                    # 503 Service Unavailable
+                    # back off and retry within the budget of this request
+                    if retry_budget.wait(err):
+                        logger.writeDebug(
+                            f"{self.server_busy_msg}, retry {retry_budget.attempt} after waiting {retry_budget.waited:.1f}s."
+                        )
+                        continue
+
+                if hasattr(err, "read"):
+                    error_resp = json.loads(err.read().decode())
+                    logger.writeDebug(
+                        f"ConnectionManager.error_resp - error_resp {error_resp}"
+                    )
+                    error_dtls = (
+                        error_resp.get("message")
+                        if error_resp.get("message")
+                        else error_resp.get("errorMessage")
+                    )
+                    if error_resp.get("cause"):
+                        error_dtls = error_dtls + " " + error_resp.get("cause")
+
+                    if error_resp.get("solution"):
+                        error_dtls = error_dtls + " " + error_resp.get("solution")
+
+                    raise Exception(error_dtls)
+                # if err.code == 400:
+                #     error_resp = json.loads(err.read().decode())
+                #     logger.writeDebug(
+                #         f"ConnectionManager.error_resp - error_resp {error_resp}"
+                #     )
+                #     raise Exception(error_resp)
+                else:
+                    raise Exception(err)
+            except Exception as err:
+                logger.writeException(err)
+                logger.writeDebug("Failed err: {}", err)
+                raise err
 
         if response.status not in (200, 201, 202, 204):
             error_msg = json.loads(response.read())
@@ -199,45 +245,133 @@ class ConnectionManager(ABC):
             return response.read()
         return self._load_response(response, download)
 
+    @telemetry_entry
     def create(self, endpoint, data):
         return self._make_request(method="POST", end_point=endpoint, data=data)
 
-    def _process_job(self, job_id):
-        response = None
-        retryCount = 0
-        while response is None and retryCount < 600:
-            job_response = self.get_job(job_id)
-            logger.writeDebug("_process_job: job_response = {}", job_response)
-            job_status = job_response[API.STATUS]
-            job_state = job_response[API.STATE]
-            response = None
-            if job_status == API.COMPLETED:
-                if job_state == API.SUCCEEDED:
-                    # For POST call to add chap user to port, affected resource is empty
-                    # For PATCH port-auth-settings, affected resource is empty
-                    if (
-                        job_response[API.AFFECTED_RESOURCES]
-                        and len(job_response[API.AFFECTED_RESOURCES]) > 0
-                    ):
-                        response = job_response[API.AFFECTED_RESOURCES][0]
-                    else:
-                        response = job_response["self"]
-                else:
-                    raise Exception(self.job_exception_text(job_response))
-            else:
-                retryCount = retryCount + 1
-                time.sleep(retryCount * 1)
+    def _job_result(self, job_id):
+        """Returns the affected resource of a finished job, None while it is running."""
+        job_response = self.get_job(job_id)
+        logger.writeDebug("_process_job: job_response = {}", job_response)
+        job_status = job_response[API.STATUS]
+        job_state = job_response[API.STATE]
+        if job_status != API.COMPLETED:
+            return None
+        if job_state != API.SUCCEEDED:
+            raise Exception(self.job_exception_text(job_response))
+        # For POST call to add chap user to port, affected resource is empty
+        # For PATCH port-auth-settings, affected resource is empty
+        if (
+            job_response[API.AFFECTED_RESOURCES]
+            and len(job_response[API.AFFECTED_RESOURCES]) > 0
+        ):
+            return job_response[API.AFFECTED_RESOURCES][0]
+        return job_response["self"]
 
-        if response is None:
-            raise Exception(
-                "Timeout Error! The tasks was not completed in 3005 minutes"
-            )
+    def _process_job(self, job_id):
+        response = self.job_waiter.wait(lambda: self._job_result(job_id))
 
         resourceId = response.split("/")[-1]
         logger.writeDebug("response = {}", response)
         logger.writeDebug("resourceId = {}", resourceId)
         return resourceId
 
+    def _process_jobs(self, job_ids):
+        """
+        Waits for several jobs together, returns a (resourceId, error) tuple
+        per job in the order of job_ids.
+        """
+        probes = [lambda job_id=job_id: self._job_result(job_id) for job_id in job_ids]
+        results = self._wait_all_concurrently(self.job_waiter, probes, "Jobs")
+        return [
+            (response.split("/")[-1] if response is not None else None, error)
+            for response, error in results
+        ]
+
+    @staticmethod
+    def _wait_all_concurrently(waiter, probes, thread_name_prefix):
+        """Waits for all probes, the outstanding ones are probed concurrently."""
+        if not probes:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_WORKER_THREADS, len(probes)),
+            thread_name_prefix=thread_name_prefix,
+        ) as executor:
+
+            def probe_many(indexes):
+                futures = {index: executor.submit(probes[index]) for index in indexes}
+                finished = {}
+                for index, future in futures.items():
+                    try:
+                        finished[index] = future.result()
+                    except Exception as e:
+                        finished[index] = e
+                return finished
+
+            return waiter.wait_all(probes, probe_many=probe_many)
+
+    @telemetry_entry
+    def run_jobs(self, items, send, stop_on_error=False, max_in_flight=None):
+        """
+        Calls send(item) for every item with at most max_in_flight requests in
+        flight, then waits for all the jobs they started together.
+
+        send sends one request without waiting for its job and returns the
+        response. Returns a (result, error) tuple per item in the order of
+        items, result being the resourceId of the job or the response of a
+        request that started none. With stop_on_error the items are sent in
+        windows of max_in_flight items in order, each window after the jobs
+        of the previous one finished, and no window is sent after one with a
+        failed request or job. The items that were not sent get None instead
+        of a tuple.
+        """
+        results = [None] * len(items)
+        if not items:
+            return results
+        window = max_in_flight or MAX_WORKER_THREADS
+        if not stop_on_error:
+            self._run_job_window(items, range(len(items)), send, results, window)
+            return results
+
+        for start in range(0, len(items), window):
+            indexes = range(start, min(start + window, len(items)))
+            self._run_job_window(items, indexes, send, results, window)
+            if any(results[index][1] is not None for index in indexes):
+                break
+        return results
+
+    def _run_job_window(self, items, indexes, send, results, max_in_flight):
+
+        def send_one(index):
+            try:
+                results[index] = (send(items[index]), None)
+            except Exception as e:
+                results[index] = (None, e)
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_in_flight, len(indexes)),
+            thread_name_prefix="RunJobs",
+        ) as executor:
+            # the requests are still attributed to the caller of run_jobs
+            futures = [
+                executor.submit(contextvars.copy_context().run, send_one, index)
+                for index in indexes
+            ]
+            for future in futures:
+                future.result()
+
+        job_indexes = [
+            index
+            for index in indexes
+            if isinstance(results[index][0], dict) and API.JOB_ID in results[index][0]
+        ]
+        job_results = self._process_jobs(
+            [results[index][0][API.JOB_ID] for index in job_indexes]
+        )
+        for index, result in zip(job_indexes, job_results):
+            results[index] = result
+
+    @telemetry_entry
     def post(self, endpoint, data, headers_input=None, long_running=None):
 
         post_response = self._make_request(
@@ -252,6 +386,7 @@ class ConnectionManager(ABC):
         else:
             return self._process_job_till_running_state(job_id)
 
+    @telemetry_entry
     def post_wo_job(self, endpoint, data, headers_input=None):
 
         post_response = self._make_request(
@@ -260,6 +395,7 @@ class ConnectionManager(ABC):
         logger.writeDebug("post_response = {}", post_response)
         return post_response
 
+    @telemetry_entry
     def patch(self, endpoint, data):
         patch_response = self._make_request(
             method="PATCH", end_point=endpoint, data=data
@@ -295,17 +431,21 @@ class ConnectionManager(ABC):
 
         return result_text
 
+    @telemetry_entry
     def read(self, endpoint):
         return self._make_request("GET", endpoint)
 
+    @telemetry_entry
     def get(self, endpoint):
         return self._make_request("GET", endpoint)
 
+    @telemetry_entry
     def update(self, endpoint, data):
         put_response = self._make_request(method="PUT", end_point=endpoint, data=data)
         job_id = put_response[API.JOB_ID]
         return self._process_job(job_id)
 
+    @telemetry_entry
     def delete(self, endpoint, data=None):
         delete_response = self._make_request(
             method="DELETE", end_point=endpoint, data=data
@@ -327,33 +467,231 @@ class SDSBConnectionManager(ConnectionManager):
         end_point = "v1/objects/jobs/" + job_id
         return self._make_request("GET", end_point)
 
+    @telemetry_entry
     def download_file(self, endpoint):
         return self._make_request("GET", endpoint, download=True)
 
+    @telemetry_entry
     def download_file_header(self, endpoint, header):
         return self._make_request("GET", endpoint, download=True, headers_input=header)
 
-    def _process_job_till_running_state(self, job_id):
-        retry_count = 0
+    @staticmethod
+    def _http_error_text(err):
+        try:
+            error_resp = json.loads(err.read().decode())
+        except Exception:
+            return str(err)
+        error_dtls = error_resp.get("message") or error_resp.get("errorMessage")
+        for key in ("cause", "solution"):
+            if error_resp.get(key):
+                error_dtls = f"{error_dtls} {error_resp.get(key)}"
+        return error_dtls
+
+    def _open_download(self, url, headers):
+        retry_budget = self.retry_policy.new_budget()
+        while True:
+            try:
+                return open_url(
+                    url=url,
+                    method="GET",
+                    headers=headers,
+                    use_proxy=False,
+                    timeout=300,
+                    url_username=self.username,
+                    url_password=self.password,
+                    force_basic_auth=True,
+                    validate_certs=False,
+                    stream=True,
+                )
+            except urllib_error.HTTPError as err:
+                logger.writeError(f"SDSBConnectionManager._open_download - {err}")
+                if err.code == 503 and retry_budget.wait(err):
+                    logger.writeDebug(
+                        f"{self.server_busy_msg}, retry {retry_budget.attempt} after waiting {retry_budget.waited:.1f}s."
+                    )
+                    continue
+                raise Exception(self._http_error_text(err))
 
-        time.sleep(5)
-        while retry_count < 600:
-            job_response = self.get_job(job_id)
-            logger.writeDebug(
-                "_process_job_till_running_state: job_response = {}", job_response
-            )
-            job_status = job_response[API.STATUS]
-            job_state = job_response[API.STATE]
+    @telemetry_entry
+    def download_to_file(
+        self,
+        end_point,
+        file_path,
+        sha256=None,
+        chunk_size=DOWNLOAD_CHUNK_SIZE,
+        attempts=DOWNLOAD_ATTEMPTS,
+    ):
+        """
+        Copies the body of end_point to file_path chunk_size bytes at a time,
+        so memory use does not grow with the file size. A transfer broken off
+        is resumed with a Range request when the storage system accepts byte
+        ranges, otherwise it starts over, at most attempts times. The data is
+        written to file_path.part and only moved to file_path once complete
+        and, if sha256 is given, once its SHA-256 digest matches. Returns the
+        SHA-256 hex digest of the file.
+        """
+        url = self.base_url + "/" + end_point
+        part_path = file_path + ".part"
+        logger.writeDebug("download url = {} file = {}", url, file_path)
+
+        try:
+            with open(part_path, "wb") as file:
+                digest = hashlib.sha256()
+                written = 0
+                resumable = False
+                for attempt in range(1, attempts + 1):
+                    headers = {"Content-Length": 0}
+                    if written and resumable:
+                        headers["Range"] = f"bytes={written}-"
+                    else:
+                        file.seek(0)
+                        file.truncate()
+                        digest = hashlib.sha256()
+                        written = 0
+                    response = self._open_download(url, headers)
+                    try:
+                        if written and response.status != 206:
+                            # the range was ignored, the body starts over
+                            file.seek(0)
+                            file.truncate()
+                            digest = hashlib.sha256()
+                            written = 0
+                        accept_ranges = response.headers.get("Accept-Ranges") or ""
+                        resumable = resumable or accept_ranges.lower() == "bytes"
+                        for chunk in iter(lambda: response.read(chunk_size), b""):
+                            file.write(chunk)
+                            digest.update(chunk)
+                            written += len(chunk)
+                        break
+                    except (OSError, http.client.HTTPException) as err:
+                        if attempt == attempts:
+                            raise
+                        logger.writeDebug(
+                            "download interrupted after {} bytes, attempt {}: {}",
+                            written,
+                            attempt,
+                            err,
+                        )
+                    finally:
+                        response.close()
 
-            if job_status == API.RUNNING and job_state == API.STARTED:
-                return job_id
-            elif job_status == API.COMPLETED and job_state == API.FAILED:
+            checksum = digest.hexdigest()
+            if sha256 and checksum != sha256.lower():
                 raise ValueError(
-                    self.job_exception_text(job_response) + f" job_id : {job_id}"
+                    f"SHA-256 mismatch for {file_path}: expected {sha256}, got {checksum}"
                 )
+            os.replace(part_path, file_path)
+        except Exception:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+
+        logger.writeDebug(
+            "downloaded {} bytes to {} sha256 = {}", written, file_path, checksum
+        )
+        return checksum
+
+    @staticmethod
+    def with_query(end_point, params):
+        if not params:
+            return end_point
+        query = "&".join("{}={}".format(k, v) for k, v in params.items())
+        return end_point + ("&" if "?" in end_point else "?") + query
+
+    def iter_items(
+        self,
+        end_point,
+        params=None,
+        limit=None,
+        count_param="count",
+        next_page=None,
+        page_size=SDSB_PAGE_SIZE,
+    ):
+        """
+        Streams the items of an SDS Block list endpoint, stopping after limit
+        items. Without next_page a single request asking for limit items is
+        sent. With next_page the list is read in pages of page_size items,
+        next_page receives the last item of a full page and returns the query
+        parameters selecting the next one, or None when there is none.
+        Cursors may include their start item, items repeated from the
+        previous page are skipped and a page bringing nothing new ends the
+        iteration.
+        """
+        params = dict(params or {})
+        returned = 0
+        previous_ids = set()
+        # the pages are read while the caller iterates, outside any call
+        # telemetry_entry could attribute them to
+        caller = TELEMETRY_CALLER.get() or (
+            type(self).__name__,
+            sys._getframe(1).f_code.co_name,
+        )
+        while True:
+            if next_page is None:
+                count = limit
+            elif limit is None:
+                count = page_size
             else:
-                retry_count = retry_count + 1
-                time.sleep(1)
+                # leave room for the items repeated from the previous page
+                count = min(page_size, limit - returned + len(previous_ids))
+            if count is not None:
+                params[count_param] = count
+            with telemetry_caller(*caller):
+                response = self.get(self.with_query(end_point, params))
+            items = response.get("data") or []
+            logger.writeDebug(
+                "SDSBConnectionManager.iter_items: end_point={} params={} items={}",
+                end_point,
+                params,
+                len(items),
+            )
+
+            page_ids = set()
+            new_items = 0
+            for item in items:
+                item_id = item.get("id")
+                if item_id is not None:
+                    if item_id in previous_ids:
+                        continue
+                    page_ids.add(item_id)
+                new_items += 1
+                returned += 1
+                yield item
+                if limit is not None and returned >= limit:
+                    return
+
+            if next_page is None or new_items == 0 or len(items) < count:
+                return
+            cursor = next_page(items[-1])
+            if cursor is None:
+                return
+            params.update(cursor)
+            previous_ids = page_ids
+
+    running_state_waiter = JobWaiter(JOB_RUNNING_STATE_TIMEOUT)
+
+    def _job_running(self, job_id):
+        job_response = self.get_job(job_id)
+        logger.writeDebug(
+            "_process_job_till_running_state: job_response = {}", job_response
+        )
+        job_status = job_response[API.STATUS]
+        job_state = job_response[API.STATE]
+
+        if job_status == API.RUNNING and job_state == API.STARTED:
+            return job_id
+        elif job_status == API.COMPLETED and job_state == API.FAILED:
+            raise ValueError(
+                self.job_exception_text(job_response) + f" job_id : {job_id}"
+            )
+        return None
+
+    def _process_job_till_running_state(self, job_id):
+        try:
+            return self.running_state_waiter.wait(lambda: self._job_running(job_id))
+        except JobTimeoutError:
+            # the job did not reach the running state in time
+            return None
 
     def build_multipart_form_data(
         self,
@@ -362,55 +700,25 @@ class SDSBConnectionManager(ConnectionManager):
         exported_config_file=None,
         vm_configuration_file_s3_uri=None,
     ):
-        boundary = self.boundary.encode("utf-8")
-        body = bytearray()
-
-        def add_field(name, value):
-            body.extend(b"--" + boundary + b"\r\n")
-            body.extend(
-                f'Content-Disposition: form-data; name="{name}"\r\n\r\n'.encode("utf-8")
-            )
-            body.extend(value.encode("utf-8") if isinstance(value, str) else value)
-            body.extend(b"\r\n")
-
-        def add_file_field(field_name, file_path, file_content):
-            filename = os.path.basename(file_path)
-            content_type = (
-                mimetypes.guess_type(filename)[0] or "application/octet-stream"
-            )
-            body.extend(b"--" + boundary + b"\r\n")
-            body.extend(
-                f'Content-Disposition: form-data; name="{field_name}"; filename="{filename}"\r\n'.encode(
-                    "utf-8"
-                )
-            )
-            body.extend(f"Content-Type: {content_type}\r\n\r\n".encode("utf-8"))
-            body.extend(file_content)
-            body.extend(b"\r\n")
+        encoder = MultipartEncoder(boundary=self.boundary)
 
         # Add text field
         if setup_user_password:
-            add_field("setupUserPassword", setup_user_password)
+            encoder.add_field("setupUserPassword", setup_user_password)
 
         if vm_configuration_file_s3_uri:
-            add_field("vmConfigurationFileS3Uri", vm_configuration_file_s3_uri)
+            encoder.add_field("vmConfigurationFileS3Uri", vm_configuration_file_s3_uri)
 
-        # Add files
+        # Add files, they are read while the body is sent
         if csv_path:
-            with open(csv_path, "rb") as f:
-                add_file_field("configurationFile", csv_path, f.read())
+            encoder.add_file("configurationFile", csv_path)
 
         if exported_config_file:
-            with open(exported_config_file, "rb") as f2:
-                add_file_field(
-                    "exportedConfigurationFile", exported_config_file, f2.read()
-                )
-
-        # Final boundary
-        body.extend(b"--" + boundary + b"--\r\n")
+            encoder.add_file("exportedConfigurationFile", exported_config_file)
 
-        return bytes(body)
+        return encoder
 
+    @telemetry_entry
     def upload_file(
         self, end_point, file_to_upload, file_parameter_name, monitor_job=False
     ):
@@ -425,12 +733,10 @@ class SDSBConnectionManager(ConnectionManager):
                 self._process_job(job_id)
             return job_id
 
+    @telemetry_entry
     def upload_software_update_file(
         self, end_point, software_update_file, file_parameter_name=None
     ):
-        import os
-        import mimetypes
-        import http.client
         import ssl
         from urllib.parse import urlparse
 
@@ -440,29 +746,12 @@ class SDSBConnectionManager(ConnectionManager):
                 "Uploading software update file to URL = {}", url.geturl()
             )
 
-            boundary = "----WebKitFormBoundary7MA4YWxkTrZu0gW"
-            filename = os.path.basename(software_update_file)
-            content_type = (
-                mimetypes.guess_type(filename)[0] or "application/octet-stream"
-            )
             if file_parameter_name is None:
                 file_parameter_name = "softwareUpdateFile"
-
-            # Build multipart preamble and closing
-            preamble = (
-                f"--{boundary}\r\n"
-                f'Content-Disposition: form-data; name="{file_parameter_name}"; filename="{filename}"\r\n'
-                f"Content-Type: {content_type}\r\n\r\n"
-            ).encode("utf-8")
-            closing = f"\r\n--{boundary}--\r\n".encode("utf-8")
-
-            file_size = os.path.getsize(software_update_file)
-            total_length = len(preamble) + file_size + len(closing)
-
-            headers = {
-                "Content-Type": f"multipart/form-data; boundary={boundary}",
-                "Content-Length": str(total_length),
-            }
+            encoder = MultipartEncoder().add_file(
+                file_parameter_name, software_update_file
+            )
+            headers = encoder.headers()
 
             # Pick connection type
             if url.scheme == "https":
@@ -488,16 +777,9 @@ class SDSBConnectionManager(ConnectionManager):
                 conn.putheader("Authorization", auth_header)
             conn.endheaders()
 
-            # Send preamble
-            conn.send(preamble)
-
-            # Send file in chunks
-            with open(software_update_file, "rb") as f:
-                for chunk in iter(lambda: f.read(8192), b""):
-                    conn.send(chunk)
-
-            # Send closing
-            conn.send(closing)
+            # Send the body, the file is read in chunks
+            for chunk in encoder:
+                conn.send(chunk)
 
             # Get response
             response = conn.getresponse()
@@ -524,6 +806,7 @@ class SDSBConnectionManager(ConnectionManager):
             except Exception:
                 pass
 
+    @telemetry_entry
     def put(self, endpoint, data):
         put_response = self._make_request(method="PUT", end_point=endpoint, data=data)
         logger.writeDebug("put_response = {}", put_response)
@@ -532,6 +815,7 @@ class SDSBConnectionManager(ConnectionManager):
         job_id = put_response[API.JOB_ID]
         return self._process_job(job_id)
 
+    @telemetry_entry
     def add_storage_node(
         self,
         end_point,
@@ -550,10 +834,8 @@ class SDSBConnectionManager(ConnectionManager):
         )
 
         # Headers
-        headers = {
-            "Content-Type": f"multipart/form-data; boundary={self.boundary}",
-            "Expect": "",  # To suppress the "Expect: 100-continue"
-        }
+        headers = body.headers()
+        headers["Expect"] = ""  # To suppress the "Expect: 100-continue"
         try:
             resp = self._make_request_for_file(
                 method="POST", end_point=end_point, data=body, headers_input=headers
@@ -565,6 +847,7 @@ class SDSBConnectionManager(ConnectionManager):
             logger.writeException(err)
             raise err
 
+    @telemetry_entry
     def remove_storage_node(self, endpoint, data=None):
         delete_response = self._make_request(
             method="DELETE", end_point=endpoint, data=data
@@ -593,59 +876,62 @@ class SDSBConnectionManager(ConnectionManager):
 
         MAX_TIME_OUT = 3000
 
-        try:
-            response = open_url(
-                url=url,
-                method=method,
-                headers=headers,
-                data=data,
-                use_proxy=False,
-                timeout=MAX_TIME_OUT,
-                url_username=self.username,
-                url_password=self.password,
-                force_basic_auth=True,
-                validate_certs=False,
-            )
-        except socket.timeout as t_err:
-            logger.writeError(f"ConnectionManager._make_request - TimeoutError {t_err}")
-            raise Exception(t_err)
-        except urllib_error.HTTPError as err:
-            logger.writeError(f"ConnectionManager._make_request - HTTPError {err}")
-
-            if err.code == 503:
-                # 503 Service Unavailable
-                # wait for 5 mins and try to re-authenticate, we will retry 5 times
-                if self.retryCount < 5:
-                    logger.writeDebug(
-                        f"{self.server_busy_msg}, wait for 5 mins and try to generate session token again."
-                    )
-                    time.sleep(300)
-                    self.retryCount += 1
-                    return self._make_request_for_file(
-                        method, end_point, data, headers, download
-                    )
-                else:
-                    if hasattr(err, "read"):
-                        error_resp = json.loads(err.read().decode())
+        retry_budget = self.retry_policy.new_budget()
+        while True:
+            try:
+                response = open_url(
+                    url=url,
+                    method=method,
+                    headers=headers,
+                    data=data,
+                    use_proxy=False,
+                    timeout=MAX_TIME_OUT,
+                    url_username=self.username,
+                    url_password=self.password,
+                    force_basic_auth=True,
+                    validate_certs=False,
+                )
+                break
+            except socket.timeout as t_err:
+                logger.writeError(
+                    f"ConnectionManager._make_request - TimeoutError {t_err}"
+                )
+                raise Exception(t_err)
+            except urllib_error.HTTPError as err:
+                logger.writeError(f"ConnectionManager._make_request - HTTPError {err}")
+
+                if err.code == 503:
+                    # 503 Service Unavailable
+                    # back off and retry within the budget of this request
+                    if retry_budget.wait(err):
                         logger.writeDebug(
-                            f"ConnectionManager.error_resp - error_resp {error_resp}"
+                            f"{self.server_busy_msg}, retry {retry_budget.attempt} after waiting {retry_budget.waited:.1f}s."
                         )
-                        error_dtls = (
-                            error_resp.get("message")
-                            if error_resp.get("message")
-                            else error_resp.get("errorMessage")
-                        )
-                        if error_resp.get("cause"):
-                            error_dtls = error_dtls + " " + error_resp.get("cause")
-
-                        if error_resp.get("solution"):
-                            error_dtls = error_dtls + " " + error_resp.get("solution")
-
-                        raise Exception(error_dtls)
-            raise Exception(err)
-        except Exception as err:
-            logger.writeException(err)
-            raise err
+                        continue
+                    else:
+                        if hasattr(err, "read"):
+                            error_resp = json.loads(err.read().decode())
+                            logger.writeDebug(
+                                f"ConnectionManager.error_resp - error_resp {error_resp}"
+                            )
+                            error_dtls = (
+                                error_resp.get("message")
+                                if error_resp.get("message")
+                                else error_resp.get("errorMessage")
+                            )
+                            if error_resp.get("cause"):
+                                error_dtls = error_dtls + " " + error_resp.get("cause")
+
+                            if error_resp.get("solution"):
+                                error_dtls = (
+                                    error_dtls + " " + error_resp.get("solution")
+                                )
+
+                            raise Exception(error_dtls)
+                raise Exception(err)
+            except Exception as err:
+                logger.writeException(err)
+                raise err
 
         if response.status not in (200, 201, 202, 204):
             error_msg = json.loads(response.read())
@@ -659,10 +945,12 @@ class SDSBConnectionManager(ConnectionManager):
 
 class VSPConnectionManager(ConnectionManager):
     session = None
-    retryCount = 0
     session_expired_msg = "The specified token is invalid"
 
     session_manager = SessionManager()
+    get_cache = GetCache()
+    # job and session states change without a request of this run
+    uncached_endpoints = ("v1/objects/jobs", "v1/objects/sessions", "command-status")
 
     def getAuthToken(self, retry=False):
         logger.writeDebug("Entering VSPConnectionManager.getAuthToken")
@@ -708,16 +996,52 @@ class VSPConnectionManager(ConnectionManager):
         end_point = "v1/objects/jobs/{}".format(job_id)
         return self._make_vsp_request("GET", end_point)
 
+    def _job_result(self, job_id):
+        # reads sent while the job was running may miss its changes
+        try:
+            result = super()._job_result(job_id)
+        except Exception:
+            self.get_cache.invalidate()
+            raise
+        if result is not None:
+            self.get_cache.invalidate()
+        return result
+
+    @telemetry_entry
     def create(self, endpoint, data, token=None):
         return self._make_vsp_request(
             method="POST", end_point=endpoint, data=data, token=token
         )
 
+    @telemetry_entry
     def read(self, endpoint, headers_input=None, token=None):
-        return self._make_vsp_request(
-            "GET", endpoint, headers_input=headers_input, token=token
-        )
+        return self.cached_get(endpoint, headers_input=headers_input, token=token)
+
+    @telemetry_entry
+    def cached_get(self, endpoint, headers_input=None, token=None):
+        """
+        GET through the cache shared by all the connections of the run. Reads
+        with their own headers or token, for example inside a resource group
+        lock, and reads of jobs or sessions always go to the storage system.
+        """
+        if (
+            not ENABLE_GET_CACHE
+            or headers_input is not None
+            or token is not None
+            or any(path in endpoint for path in self.uncached_endpoints)
+        ):
+            return self._make_vsp_request(
+                "GET", endpoint, headers_input=headers_input, token=token
+            )
+        key = (self.base_url, self.username or self.token, endpoint)
+        return self.get_cache.get(key, lambda: self._make_vsp_request("GET", endpoint))
+
+    @telemetry_entry
+    def get_uncached(self, endpoint):
+        """GET that bypasses the cache, for polling a state that is changing."""
+        return self._make_vsp_request("GET", endpoint)
 
+    @telemetry_entry
     def update(self, endpoint, data, headers_input=None, token=None):
         put_response = self._make_vsp_request(
             method="PUT",
@@ -729,22 +1053,25 @@ class VSPConnectionManager(ConnectionManager):
         job_id = put_response[API.JOB_ID]
         return self._process_job(job_id)
 
+    @telemetry_entry
     def get(self, endpoint, headers_input=None, token=None):
-        return self._make_vsp_request(
-            "GET", endpoint, data=None, headers_input=headers_input, token=token
-        )
+        return self.cached_get(endpoint, headers_input=headers_input, token=token)
 
+    @telemetry_entry
     def get_with_headers(self, end_point, headers_input=None):
         return self._make_vsp_request("GET", end_point, None, headers_input)
 
+    @telemetry_entry
     def delete_with_headers(self, end_point, headers=None):
         response = self._make_vsp_request("DELETE", end_point, None, headers)
         job_id = response[API.JOB_ID]
         return self._process_job(job_id)
 
+    @telemetry_entry
     def pegasus_get(self, endpoint):
         return self._make_vsp_request("GET", endpoint)
 
+    @telemetry_entry
     def pegasus_post(self, endpoint, data):
         post_response = self._make_vsp_request("POST", endpoint, data)
         if isinstance(post_response, list):
@@ -752,38 +1079,51 @@ class VSPConnectionManager(ConnectionManager):
         job_id = post_response.get("statusResource").split("/")[-1]
         return self._process_pegasus_job(job_id)
 
+    @telemetry_entry
     def pegasus_post_multi_resource(self, endpoint, data):
         post_response = self._make_vsp_request("POST", endpoint, data)
         affected_resources = []
         if isinstance(post_response, list):
-            for response in post_response:
-                job_id = response.get("statusResource").split("/")[-1]
-                job_res = self._process_pegasus_job(job_id)
-                affected_resources.append(job_res.split("/")[-1])
+            job_ids = [
+                response.get("statusResource").split("/")[-1]
+                for response in post_response
+            ]
+            for job_res, error in self._process_pegasus_jobs(job_ids):
+                if error is not None:
+                    raise error
+                affected_resources.append(job_res)
             return affected_resources
         else:
-            job_id = response.get("statusResource").split("/")[-1]
+            job_id = post_response.get("statusResource").split("/")[-1]
             return self._process_pegasus_job(job_id)
 
+    @telemetry_entry
     def pegasus_post_multi_jobs(self, endpoint, data):
         post_response = self._make_vsp_request("POST", endpoint, data)
         affected_resources = []
         error_responses = []
         if isinstance(post_response, list):
+            job_ids = []
             for response in post_response:
                 try:
-                    job_id = response.get("statusResource").split("/")[-1]
-                    job_res = self._process_pegasus_job(job_id)
-                    affected_resources.append(job_res.split("/")[-1])
+                    job_ids.append(response.get("statusResource").split("/")[-1])
                 except Exception as e:
                     logger.writeError(f"Failed to process job: {e}")
                     error_responses.append(str(e))
 
+            for job_res, error in self._process_pegasus_jobs(job_ids):
+                if error is not None:
+                    logger.writeError(f"Failed to process job: {error}")
+                    error_responses.append(str(error))
+                else:
+                    affected_resources.append(job_res)
+
             return affected_resources, error_responses
         else:
-            job_id = response.get("statusResource").split("/")[-1]
+            job_id = post_response.get("statusResource").split("/")[-1]
             return self._process_pegasus_job(job_id), error_responses
 
+    @telemetry_entry
     def pegasus_patch(self, endpoint, data):
         patch_response = self._make_vsp_request("PATCH", endpoint, data)
 
@@ -792,49 +1132,69 @@ class VSPConnectionManager(ConnectionManager):
         job_id = patch_response.get("statusResource").split("/")[-1]
         return self._process_pegasus_job(job_id)
 
+    @telemetry_entry
     def pegasus_delete(self, endpoint, data):
         delete_response = self._make_vsp_request("DELETE", endpoint, data)
 
         job_id = delete_response.get("statusResource").split("/")[-1]
         return self._process_pegasus_job(job_id)
 
+    @telemetry_entry
     def pegasus_post_header(self, endpoint, data, headers_input):
         post_response = self._make_vsp_request("POST", endpoint, data, headers_input)
 
         job_id = post_response.get("statusResource").split("/")[-1]
         return self._process_pegasus_job(job_id)
 
-    def _process_pegasus_job(self, job_id):
-        response = None
-        retryCount = 0
-        while response is None and retryCount < 60:
-            job_response = self.get_pegasus_job(job_id)
-            job_status = job_response.get(API.STATUS)
-            job_progress = job_response.get(API.PEGASUS_PROGRESS)
-            logger.writeDebug("patch: job_response = {}", job_response)
-            response = None
-            if job_progress == API.PEGASUS_COMPLETED:
-                if job_status == API.PEGASUS_NORMAL:
-                    # For PATCH port-auth-settings, affected resource is empty
-                    response = job_response.get(API.AFFECTED_RESOURCES)[0]
-                else:
-                    raise Exception(job_response.get(API.ERROR_MESSAGE))
-            else:
-                retryCount = retryCount + 1
-                time.sleep(10)
+    pegasus_job_waiter = JobWaiter(PEGASUS_JOB_WAIT_TIMEOUT)
+
+    def _pegasus_job_result(self, job_id):
+        """Returns the affected resource of a finished job, None while it is running."""
+        job_response = self.get_pegasus_job(job_id)
+        job_status = job_response.get(API.STATUS)
+        job_progress = job_response.get(API.PEGASUS_PROGRESS)
+        logger.writeDebug("patch: job_response = {}", job_response)
+        if job_progress != API.PEGASUS_COMPLETED:
+            return None
+        self.get_cache.invalidate()
+        if job_status == API.PEGASUS_NORMAL:
+            # For PATCH port-auth-settings, affected resource is empty
+            return job_response.get(API.AFFECTED_RESOURCES)[0]
+        raise Exception(job_response.get(API.ERROR_MESSAGE))
 
-        if response is None:
-            raise Exception("Timeout Error! The tasks was not completed in 10 minutes")
+    def _process_pegasus_job(self, job_id):
+        response = self.pegasus_job_waiter.wait(
+            lambda: self._pegasus_job_result(job_id)
+        )
 
         resourceId = response.split("/")[-1]
         logger.writeDebug("response = {}", response)
         logger.writeDebug("resourceId = {}", resourceId)
         return resourceId
 
+    def _process_pegasus_jobs(self, job_ids):
+        """
+        Waits for all jobs of a multi-resource request together. The
+        outstanding jobs are probed concurrently each polling interval.
+        Returns a (resourceId, error) tuple per job in the order of job_ids.
+        """
+        probes = [
+            lambda job_id=job_id: self._pegasus_job_result(job_id) for job_id in job_ids
+        ]
+        results = self._wait_all_concurrently(
+            self.pegasus_job_waiter, probes, "PegasusJobs"
+        )
+        return [
+            (response.split("/")[-1] if response is not None else None, error)
+            for response, error in results
+        ]
+
+    @telemetry_entry
     def get_pegasus_job(self, job_id):
         url = Endpoints.PEGASUS_JOB
         return self._make_vsp_request("GET", url.format(job_id))
 
+    @telemetry_entry
     def delete(self, endpoint, data=None, headers_input=None, token=None):
         delete_response = self._make_vsp_request(
             method="DELETE",
@@ -846,6 +1206,7 @@ class VSPConnectionManager(ConnectionManager):
         job_id = delete_response[API.JOB_ID]
         return self._process_job(job_id)
 
+    @telemetry_entry
     def post(
         self,
         endpoint,
@@ -871,6 +1232,7 @@ class VSPConnectionManager(ConnectionManager):
         else:
             return self._process_job_till_running_state(job_id)
 
+    @telemetry_entry
     def post_without_job(
         self, endpoint, data, headers_input=None, token=None, timeout=None
     ):
@@ -886,6 +1248,7 @@ class VSPConnectionManager(ConnectionManager):
         logger.writeDebug("post_response = {}", post_response)
         return post_response
 
+    @telemetry_entry
     def post_wo_job(self, endpoint, data=None, headers_input=None, timeout=None):
         post_response = self._make_vsp_request(
             method="POST",
@@ -897,6 +1260,7 @@ class VSPConnectionManager(ConnectionManager):
         logger.writeDebug("post_response = {}", post_response)
         return post_response
 
+    @telemetry_entry
     def patch(self, endpoint, data):
         patch_response = self._make_vsp_request(
             method="PATCH", end_point=endpoint, data=data
@@ -904,12 +1268,20 @@ class VSPConnectionManager(ConnectionManager):
         job_id = patch_response[API.JOB_ID]
         return self._process_job(job_id)
 
+    @telemetry_entry
     def patch_wo_job(self, endpoint, data):
         patch_response = self._make_vsp_request(
             method="PATCH", end_point=endpoint, data=data
         )
         return patch_response
 
+    @telemetry_entry
+    def delete_wo_job(self, endpoint, data=None):
+        delete_response = self._make_vsp_request(
+            method="DELETE", end_point=endpoint, data=data
+        )
+        return delete_response
+
     def _make_vsp_request(
         self,
         method,
@@ -920,6 +1292,32 @@ class VSPConnectionManager(ConnectionManager):
         retry=False,
         timeout=None,
     ):
+        if method == "GET" or Endpoints.SESSIONS in end_point:
+            return self._send_vsp_request(
+                method, end_point, data, headers_input, token, retry, timeout
+            )
+        # resources reference each other (ldevs, luns, pools, pairs...), so
+        # any change drops every cached read. A read sent by another thread
+        # while the change is in progress may be cached, so the cache is
+        # dropped again once the change returned or failed
+        self.get_cache.invalidate()
+        try:
+            return self._send_vsp_request(
+                method, end_point, data, headers_input, token, retry, timeout
+            )
+        finally:
+            self.get_cache.invalidate()
+
+    def _send_vsp_request(
+        self,
+        method,
+        end_point,
+        data=None,
+        headers_input=None,
+        token=None,
+        retry=False,
+        timeout=None,
+    ):
 
         logger.writeDebug(
             f"VSPConnectionManager._make_vsp_request token= {mask_token(token)} self.token = {mask_token(self.token)}"
@@ -961,84 +1359,82 @@ class VSPConnectionManager(ConnectionManager):
         ):
             data = json.dumps(data)
             logger.writeDebug("data = {}", data)
-        try:
-
-            response = open_url(
-                url=url,
-                method=method,
-                headers=headers,
-                data=data,
-                use_proxy=False,
-                url_username=None,
-                url_password=None,
-                force_basic_auth=False,
-                validate_certs=False,
-                timeout=TIME_OUT,
-            )
-        except socket.timeout as t_err:
-            logger.writeError(str(t_err))
-            raise Exception(t_err)
-        except urllib_error.HTTPError as err:
-            logger.writeError(
-                f"VSPConnectionManager._make_vsp_request - HTTPError {err}"
-            )
-            if err.code == 503:
-                # 503 Service Unavailable
-                # wait for 5 mins and try to re-authenticate, we will retry 5 times
-                if self.retryCount < 5:
-                    logger.writeDebug(
-                        f"{self.server_busy_msg}, wait for 5 mins and try to generate session token again."
-                    )
-                    time.sleep(300)
-                    self.retryCount += 1
-                    return self._make_vsp_request(
-                        method, end_point, data, headers_input, token=None, retry=True
-                    )
-            else:
-                if hasattr(err, "read"):
-                    error_resp = json.loads(err.read().decode())
-                    logger.writeDebug(
-                        f"VSPConnectionManager.error_resp - error_resp {error_resp}"
-                    )
-                    error_dtls = (
-                        error_resp.get("message")
-                        if error_resp.get("message")
-                        else error_resp.get("errorMessage")
-                    )
-                    if error_resp.get("cause"):
-                        error_dtls = error_dtls + " " + error_resp.get("cause")
-
-                    if error_resp.get("solution"):
-                        error_dtls = error_dtls + " " + error_resp.get("solution")
+        retry_budget = self.retry_policy.new_budget()
+        while True:
+            try:
 
-                    if (
-                        error_dtls
-                        and self.session_expired_msg in error_dtls
-                        and self.retryCount < 5
-                    ):
+                response = open_url(
+                    url=url,
+                    method=method,
+                    headers=headers,
+                    data=data,
+                    use_proxy=False,
+                    url_username=None,
+                    url_password=None,
+                    force_basic_auth=False,
+                    validate_certs=False,
+                    timeout=TIME_OUT,
+                )
+                break
+            except socket.timeout as t_err:
+                logger.writeError(str(t_err))
+                raise Exception(t_err)
+            except urllib_error.HTTPError as err:
+                logger.writeError(
+                    f"VSPConnectionManager._make_vsp_request - HTTPError {err}"
+                )
+                if err.code == 503:
+                    # 503 Service Unavailable
+                    # back off and retry within the budget of this request
+                    if retry_budget.wait(err):
                         logger.writeDebug(
-                            "The specified token is invalid, trying to re-authenticate."
+                            f"{self.server_busy_msg}, retry {retry_budget.attempt} after waiting {retry_budget.waited:.1f}s."
                         )
-                        self.token = None
-                        if self.session:
-                            self.session.expiry_time = 0
-                        self.retryCount += 1
-                        return self._make_vsp_request(
-                            method,
-                            end_point,
-                            data,
-                            headers_input,
-                            token=None,
-                            retry=True,
+                        continue
+                else:
+                    if hasattr(err, "read"):
+                        error_resp = json.loads(err.read().decode())
+                        logger.writeDebug(
+                            f"VSPConnectionManager.error_resp - error_resp {error_resp}"
+                        )
+                        error_dtls = (
+                            error_resp.get("message")
+                            if error_resp.get("message")
+                            else error_resp.get("errorMessage")
                         )
+                        if error_resp.get("cause"):
+                            error_dtls = error_dtls + " " + error_resp.get("cause")
 
-                    else:
-                        parsed_response = error_dtls if error_dtls else error_resp
-                        raise Exception(parsed_response)
-            raise Exception(err)
-        except Exception as err:
-            logger.writeException(err)
-            raise err
+                        if error_resp.get("solution"):
+                            error_dtls = error_dtls + " " + error_resp.get("solution")
+
+                        if (
+                            error_dtls
+                            and self.session_expired_msg in error_dtls
+                            and not retry
+                        ):
+                            logger.writeDebug(
+                                "The specified token is invalid, trying to re-authenticate."
+                            )
+                            self.token = None
+                            if self.session:
+                                self.session.expiry_time = 0
+                            return self._make_vsp_request(
+                                method,
+                                end_point,
+                                data,
+                                headers_input,
+                                token=None,
+                                retry=True,
+                            )
+
+                        else:
+                            parsed_response = error_dtls if error_dtls else error_resp
+                            raise Exception(parsed_response)
+                raise Exception(err)
+            except Exception as err:
+                logger.writeException(err)
+                raise err
 
         if response.status not in (200, 201, 202, 204):
             raise Exception(
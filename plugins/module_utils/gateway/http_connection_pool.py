@@ -0,0 +1,274 @@
+import base64
+import http.client
+import io
+import select
+import ssl
+import socket
+import threading
+import time
+import urllib.error as urllib_error
+from urllib.parse import urlparse
+
+from ansible.module_utils.urls import open_url as ansible_open_url
+
+try:
+    from ..common.hv_log import Log
+    from ..common.ansible_common_constants import (
+        ENABLE_CONNECTION_POOL,
+        CONNECTION_POOL_MAX_SIZE,
+        CONNECTION_POOL_IDLE_TIMEOUT,
+    )
+except ImportError:
+    from common.hv_log import Log
+    from common.ansible_common_constants import (
+        ENABLE_CONNECTION_POOL,
+        CONNECTION_POOL_MAX_SIZE,
+        CONNECTION_POOL_IDLE_TIMEOUT,
+    )
+
+logger = Log()
+
+# open_url arguments the pooled transport understands, anything else
+# (proxies, client certificates, custom agents...) goes to ansible's open_url
+POOLED_ARGUMENTS = {
+    "url",
+    "method",
+    "headers",
+    "data",
+    "use_proxy",
+    "timeout",
+    "url_username",
+    "url_password",
+    "force_basic_auth",
+    "validate_certs",
+}
+
+# a kept-alive connection the storage system already closed fails with one
+# of these on the next request. Only requests of IDEMPOTENT_METHODS are then
+# sent again on a new connection, the others may already have been applied
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "OPTIONS"}
+
+
+class PooledResponse:
+    """
+    Response returned by the pooled transport. The body is read before the
+    connection goes back to the pool, so read() can be called at any time.
+    """
+
+    def __init__(self, url, status, reason, headers, body):
+        self.url = url
+        self.status = status
+        self.code = status
+        self.reason = reason
+        self.msg = reason
+        self.headers = headers
+        self._body = body
+
+    def read(self, amt=None):
+        return self._body
+
+    def getcode(self):
+        return self.status
+
+    def geturl(self):
+        return self.url
+
+    def info(self):
+        return self.headers
+
+
+class HTTPConnectionPool:
+    """
+    Thread-safe pool of keep-alive http.client connections per host.
+
+    At most max_size idle connections are kept per host and connections idle
+    for longer than idle_timeout are closed instead of being reused.
+    """
+
+    def __init__(
+        self,
+        max_size=CONNECTION_POOL_MAX_SIZE,
+        idle_timeout=CONNECTION_POOL_IDLE_TIMEOUT,
+    ):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._idle = {}
+
+    @staticmethod
+    def _ssl_context(validate_certs):
+        if validate_certs:
+            return ssl.create_default_context()
+        # ignores cert validation like open_url(validate_certs=False)
+        return ssl._create_unverified_context()  # nosec
+
+    def _new_connection(self, key, timeout):
+        scheme, host, port, validate_certs = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(
+                host, port, timeout=timeout, context=self._ssl_context(validate_certs)
+            )
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _acquire(self, key, timeout):
+        now = time.monotonic()
+        expired = []
+        conn = None
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                candidate, last_used = idle.pop()
+                if now - last_used <= self.idle_timeout:
+                    conn = candidate
+                    break
+                expired.append(candidate)
+        for candidate in expired:
+            candidate.close()
+        if conn is None:
+            return self._new_connection(key, timeout), False
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    @staticmethod
+    def _is_dropped(conn):
+        # an idle keep-alive socket is readable only once the peer closed it
+        if conn.sock is None:
+            return False
+        try:
+            readable, unused, unused = select.select([conn.sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+
+    def _release(self, key, conn):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_size:
+                idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def clear(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn, unused in connections:
+                conn.close()
+
+    def request(
+        self, method, url, headers=None, data=None, timeout=None, validate_certs=True
+    ):
+        parsed = urlparse(url)
+        scheme = parsed.scheme or "https"
+        port = parsed.port or (443 if scheme == "https" else 80)
+        key = (scheme, parsed.hostname, port, bool(validate_certs))
+        path = parsed.path or "/"
+        if parsed.query:
+            path = f"{path}?{parsed.query}"
+
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        conn, reused = self._acquire(key, timeout)
+        if reused and self._is_dropped(conn):
+            # nothing was written to it yet, so any method can use a new one
+            conn.close()
+            conn, reused = self._new_connection(key, timeout), False
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        while True:
+            try:
+                conn.request(method, path, body=data, headers=headers or {})
+                response = conn.getresponse()
+                body = response.read()
+                break
+            except STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused or not idempotent:
+                    raise
+                logger.writeDebug("HTTPConnectionPool - stale connection, reconnecting")
+                conn, reused = self._new_connection(key, timeout), False
+            except Exception:
+                conn.close()
+                raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+        return PooledResponse(
+            url, response.status, response.reason, response.headers, body
+        )
+
+    def open(
+        self,
+        url,
+        method="GET",
+        headers=None,
+        data=None,
+        use_proxy=False,
+        timeout=10,
+        url_username=None,
+        url_password=None,
+        force_basic_auth=False,
+        validate_certs=True,
+    ):
+        """Same contract as ansible's open_url for the arguments it accepts."""
+        headers = dict(headers or {})
+        headers.setdefault("User-Agent", "ansible-httpget")
+        if force_basic_auth and url_username and "Authorization" not in headers:
+            credentials = f"{url_username}:{url_password or ''}".encode("utf-8")
+            headers["Authorization"] = "Basic " + base64.b64encode(credentials).decode(
+                "ascii"
+            )
+
+        try:
+            response = self.request(
+                method,
+                url,
+                headers=headers,
+                data=data,
+                timeout=timeout,
+                validate_certs=validate_certs,
+            )
+        except socket.timeout:
+            raise
+        except (OSError, http.client.HTTPException) as err:
+            raise urllib_error.URLError(err)
+
+        if response.status >= 400:
+            raise urllib_error.HTTPError(
+                url,
+                response.status,
+                response.reason,
+                response.headers,
+                io.BytesIO(response.read()),
+            )
+        return response
+
+
+CONNECTION_POOL = HTTPConnectionPool()
+
+
+def open_url(stream=False, **kwargs):
+    """
+    Drop-in replacement for ansible's open_url that reuses connections to
+    the storage system. Falls back to ansible's open_url for requests the
+    pool does not handle. With stream the body is left unread so it can be
+    read in chunks, such requests are never pooled.
+    """
+    if (
+        stream
+        or not ENABLE_CONNECTION_POOL
+        or kwargs.get("use_proxy", True)
+        or not POOLED_ARGUMENTS.issuperset(kwargs)
+    ):
+        return ansible_open_url(**kwargs)
+    return CONNECTION_POOL.open(**kwargs)
@@ -0,0 +1,82 @@
+import mimetypes
+import os
+import uuid
+
+try:
+    from ..common.ansible_common_constants import UPLOAD_CHUNK_SIZE
+except ImportError:
+    from common.ansible_common_constants import UPLOAD_CHUNK_SIZE
+
+
+class MultipartEncoder:
+    """
+    multipart/form-data request body that is streamed instead of built in
+    memory. Files are read chunk_size bytes at a time while the body is
+    sent, and the Content-Length is computed up front from the field values
+    and the file sizes.
+
+    Iterating the encoder yields the body from the start each time, so a
+    request can be sent again, for example after a 503 retry.
+    """
+
+    def __init__(self, boundary=None, chunk_size=UPLOAD_CHUNK_SIZE):
+        self.boundary = boundary or f"----AnsibleFormBoundary{uuid.uuid4().hex}"
+        self.chunk_size = chunk_size
+        self._parts = []
+
+    def add_field(self, name, value):
+        header = f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        self._parts.append((self._part_header(header), value, None))
+        return self
+
+    def add_file(self, name, file_path, content_type=None):
+        filename = os.path.basename(file_path)
+        if content_type is None:
+            content_type = (
+                mimetypes.guess_type(filename)[0] or "application/octet-stream"
+            )
+        header = (
+            f'Content-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        )
+        self._parts.append((self._part_header(header), None, file_path))
+        return self
+
+    def _part_header(self, header):
+        return f"--{self.boundary}\r\n{header}".encode("utf-8")
+
+    @property
+    def closing(self):
+        return f"--{self.boundary}--\r\n".encode("utf-8")
+
+    @property
+    def content_type(self):
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def content_length(self):
+        length = len(self.closing)
+        for header, value, file_path in self._parts:
+            size = len(value) if file_path is None else os.path.getsize(file_path)
+            length += len(header) + size + 2
+        return length
+
+    def headers(self):
+        return {
+            "Content-Type": self.content_type,
+            "Content-Length": str(self.content_length),
+        }
+
+    def __iter__(self):
+        for header, value, file_path in self._parts:
+            yield header
+            if file_path is None:
+                yield value
+            else:
+                with open(file_path, "rb") as f:
+                    for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                        yield chunk
+            yield b"\r\n"
+        yield self.closing
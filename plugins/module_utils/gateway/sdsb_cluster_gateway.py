@@ -121,10 +121,7 @@ class SDSBClusterGateway:
     @log_entry_exit
     def download_config_file(self, file_name):
         end_point = DOWNLOAD_CONFIG_FILE
-        resp = self.connection_manager.download_file(end_point)
-        # logger.writeDebug(f"GW:download_config_file:resp={resp}")
-        with open(file_name, mode="wb") as file:
-            file.write(resp)
+        self.connection_manager.download_to_file(end_point, file_name)
         return
 
     @log_entry_exit
@@ -37,7 +37,7 @@ class SDSBComputeNodeDirectGateway:
         )
 
     @log_entry_exit
-    def get_query_parameters(self, spec):
+    def get_query_params(self, spec):
         params = {}
         if spec.names is not None:
             if len(spec.names) == 1:
@@ -48,25 +48,18 @@ class SDSBComputeNodeDirectGateway:
             params["hbaName"] = ",".join(spec.hba_name)
         if spec.vps_id is not None:
             params["vpsId"] = spec.vps_id
+        return params
 
-        query = ""
-        if params:
-            query_parts = ["{}={}".format(k, v) for k, v in params.items()]
-            query = "?" + "&".join(query_parts)
-
-        return query
+    def iter_compute_nodes(self, spec=None):
+        params = self.get_query_params(spec) if spec is not None else None
+        for compute_node in self.connection_manager.iter_items(
+            SDSBlockEndpoints.GET_SERVERS, params
+        ):
+            yield SDSBComputeNodeInfo(**compute_node)
 
     @log_entry_exit
     def get_compute_nodes(self, spec=None):
-
-        end_point = SDSBlockEndpoints.GET_SERVERS
-        if spec is not None:
-            end_point = end_point + self.get_query_parameters(spec)
-        compute_node_data = self.connection_manager.get(end_point)
-
-        return SDSBComputeNodesInfo(
-            dicts_to_dataclass_list(compute_node_data["data"], SDSBComputeNodeInfo)
-        )
+        return SDSBComputeNodesInfo(list(self.iter_compute_nodes(spec)))
 
     @log_entry_exit
     def get_compute_port_ids(self):
@@ -51,9 +51,7 @@ class SDSBDumpLogGateway:
         end_point = DOWNLOAD_DUMP_FILE
         file_name = self.generate_file_name()
         file_name_path = os.path.join(spec.file_path, file_name)        # nosec
-        resp = self.connection_manager.download_file(end_point)
-        with open(file_name_path, "wb") as file:
-            file.write(resp)
+        self.connection_manager.download_to_file(end_point, file_name_path)
         return f"Dump file downloaded successfully to {file_name_path}"
 
     @log_entry_exit
@@ -63,10 +61,8 @@ class SDSBDumpLogGateway:
 
         file_name_path = os.path.join(spec.file_path, spec.file_name)       # nosec
         try:
-            response = self.connection_manager.download_file(end_point)
-            with open(file_name_path, "wb") as file:
-                file.write(response)
-                return f"Dump file downloaded successfully to {file_name_path}"
+            self.connection_manager.download_to_file(end_point, file_name_path)
+            return f"Dump file downloaded successfully to {file_name_path}"
         except Exception as e:
             raise ValueError(f"File with file name {spec.file_name} not found")
 
@@ -12,7 +12,7 @@ except ImportError:
 
 GET_EVENT_LOGS = "v1/objects/event-logs"
 GET_EVENT_LOG_BY_ID = "v1/objects/event-logs/{}"
-GET_EVENT_LOGS_QUERY = "v1/objects/event-logs{}"
+MAX_EVENTS_PER_REQUEST = 1000
 
 logger = Log()
 
@@ -25,10 +25,7 @@ class SDSBEventLogsDirectGateway:
         )
 
     @log_entry_exit
-    def get_query_parameters(
-        self,
-        spec,
-    ):
+    def get_query_params(self, spec):
         params = {}
         if spec.start_time:
             params["startTime"] = spec.start_time
@@ -38,30 +35,37 @@ class SDSBEventLogsDirectGateway:
             params["severity"] = spec.severity
         if spec.severity_ge:
             params["severityGe"] = spec.severity_ge
-        if spec.max_events:
-            params["maxEvents"] = spec.max_events
-
-        query = ""
-        if params:
-            query_parts = ["{}={}".format(k, v) for k, v in params.items()]
-            query = "?" + "&".join(query_parts)
-
-        return query
+        return params
+
+    @staticmethod
+    def older_event_logs(event_log):
+        """Query parameters of the page following the given event log."""
+        return {"endTime": event_log["time"]}
+
+    def iter_event_logs(self, spec=None):
+        """
+        Streams the event logs matching spec, newest first, at most
+        spec.max_events of them. Further pages are selected by moving the
+        end of the time window to the oldest event returned so far.
+        """
+        params = self.get_query_params(spec) if spec is not None else None
+        max_events = spec.max_events if spec is not None else None
+        return self.connection_manager.iter_items(
+            GET_EVENT_LOGS,
+            params,
+            limit=max_events or None,
+            count_param="maxEvents",
+            next_page=self.older_event_logs if max_events else None,
+            page_size=MAX_EVENTS_PER_REQUEST,
+        )
 
     @log_entry_exit
     def get_event_logs(self, spec=None):
         if spec and spec.id:
             return self.get_event_log_by_id(spec.id)
 
-        end_point = GET_EVENT_LOGS
-
-        if spec is not None:
-            query = self.get_query_parameters(spec)
-            end_point = GET_EVENT_LOGS_QUERY.format(query)
-            logger.writeDebug("GW:get_event_logs:end_point={}", end_point)
-
-        event_logs = self.connection_manager.get(end_point)
-        logger.writeDebug("GW:get_event_logs:data={}", event_logs)
+        event_logs = {"data": list(self.iter_event_logs(spec))}
+        logger.writeDebug("GW:get_event_logs:count={}", len(event_logs["data"]))
 
         converted = convert_keys_to_snake_case(event_logs)
         cleaned_data = replace_nulls(converted)
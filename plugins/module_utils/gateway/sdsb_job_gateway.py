@@ -1,7 +1,7 @@
 try:
     from .gateway_manager import SDSBConnectionManager
     from ..common.hv_log import Log
-    from ..common.ansible_common import dicts_to_dataclass_list, log_entry_exit
+    from ..common.ansible_common import log_entry_exit
     from ..model.sdsb_job_models import (
         SDSBJobInfo,
         SDSBJobInfoList,
@@ -9,14 +9,13 @@ try:
 except ImportError:
     from .gateway_manager import SDSBConnectionManager
     from common.hv_log import Log
-    from common.ansible_common import dicts_to_dataclass_list, log_entry_exit
+    from common.ansible_common import log_entry_exit
     from model.sdsb_job_models import (
         SDSBJobInfo,
         SDSBJobInfoList,
     )
 
 GET_JOBS = "v1/objects/jobs"
-GET_JOBS_WITH_QUERY = "v1/objects/jobs{}"
 GET_JOB_BY_ID = "v1/objects/jobs/{}"
 
 logger = Log()
@@ -31,14 +30,12 @@ class SDSBJobGateway:
 
     @log_entry_exit
     def get_jobs(self, count=None):
-        end_point = GET_JOBS
-        if count is not None:
-            query = f"?count={count}"
-            end_point = GET_JOBS_WITH_QUERY.format(query)
+        return SDSBJobInfoList(list(self.iter_jobs(count)))
 
-        data = self.connection_manager.get(end_point)
-
-        return SDSBJobInfoList(dicts_to_dataclass_list(data["data"], SDSBJobInfo))
+    def iter_jobs(self, count=None):
+        """Streams the most recent jobs, at most count of them."""
+        for job in self.connection_manager.iter_items(GET_JOBS, limit=count):
+            yield SDSBJobInfo(**job)
 
     @log_entry_exit
     def get_job_by_id(self, id):
@@ -1,13 +1,11 @@
 try:
     from ..common.sdsb_constants import SDSBlockEndpoints
-    from ..common.ansible_common import dicts_to_dataclass_list
     from .gateway_manager import SDSBConnectionManager
     from ..model.sdsb_volume_models import SDSBVolumesInfo, SDSBVolumeInfo
     from ..common.hv_log import Log
     from ..common.ansible_common import log_entry_exit
 except ImportError:
     from common.sdsb_constants import SDSBlockEndpoints
-    from common.ansible_common import dicts_to_dataclass_list
     from .gateway_manager import SDSBConnectionManager
     from model.sdsb_volume_models import SDSBVolumesInfo, SDSBVolumeInfo
     from common.hv_log import Log
@@ -80,35 +78,38 @@ class SDSBVolumeDirectGateway:
         return self.connection_manager.post(end_point, payload)
 
     @log_entry_exit
-    def get_query_parameters(self, spec):
+    def get_query_params(self, spec):
         params = {}
-        if spec.count is not None:
-            params["count"] = spec.count
         if spec.names is not None:
             params["names"] = ",".join(spec.names)
+        if spec.nicknames is not None and len(spec.nicknames) == 1:
+            params["nickname"] = spec.nicknames[0]
         if spec.capacity_saving is not None:
             params["savingSetting"] = spec.capacity_saving
         if spec.vps_id is not None:
             params["vpsId"] = spec.vps_id
-
-        query = ""
-        if params:
-            query_parts = ["{}={}".format(k, v) for k, v in params.items()]
-            query = "?" + "&".join(query_parts)
-
-        return query
+        return params
+
+    def iter_volumes(self, spec=None):
+        """
+        Streams the volumes matching spec in pages of SDSB_PAGE_SIZE, at most
+        spec.count of them. Filters are applied by the storage system.
+        """
+        params = self.get_query_params(spec) if spec else None
+        volumes = self.connection_manager.iter_items(
+            SDSBlockEndpoints.GET_VOLUMES,
+            params,
+            limit=spec.count if spec else None,
+            next_page=lambda volume: {"startVolumeId": volume["id"]},
+        )
+        for volume in volumes:
+            yield SDSBVolumeInfo(**volume)
 
     @log_entry_exit
     def get_volumes(self, spec=None):
-        end_point = SDSBlockEndpoints.GET_VOLUMES
-        if spec:
-            end_point += self.get_query_parameters(spec)
-        logger.writeDebug("GW:get_volumes:end_point={}", end_point)
-        volume_data = self.connection_manager.get(end_point)
-        logger.writeDebug("GW:get_volumes:data={}", volume_data)
-        return SDSBVolumesInfo(
-            dicts_to_dataclass_list(volume_data["data"], SDSBVolumeInfo)
-        )
+        volumes = list(self.iter_volumes(spec))
+        logger.writeDebug("GW:get_volumes:count={}", len(volumes))
+        return SDSBVolumesInfo(volumes)
 
     @log_entry_exit
     def get_volume_by_id(self, volume_id):
@@ -13,6 +13,7 @@ try:
         DirectSpecificCopyGroupInfoList,
     )
     from .vsp_volume import VSPVolumeDirectGateway
+    from .vsp_remote_connection_registry import REMOTE_CONNECTIONS
     from ..common.ansible_common import dicts_to_dataclass_list
     from ..common.hv_log import Log
     from ..common.ansible_common import log_entry_exit
@@ -29,11 +30,11 @@ except ImportError:
         DirectSpecificCopyGroupInfoList,
     )
     from .vsp_volume import VSPVolumeDirectGateway
+    from .vsp_remote_connection_registry import REMOTE_CONNECTIONS
     from common.ansible_common import dicts_to_dataclass_list
     from common.hv_log import Log
     from common.ansible_common import log_entry_exit
 
-GET_REMOTE_STORAGE_SYSTEMS = "v1/objects/remote-storages"
 GET_STORAGES_DIRECT = "v1/objects/storages"
 GET_COPY_GROUPS = "v1/objects/remote-mirror-copygroups?remoteStorageDeviceId={}"
 GET_ONE_REMOTE_COPY_GROUP = "v1/objects/remote-mirror-copygroups/{}"
@@ -178,18 +179,12 @@ class VSPCopyGroupsDirectGateway:
     def get_remote_copy_pair_by_id(self, spec):
 
         remote_connection_info = spec.secondary_connection_info
-        remote_connection_manager = VSPConnectionManager(
-            remote_connection_info.address,
-            remote_connection_info.username,
-            remote_connection_info.password,
-            remote_connection_info.api_token,
-        )
         remote_storage_deviceId = self.get_secondary_storage_device_id(
             remote_connection_info
         )
         copy_pair_id = f"{remote_storage_deviceId},{spec.copy_group_name},{spec.local_device_group_name},{spec.remote_device_group_name},{spec.copy_pair_name}"
         all_remote_pairs = []
-        headers = remote_connection_manager.getAuthToken()
+        headers = self.get_remote_token(remote_connection_info)
         headers["Remote-Authorization"] = headers.pop("Authorization")
         response = self.connection_manager.get_with_headers(
             GET_ONE_REMOTE_COPY_PAIR.format(copy_pair_id), headers_input=headers
@@ -209,9 +204,6 @@ class VSPCopyGroupsDirectGateway:
 
     @log_entry_exit
     def get_secondary_storage_device_id(self, secondary_connection_info):
-        if self.remote_connection_manager is None:
-            self.init_remote_connection_manager(secondary_connection_info)
-
         secondary_storage_info = self.get_secondary_storage_info(
             secondary_connection_info
         )
@@ -224,21 +216,18 @@ class VSPCopyGroupsDirectGateway:
 
     @log_entry_exit
     def get_storage_device_id(self, serial):
-        response = self.connection_manager.get(GET_REMOTE_STORAGE_SYSTEMS)
-        logger.writeDebug(f"GW:get_storage_device_id:response={response}")
-        for x in response.get("data"):
-            if str(x.get("serialNumber")) == str(serial):
-
-                remote_storage_device_id = x.get("storageDeviceId")
-                return remote_storage_device_id
-
-        return None
+        remote_storage_device_id = REMOTE_CONNECTIONS.get(
+            self.connection_info
+        ).remote_storage_device_id(serial)
+        logger.writeDebug(
+            f"GW:get_storage_device_id:remote_storage_device_id={remote_storage_device_id}"
+        )
+        return remote_storage_device_id
 
     @log_entry_exit
     def get_secondary_storage_info(self, remote_connection_info):
         self.init_remote_connection_manager(remote_connection_info)
-        secondary_storage = self.remote_connection_manager.get(GET_STORAGES_DIRECT)
-        return secondary_storage["data"][0]
+        return REMOTE_CONNECTIONS.get(remote_connection_info).storage_info()
 
     @log_entry_exit
     def get_primary_storage_device_id(self):
@@ -249,24 +238,20 @@ class VSPCopyGroupsDirectGateway:
 
     @log_entry_exit
     def init_remote_connection_manager(self, remote_connection_info):
-        self.remote_connection_manager = VSPConnectionManager(
-            remote_connection_info.address,
-            remote_connection_info.username,
-            remote_connection_info.password,
-            remote_connection_info.api_token,
-        )
+        self.remote_connection_manager = REMOTE_CONNECTIONS.get(
+            remote_connection_info
+        ).connection_manager
         return
 
     @log_entry_exit
     def get_remote_token(self, remote_connection_info):
-        self.remote_connection_manager = VSPConnectionManager(
-            remote_connection_info.address,
-            remote_connection_info.username,
-            remote_connection_info.password,
-            remote_connection_info.api_token,
-        )
+        self.init_remote_connection_manager(remote_connection_info)
+        return REMOTE_CONNECTIONS.get(remote_connection_info).auth_headers()
 
-        return self.remote_connection_manager.getAuthToken()
+    @log_entry_exit
+    def refresh_remote_token(self, remote_connection_info, stale_headers):
+        self.init_remote_connection_manager(remote_connection_info)
+        return REMOTE_CONNECTIONS.get(remote_connection_info).refresh(stale_headers)
 
     @log_entry_exit
     def get_copy_groups(self, spec):
@@ -315,11 +300,10 @@ class VSPCopyGroupsDirectGateway:
     def get_all_copy_pairs_for_a_copy_group(self, copy_group, spec, completeInfo=False):
         try:
             headers = self.get_remote_token(spec.secondary_connection_info)
-            headers["Remote-Authorization"] = headers.pop("Authorization")
         except Exception as e:
             logger.writeError(f"GW:get_all_copy_pairs_for_a_copy_group:exception={e}")
-            headers = self.get_remote_token(spec.secondary_connection_info)
-            headers["Remote-Authorization"] = headers.pop("Authorization")
+            headers = self.refresh_remote_token(spec.secondary_connection_info, None)
+        headers["Remote-Authorization"] = headers.pop("Authorization")
         try:
             response = self.connection_manager.get_with_headers(
                 GET_ONE_REMOTE_COPY_GROUP.format(copy_group.remoteMirrorCopyGroupId),
@@ -387,7 +371,9 @@ class VSPCopyGroupsDirectGateway:
                     self.connection_info.api_token,
                 )
 
-                headers = self.get_remote_token(spec.secondary_connection_info)
+                headers = self.refresh_remote_token(
+                    spec.secondary_connection_info, headers
+                )
                 headers["Remote-Authorization"] = headers.pop("Authorization")
 
                 try:
@@ -548,19 +534,13 @@ class VSPCopyGroupsDirectGateway:
 
     @log_entry_exit
     def get_one_copy_pair_by_id(self, copy_pair_id, remote_connection_info):
-        remote_connection_manager = VSPConnectionManager(
-            remote_connection_info.address,
-            remote_connection_info.username,
-            remote_connection_info.password,
-            remote_connection_info.api_token,
-        )
         self.connection_manager = VSPConnectionManager(
             self.connection_info.address,
             self.connection_info.username,
             self.connection_info.password,
             self.connection_info.api_token,
         )
-        headers = remote_connection_manager.getAuthToken()
+        headers = self.get_remote_token(remote_connection_info)
         headers["Remote-Authorization"] = headers.pop("Authorization")
         response = self.connection_manager.get_with_headers(
             GET_ONE_REMOTE_COPY_PAIR.format(copy_pair_id), headers_input=headers
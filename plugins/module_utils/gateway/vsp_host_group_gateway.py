@@ -37,6 +37,7 @@ except ImportError:
     )
     from common.hv_constants import VSPHostGroupConstant
     from message.vsp_host_group_msgs import VSPHostGroupMessage
+    from common.ansible_common_constants import MAX_WORKER_THREADS
 
 logger = Log()
 
@@ -262,7 +263,9 @@ class VSPHostGroupDirectGateway:
                 resp = self.rest_api.read(end_points)
                 if resp:
                     return VSPHostGroupsInfo(
-                        dicts_to_dataclass_list(resp["data"], VSPHostGroupInfo)
+                        dicts_to_dataclass_list(
+                            resp["data"], VSPHostGroupInfo, compact=True
+                        )
                     )
             except Exception as e:
                 if retry == max_retry - 1:
@@ -387,7 +390,9 @@ class VSPHostGroupDirectGateway:
         finally:
             executor.shutdown(wait=True)
 
-        return VSPHostGroupsInfo(dicts_to_dataclass_list(lstHg, VSPHostGroupInfo))
+        return VSPHostGroupsInfo(
+            dicts_to_dataclass_list(lstHg, VSPHostGroupInfo, compact=True)
+        )
 
     @log_entry_exit
     def get_host_groups_from_meta_resource(self, port):
@@ -417,7 +422,9 @@ class VSPHostGroupDirectGateway:
             tmpHg = self.parse_host_group(hg, None, None, None)
             lstHg.append(tmpHg)
 
-            return VSPHostGroupsInfo(dicts_to_dataclass_list(lstHg, VSPHostGroupInfo))
+            return VSPHostGroupsInfo(
+                dicts_to_dataclass_list(lstHg, VSPHostGroupInfo, compact=True)
+            )
         return None
 
     @log_entry_exit
@@ -521,31 +528,53 @@ class VSPHostGroupDirectGateway:
     def add_wwns_to_host_group(self, hg, wwns):
         errors = []
         comments = []
-        for host_wwn in wwns:
-            end_point = self.end_points.POST_WWNS
+        if not wwns:
+            return comments, errors
+        actual_hg_number = None
+        if isinstance(hg.hostGroupNumber, int):
+            actual_hg_number = hg.hostGroupNumber
+        elif isinstance(hg.hostGroupNumber, str) and "," in hg.hostGroupNumber:
+            actual_hg_number = hg.hostGroupNumber.split(",")[-1]
+        else:
+            raise ValueError(f"Invalid host group number {hg.hostGroupNumber}.")
+
+        def add_wwn(host_wwn):
             data = {}
             data["hostWwn"] = host_wwn.wwn
             data["portId"] = hg.port
-            actual_hg_number = None
-            if isinstance(hg.hostGroupNumber, int):
-                actual_hg_number = hg.hostGroupNumber
-            elif isinstance(hg.hostGroupNumber, str) and "," in hg.hostGroupNumber:
-                actual_hg_number = hg.hostGroupNumber.split(",")[-1]
-            else:
-                raise ValueError(f"Invalid host group number {hg.hostGroupNumber}.")
             data["hostGroupNumber"] = actual_hg_number
-            unused = self.rest_api.post(end_point, data)
-            if host_wwn.nick_name:
-                try:
-                    self.set_nickname_of_wwn(hg, host_wwn)
-
-                except Exception as e:
-                    errors.append(
-                        VSPHostGroupMessage.WWN_NICKNAME_SET_FAILED.value.format(
-                            hg.hostGroupName, host_wwn.wwn, str(e)
-                        )
+            return self.rest_api.post_wo_job(self.end_points.POST_WWNS, data)
+
+        results = self.rest_api.run_jobs(wwns, add_wwn, stop_on_error=True)
+        added = [
+            host_wwn
+            for host_wwn, result in zip(wwns, results)
+            if result is not None and result[1] is None
+        ]
+
+        # nicknames can only be set once the WWNs exist
+        named = [host_wwn for host_wwn in added if host_wwn.nick_name]
+        nickname_results = self.rest_api.run_jobs(
+            named,
+            lambda host_wwn: self.rest_api.patch_wo_job(
+                self.end_points.PATCH_WWNS.format(
+                    hg.port, hg.hostGroupNumber, host_wwn.wwn
+                ),
+                {"wwnNickname": host_wwn.nick_name},
+            ),
+        )
+        for host_wwn, (unused, error) in zip(named, nickname_results):
+            if error is not None:
+                errors.append(
+                    VSPHostGroupMessage.WWN_NICKNAME_SET_FAILED.value.format(
+                        hg.hostGroupName, host_wwn.wwn, str(error)
                     )
-                    pass
+                )
+
+        for result in results:
+            if result is not None and result[1] is not None:
+                raise result[1]
+        for host_wwn in added:
             comments.append(
                 VSPHostGroupMessage.ADD_WWN_SUCCESS.value.format(
                     host_wwn.wwn, hg.hostGroupName
@@ -565,108 +594,112 @@ class VSPHostGroupDirectGateway:
         logger.writeInfo(resp)
         return resp
 
-    @log_entry_exit
-    def add_luns_to_host_group(self, hg, luns, lun_id=None):
+    def _free_lun_ids(self, hg, count, reserved=()):
+        """
+        Returns the count lowest LUN IDs not used in the host group, the IDs
+        the storage would assign one after the other to LUNs added without one.
+        """
+        used = set(reserved)
+        luns = self.get_luns(hg.port, hg.hostGroupNumber)
+        for lun in luns.data or []:
+            used.add(lun.lun)
+        free = []
+        for lun_id in range(VSPHostGroupConstant.MAX_LUN_NUMBER + 1):
+            if len(free) == count:
+                break
+            if lun_id not in used:
+                free.append(lun_id)
+        # let the storage reject whatever does not fit
+        return free + [None] * (count - len(free))
+
+    def _add_luns(self, hg, ldev_ids, lun_ids):
+        """
+        Maps the LDEVs to the host group concurrently. LUNs added without an
+        ID get the lowest free IDs up front, as if they were added one by one,
+        so the order the concurrent requests land in does not matter.
+        Returns (comments, errors) and raises on the first failed LDEV.
+        """
         logger = Log()
         errors = []
         comments = []
-        for lun in luns:
-            end_point = self.end_points.POST_LUNS
+        auto_count = sum(1 for lun_id in lun_ids if lun_id is None)
+        if auto_count > 1:
+            free = iter(
+                self._free_lun_ids(
+                    hg, auto_count, [x for x in lun_ids if x is not None]
+                )
+            )
+            lun_ids = [next(free) if x is None else x for x in lun_ids]
+
+        def add_lun(index):
             data = {}
-            data["ldevId"] = lun
+            data["ldevId"] = ldev_ids[index]
             data["portId"] = hg.port
             data["hostGroupNumber"] = hg.hostGroupNumber
-            if lun_id is not None:
-                data["lun"] = lun_id
-            try:
-                resp = self.rest_api.post(end_point, data)
+            if lun_ids[index] is not None:
+                data["lun"] = lun_ids[index]
+            return self.rest_api.post_wo_job(self.end_points.POST_LUNS, data)
+
+        results = self.rest_api.run_jobs(
+            list(range(len(ldev_ids))), add_lun, stop_on_error=True
+        )
+        for ldev_id, result in zip(ldev_ids, results):
+            if result is None:
+                continue
+            resp, error = result
+            if error is None:
                 logger.writeInfo(resp)
                 comments.append(
                     VSPHostGroupMessage.ADD_LUN_SUCCESS.value.format(
-                        lun, hg.hostGroupName
+                        ldev_id, hg.hostGroupName
                     )
                 )
-            except Exception as e:
-                logger.writeError(
-                    VSPHostGroupMessage.ADD_LUN_FAILED.value.format(
-                        lun, hg.hostGroupName, str(e)
-                    )
-                )
-                errors.append(
-                    VSPHostGroupMessage.ADD_LUN_FAILED.value.format(
-                        lun, hg.hostGroupName, str(e)
-                    )
-                )
-                raise ValueError(errors)
+                continue
+            msg = VSPHostGroupMessage.ADD_LUN_FAILED.value.format(
+                ldev_id, hg.hostGroupName, str(error)
+            )
+            logger.writeError(msg)
+            errors.append(msg)
+            raise ValueError(errors)
         return comments, errors
 
+    @log_entry_exit
+    def add_luns_to_host_group(self, hg, luns, lun_id=None):
+        return self._add_luns(hg, list(luns), [lun_id] * len(luns))
+
     @log_entry_exit
     def add_ldev_and_ports_to_host_group(self, hg_number, luns, ports):
         logger = Log()
         errors = []
         comments = []
-        for lun in luns:
-            end_point = self.end_points.POST_LUNS
+
+        def add_lun(lun):
             data = {}
             data["ldevId"] = lun
             data["portIds"] = ports
             data["hostGroupNumber"] = hg_number
-            # if lun_id is not None:
-            #     data["lun"] = lun_id
-            try:
-                resp = self.rest_api.post(end_point, data)
+            return self.rest_api.post_wo_job(self.end_points.POST_LUNS, data)
+
+        results = self.rest_api.run_jobs(luns, add_lun)
+        for lun, (resp, error) in zip(luns, results):
+            if error is None:
                 logger.writeInfo(resp)
                 comments.append(
                     VSPHostGroupMessage.ADD_LUN_SUCCESS.value.format(lun, hg_number)
                 )
-            except Exception as e:
-                logger.writeError(
-                    VSPHostGroupMessage.ADD_LUN_FAILED.value.format(
-                        lun, hg_number, str(e)
-                    )
-                )
-                errors.append(
-                    VSPHostGroupMessage.ADD_LUN_FAILED.value.format(
-                        lun, hg_number, str(e)
-                    )
+            else:
+                msg = VSPHostGroupMessage.ADD_LUN_FAILED.value.format(
+                    lun, hg_number, str(error)
                 )
-                # raise ValueError(errors)
+                logger.writeError(msg)
+                errors.append(msg)
         return comments, errors
 
     @log_entry_exit
     def add_lun_paths_to_host_group(self, hg, lun_paths):
-        logger = Log()
-        errors = []
-        comments = []
-        for lun in lun_paths:
-            end_point = self.end_points.POST_LUNS
-            data = {}
-            data["ldevId"] = lun.ldev
-            data["portId"] = hg.port
-            data["hostGroupNumber"] = hg.hostGroupNumber
-            if lun.lun is not None:
-                data["lun"] = lun.lun
-            try:
-                resp = self.rest_api.post(end_point, data)
-                logger.writeInfo(resp)
-                comments.append(
-                    VSPHostGroupMessage.ADD_LUN_SUCCESS.value.format(
-                        lun.ldev, hg.hostGroupName
-                    )
-                )
-            except Exception as e:
-                logger.writeError(
-                    VSPHostGroupMessage.ADD_LUN_FAILED.value.format(
-                        lun.ldev, hg.hostGroupName, str(e)
-                    )
-                )
-                errors.append(
-                    VSPHostGroupMessage.ADD_LUN_FAILED.value.format(
-                        lun.ldev, hg.hostGroupName, str(e)
-                    )
-                )
-                raise ValueError(errors)
-        return comments, errors
+        return self._add_luns(
+            hg, [lun.ldev for lun in lun_paths], [lun.lun for lun in lun_paths]
+        )
 
     @log_entry_exit
     def delete_one_lun_from_host_group(self, host_group: VSPHostGroupInfo, lun_id):
@@ -734,29 +767,28 @@ class VSPHostGroupDirectGateway:
         logger = Log()
         errors = []
         comments = []
-        for wwn in wwns:
+
+        def delete_wwn(wwn):
             end_point = self.end_points.DELETE_WWNS.format(
                 hg.port, hg.hostGroupNumber, wwn
             )
-            try:
-                resp = self.rest_api.delete(end_point)
+            return self.rest_api.delete_wo_job(end_point)
+
+        results = self.rest_api.run_jobs(wwns, delete_wwn)
+        for wwn, (resp, error) in zip(wwns, results):
+            if error is None:
                 logger.writeInfo(resp)
                 comments.append(
                     VSPHostGroupMessage.REMOVE_WWN_SUCCESS.value.format(
                         wwn, hg.hostGroupName
                     )
                 )
-            except Exception as e:
-                logger.writeError(
-                    VSPHostGroupMessage.REMOVE_WWN_FAILED.value.format(
-                        wwn, hg.hostGroupName, str(e)
-                    )
-                )
-                errors.append(
-                    VSPHostGroupMessage.REMOVE_WWN_FAILED.value.format(
-                        wwn, hg.hostGroupName, str(e)
-                    )
+            else:
+                msg = VSPHostGroupMessage.REMOVE_WWN_FAILED.value.format(
+                    wwn, hg.hostGroupName, str(error)
                 )
+                logger.writeError(msg)
+                errors.append(msg)
         return comments, errors
 
     @log_entry_exit
@@ -765,26 +797,30 @@ class VSPHostGroupDirectGateway:
         errors = []
         comments = []
         logger.writeDebug(f"Deleting LUNs: {luns} from Host Group: {hg}")
-        for lun in luns:
-            try:
-                for lunPath in hg.lunPaths:
-                    if lun == lunPath.ldevId:
-                        lunId = lunPath.lun
-                        end_point = self.end_points.DELETE_LUNS.format(
-                            hg.port, hg.hostGroupNumber, lunId
-                        )
-                        logger.writeInfo(f"{lunId}, {hg.port}, {hg.hostGroupNumber}")
-                        resp = self.rest_api.delete(end_point)
-                        logger.writeInfo(resp)
-                        break
+
+        def delete_lun(lun):
+            for lunPath in hg.lunPaths:
+                if lun == lunPath.ldevId:
+                    lunId = lunPath.lun
+                    end_point = self.end_points.DELETE_LUNS.format(
+                        hg.port, hg.hostGroupNumber, lunId
+                    )
+                    logger.writeInfo(f"{lunId}, {hg.port}, {hg.hostGroupNumber}")
+                    return self.rest_api.delete_wo_job(end_point)
+            return None
+
+        results = self.rest_api.run_jobs(luns, delete_lun)
+        for lun, (resp, error) in zip(luns, results):
+            if error is None:
+                logger.writeInfo(resp)
                 comments.append(
                     VSPHostGroupMessage.REMOVE_LUN_PORT_SUCCESS.value.format(
                         lun, hg.hostGroupName, hg.port
                     )
                 )
-            except Exception as e:
+            else:
                 msg = VSPHostGroupMessage.REMOVE_LUN_FAILED.value.format(
-                    lun, hg.hostGroupName, str(e)
+                    lun, hg.hostGroupName, str(error)
                 )
                 logger.writeError(msg)
                 errors.append(msg)
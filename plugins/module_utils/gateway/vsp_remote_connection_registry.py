@@ -0,0 +1,106 @@
+import threading
+
+try:
+    from .gateway_manager import VSPConnectionManager
+    from ..common.hv_log import Log
+except ImportError:
+    from .gateway_manager import VSPConnectionManager
+    from common.hv_log import Log
+
+logger = Log()
+
+GET_STORAGES_DIRECT = "v1/objects/storages"
+GET_REMOTE_STORAGE_SYSTEMS = "v1/objects/remote-storages"
+
+
+class RemoteConnection:
+    """
+    Connection to one storage system shared by all the threads of a run.
+
+    The session token is fetched once and only replaced through refresh(),
+    after the storage system rejected it. The storage information and the
+    storageDeviceId of the remote storages registered on it are looked up
+    once.
+    """
+
+    def __init__(self, connection_info):
+        self.connection_manager = VSPConnectionManager(
+            connection_info.address,
+            connection_info.username,
+            connection_info.password,
+            connection_info.api_token,
+        )
+        self._lock = threading.Lock()
+        self._auth_headers = None
+        self._storage_info = None
+        self._remote_storage_device_ids = None
+
+    def auth_headers(self):
+        """Returns a copy of the Authorization header, the caller may change it."""
+        with self._lock:
+            if self._auth_headers is None:
+                self._auth_headers = self.connection_manager.getAuthToken()
+            return dict(self._auth_headers)
+
+    def refresh(self, stale_headers=None):
+        """
+        Renews the session unless another thread already replaced the token
+        the stale_headers were built from.
+        """
+        stale_token = None
+        if stale_headers is not None:
+            stale_token = stale_headers.get("Authorization") or stale_headers.get(
+                "Remote-Authorization"
+            )
+        with self._lock:
+            current_token = (self._auth_headers or {}).get("Authorization")
+            if stale_token is None or stale_token == current_token:
+                logger.writeDebug(
+                    "RemoteConnection:refresh:address={}",
+                    self.connection_manager.address,
+                )
+                self._auth_headers = self.connection_manager.getAuthToken(retry=True)
+            return dict(self._auth_headers)
+
+    def storage_info(self):
+        with self._lock:
+            if self._storage_info is None:
+                response = self.connection_manager.get(GET_STORAGES_DIRECT)
+                self._storage_info = response["data"][0]
+            return self._storage_info
+
+    def remote_storage_device_id(self, serial):
+        with self._lock:
+            if self._remote_storage_device_ids is None:
+                response = self.connection_manager.get(GET_REMOTE_STORAGE_SYSTEMS)
+                device_ids = {}
+                for x in response.get("data"):
+                    device_ids.setdefault(
+                        str(x.get("serialNumber")), x.get("storageDeviceId")
+                    )
+                self._remote_storage_device_ids = device_ids
+            return self._remote_storage_device_ids.get(str(serial))
+
+
+class RemoteConnectionRegistry:
+    """RemoteConnection per storage system address and user."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._connections = {}
+
+    def get(self, connection_info):
+        key = (
+            connection_info.address,
+            connection_info.username,
+            connection_info.api_token,
+        )
+        with self._lock:
+            connection = self._connections.get(key)
+            if connection is None:
+                connection = RemoteConnection(connection_info)
+                self._connections[key] = connection
+            return connection
+
+
+REMOTE_CONNECTIONS = RemoteConnectionRegistry()
@@ -1,9 +1,11 @@
 try:
     from .gateway_manager import VSPConnectionManager
+    from ..common.hv_api_constants import API
     from ..common.hv_log import Log
     from ..common.ansible_common import log_entry_exit
 except ImportError:
     from .gateway_manager import VSPConnectionManager
+    from common.hv_api_constants import API
     from common.hv_log import Log
     from common.ansible_common import log_entry_exit
 
@@ -73,6 +75,28 @@ class VSPResourceGroupLockDirectGateway:
         self.connection_info.changed = True
         return lock_session_id, lock_token, remote_lock_session_id, remote_lock_token
 
+    @log_entry_exit
+    def refresh_storage_cache(self, lock_token, remote_lock_token=None):
+        """
+        Refreshes the storage cache service of the storage systems locked by
+        lock_resource_group and waits for the refresh jobs to finish.
+        """
+        self._refresh_storage_cache(self.connection_manager, lock_token)
+        if remote_lock_token is not None and self.remote_connection_manager:
+            self._refresh_storage_cache(
+                self.remote_connection_manager, remote_lock_token
+            )
+
+    @staticmethod
+    def _refresh_storage_cache(connection_manager, token):
+        response = connection_manager.post_without_job(
+            POST_UPDATE_CACHE, data=None, token=token
+        )
+        logger.writeDebug(f"refresh_storage_cache:response={response}")
+        job_id = response.get(API.JOB_ID) if isinstance(response, dict) else None
+        if job_id is not None:
+            connection_manager._process_job(job_id)
+
     @log_entry_exit
     def unlock_resource_group(self, spec):
         end_point = UNLOCK_RESOURCE_GROUP_DIRECT
@@ -1,16 +1,26 @@
 import json
+import os
+import fcntl
+import hashlib
 import threading
 import time
 import atexit
 import urllib.error as urllib_error
+from contextlib import contextmanager
 from ansible.module_utils.urls import socket
-from ansible.module_utils.urls import open_url
 
 try:
     from ..common.ansible_common import mask_token
     from ..common.hv_api_constants import API
     from ..common.hv_log import Log
     from ..common.vsp_constants import Endpoints
+    from ..common.hv_retry_policy import DEFAULT_RETRY_POLICY
+    from .http_connection_pool import open_url
+    from ..common.ansible_common_constants import (
+        ENABLE_SESSION_CACHE,
+        SESSION_CACHE_PATH,
+        SESSION_ALIVE_TIME,
+    )
 
     # from .ansible_url import open_url
 except ImportError:
@@ -18,6 +28,13 @@ except ImportError:
     from common.hv_api_constants import API
     from common.hv_log import Log
     from common.vsp_constants import Endpoints
+    from common.hv_retry_policy import DEFAULT_RETRY_POLICY
+    from gateway.http_connection_pool import open_url
+    from common.ansible_common_constants import (
+        ENABLE_SESSION_CACHE,
+        SESSION_CACHE_PATH,
+        SESSION_ALIVE_TIME,
+    )
 
     # from .ansible_url import open_url
 
@@ -66,6 +83,121 @@ def mask_key_in_dict(data, visible_length=12, mask_char="X", key="token"):
     return result
 
 
+class SessionFileCache:
+    """
+    File backed store used to share session tokens across Ansible tasks.
+
+    Each address/user pair gets its own JSON file (mode 0600) under
+    SESSION_CACHE_PATH. Access is serialized with flock, so forked tasks
+    that start at the same time end up sharing one session.
+    """
+
+    # seconds subtracted from aliveTime so a token is not reused just
+    # before the storage system expires it
+    EXPIRY_MARGIN = 15
+
+    def __init__(self, path=SESSION_CACHE_PATH, alive_time=SESSION_ALIVE_TIME):
+        self.path = path
+        self.alive_time = alive_time
+
+    def _key(self, connection_info):
+        raw = f"{connection_info.address}|{connection_info.username}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _file_path(self, connection_info):
+        return os.path.join(self.path, self._key(connection_info) + ".json")  # nosec
+
+    @staticmethod
+    def _fingerprint(connection_info, salt):
+        raw = f"{salt}|{connection_info.username}|{connection_info.password}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @contextmanager
+    def locked(self, connection_info):
+        os.makedirs(self.path, mode=0o700, exist_ok=True)
+        lock_path = os.path.join(  # nosec
+            self.path, self._key(connection_info) + ".lock"
+        )
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def _read(self, connection_info):
+        try:
+            with open(self._file_path(connection_info), "r") as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict):
+            return None
+        if entry.get("fingerprint") != self._fingerprint(
+            connection_info, entry.get("salt", "")
+        ):
+            # credentials changed since the token was cached
+            return None
+        return entry
+
+    def _write(self, connection_info, entry):
+        file_path = self._file_path(connection_info)
+        temp_file = f"{file_path}.{os.getpid()}.tmp"
+        fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as file:
+            json.dump(entry, file)
+        os.replace(temp_file, file_path)
+
+    def load(self, connection_info):
+        """Returns the cached (session_id, token) if it is still alive, else None."""
+        entry = self._read(connection_info)
+        if entry is None:
+            return None
+        expires_at = (
+            entry.get("lastUsed", 0) + entry.get("aliveTime", 0) - self.EXPIRY_MARGIN
+        )
+        if time.time() >= expires_at:
+            return None
+        return entry.get("sessionId"), entry.get("token")
+
+    def store(self, connection_info, session_id, token):
+        salt = os.urandom(16).hex()
+        entry = {
+            "sessionId": session_id,
+            "token": token,
+            "aliveTime": self.alive_time,
+            "lastUsed": time.time(),
+            "salt": salt,
+            "fingerprint": self._fingerprint(connection_info, salt),
+        }
+        try:
+            self._write(connection_info, entry)
+        except OSError as e:
+            logger.writeDebug(f"SessionFileCache.store - could not write cache {e}")
+
+    def touch(self, connection_info, token):
+        """Moves the idle timer of a cached token forward after it was used."""
+        with self.locked(connection_info):
+            entry = self._read(connection_info)
+            if entry is None or entry.get("token") != token:
+                return
+            entry["lastUsed"] = time.time()
+            try:
+                self._write(connection_info, entry)
+            except OSError as e:
+                logger.writeDebug(f"SessionFileCache.touch - could not write cache {e}")
+
+    def invalidate(self, connection_info, token=None):
+        entry = self._read(connection_info)
+        if entry is not None and token is not None and entry.get("token") != token:
+            return
+        try:
+            os.remove(self._file_path(connection_info))
+        except OSError:
+            pass
+
+
 class SessionManager:
     _instance = None
     _lock = threading.Lock()
@@ -84,7 +216,12 @@ class SessionManager:
         self.token_to_session_id_map = {}
         self.token_to_connection_info_map = {}
         self.current_sessions = {}
-        self.retry_count = 0
+        self.retry_policy = DEFAULT_RETRY_POLICY
+
+        # tokens shared with other tasks through the session cache,
+        # these are kept alive at exit instead of being discarded
+        self.session_cache = SessionFileCache() if ENABLE_SESSION_CACHE else None
+        self.shared_tokens = {}
 
         # Thread management
         self.active_threads = []
@@ -98,6 +235,7 @@ class SessionManager:
 
     def cleanup(self):
         # 4. Discard all sessions
+        self.release_shared_sessions()
         self.discard_sessions()
         logger.writeDebug("SessionManager - cleanup completed.")
 
@@ -109,17 +247,66 @@ class SessionManager:
         value = self.current_sessions.get(connection_info.address, None)
         if value is not None:
             return value
+        elif self.session_cache is not None:
+            token = self.get_shared_session(connection_info)
+            self.current_sessions[connection_info.address] = token
+            return token
         else:
             token = self.generate_token(connection_info)
             self.current_sessions[connection_info.address] = token
             return token
 
     def renew_session(self, connection_info):
-        unused = self.current_sessions.pop(connection_info.address, None)
-        token = self.generate_token(connection_info)
+        stale_token = self.current_sessions.pop(connection_info.address, None)
+        if self.session_cache is not None:
+            token = self.get_shared_session(connection_info, stale_token)
+        else:
+            token = self.generate_token(connection_info)
         self.current_sessions[connection_info.address] = token
         return token
 
+    def get_shared_session(self, connection_info, stale_token=None):
+        """
+        Returns a token from the session cache, creating a new session only
+        when no live token is cached. stale_token is the token the storage
+        system rejected, it is dropped from the cache unless another task
+        has already replaced it.
+        """
+        with self.session_cache.locked(connection_info):
+            if stale_token is not None:
+                self.session_cache.invalidate(connection_info, stale_token)
+                self.shared_tokens.pop(stale_token, None)
+                self.token_to_session_id_map.pop(stale_token, None)
+                self.token_to_connection_info_map.pop(stale_token, None)
+
+            cached = self.session_cache.load(connection_info)
+            if cached is not None:
+                session_id, token = cached
+                logger.writeDebug(
+                    "get_shared_session reusing session id = {} token = {}",
+                    session_id,
+                    mask_token(token),
+                )
+            else:
+                token = self.generate_token(
+                    connection_info, alive_time=self.session_cache.alive_time
+                )
+                session_id = self.token_to_session_id_map.pop(token, None)
+                self.token_to_connection_info_map.pop(token, None)
+                self.session_cache.store(connection_info, session_id, token)
+
+        self.shared_tokens[token] = connection_info
+        return token
+
+    def release_shared_sessions(self):
+        if self.session_cache is None:
+            return
+        for token, conn_info in self.shared_tokens.items():
+            try:
+                self.session_cache.touch(conn_info, token)
+            except Exception as e:
+                logger.writeDebug(f"Could not update the session cache. {e}")
+
     def get_sessions(self, connection_info):
         end_point = GET_SESSIONS
         response = self._make_request(
@@ -165,14 +352,15 @@ class SessionManager:
         )
         return response
 
-    def generate_token(self, connection_info):
+    def generate_token(self, connection_info, alive_time=None):
         end_point = Endpoints.SESSIONS
+        payload = {"aliveTime": alive_time} if alive_time is not None else None
         try:
             response = self._make_request(
                 connection_info=connection_info,
                 method="POST",
                 end_point=end_point,
-                data=None,
+                data=payload,
             )
         except Exception as e:
             logger.writeException(e)
@@ -215,57 +403,62 @@ class SessionManager:
 
         MAX_TIME_OUT = 300
 
-        try:
-            response = open_url(
-                url=url,
-                method=method,
-                headers=headers,
-                data=data,
-                use_proxy=False,
-                timeout=MAX_TIME_OUT,
-                url_username=username,
-                url_password=password,
-                force_basic_auth=True if username else False,
-                validate_certs=False,
-            )
-        except socket.timeout as t_err:
-            logger.writeError(f"SessionManager._make_request - TimeoutError {t_err}")
-            raise TimeoutError(t_err)
-        except urllib_error.HTTPError as err:
-            logger.writeError(f"SessionManager._make_request - HTTPError {err}")
-
-            if err.code == 503:
-                # 503 Service Unavailable
-                # wait for 5 mins and try to re-authenticate, we will retry 5 times
-                if self.retry_count < 5:
-                    logger.writeDebug(
-                        "wait for 5 mins and try to generate session token again."
-                    )
-                    time.sleep(300)
-                    self.retry_count += 1
-                    return self._make_request(connection_info, method, end_point, data)
-                else:
-                    if hasattr(err, "read"):
-                        error_resp = json.loads(err.read().decode())
+        retry_budget = self.retry_policy.new_budget()
+        while True:
+            try:
+                response = open_url(
+                    url=url,
+                    method=method,
+                    headers=headers,
+                    data=data,
+                    use_proxy=False,
+                    timeout=MAX_TIME_OUT,
+                    url_username=username,
+                    url_password=password,
+                    force_basic_auth=True if username else False,
+                    validate_certs=False,
+                )
+                break
+            except socket.timeout as t_err:
+                logger.writeError(
+                    f"SessionManager._make_request - TimeoutError {t_err}"
+                )
+                raise TimeoutError(t_err)
+            except urllib_error.HTTPError as err:
+                logger.writeError(f"SessionManager._make_request - HTTPError {err}")
+
+                if err.code == 503:
+                    # 503 Service Unavailable
+                    # back off and retry within the budget of this request
+                    if retry_budget.wait(err):
                         logger.writeDebug(
-                            f"SessionManager.error_resp - error_resp {error_resp}"
-                        )
-                        error_dtls = (
-                            error_resp.get("message")
-                            if error_resp.get("message")
-                            else error_resp.get("errorMessage")
+                            f"Server busy, retry {retry_budget.attempt} after waiting {retry_budget.waited:.1f}s."
                         )
-                        if error_resp.get("cause"):
-                            error_dtls = error_dtls + " " + error_resp.get("cause")
-
-                        if error_resp.get("solution"):
-                            error_dtls = error_dtls + " " + error_resp.get("solution")
-
-                        raise Exception(error_dtls)
-            raise Exception(err)
-        except Exception as err:
-            logger.writeException(err)
-            raise err
+                        continue
+                    else:
+                        if hasattr(err, "read"):
+                            error_resp = json.loads(err.read().decode())
+                            logger.writeDebug(
+                                f"SessionManager.error_resp - error_resp {error_resp}"
+                            )
+                            error_dtls = (
+                                error_resp.get("message")
+                                if error_resp.get("message")
+                                else error_resp.get("errorMessage")
+                            )
+                            if error_resp.get("cause"):
+                                error_dtls = error_dtls + " " + error_resp.get("cause")
+
+                            if error_resp.get("solution"):
+                                error_dtls = (
+                                    error_dtls + " " + error_resp.get("solution")
+                                )
+
+                            raise Exception(error_dtls)
+                raise Exception(err)
+            except Exception as err:
+                logger.writeException(err)
+                raise err
 
         if response.status not in (200, 201, 202):
             try:
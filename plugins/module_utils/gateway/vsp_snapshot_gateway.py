@@ -85,7 +85,7 @@ class VSPHtiSnapshotDirectGateway:
             snapshots_lists.extend(snapshots)
 
         return DirectSnapshotsInfo(
-            dicts_to_dataclass_list(snapshots_lists, DirectSnapshotInfo)
+            dicts_to_dataclass_list(snapshots_lists, DirectSnapshotInfo, compact=True)
         )
 
     def _get_all_snapshots_pf_rest(
@@ -109,13 +109,17 @@ class VSPHtiSnapshotDirectGateway:
         )
         snapshots = self.rest_api.get(end_point)
         return DirectSnapshotsInfo(
-            dicts_to_dataclass_list(snapshots["data"], DirectSnapshotInfo)
+            dicts_to_dataclass_list(snapshots["data"], DirectSnapshotInfo, compact=True)
         )
 
-    def get_one_snapshot(self, pvol: int, mirror_unit_id: int) -> DirectSnapshotInfo:
+    def get_one_snapshot(
+        self, pvol: int, mirror_unit_id: int, fresh: bool = False
+    ) -> DirectSnapshotInfo:
         object_id = f"{pvol},{mirror_unit_id}"
         end_point = self.end_points.GET_ONE_SNAPSHOTS.format(object_id)
-        snapshot = self.rest_api.get(end_point)
+        # fresh reads skip the GET cache, they are used to poll the pair status
+        get = self.rest_api.get_uncached if fresh else self.rest_api.get
+        snapshot = get(end_point)
         return DirectSnapshotInfo(**snapshot)
 
     def get_snapshot_by_pvol(self, pvol: int) -> DirectSnapshotsInfo:
@@ -123,7 +127,7 @@ class VSPHtiSnapshotDirectGateway:
         end_point = self.end_points.GET_SNAPSHOTS_QUERY.format(query)
         snapshots = self.rest_api.get(end_point)
         return DirectSnapshotsInfo(
-            dicts_to_dataclass_list(snapshots["data"], DirectSnapshotInfo)
+            dicts_to_dataclass_list(snapshots["data"], DirectSnapshotInfo, compact=True)
         )
 
     def delete_snapshot(self, pvol: int, mirror_unit_id: int) -> Dict[str, Any]:
@@ -200,16 +204,15 @@ class VSPHtiSnapshotDirectGateway:
             self.snapshot_groups = SnapshotGroups().dump_to_object(ssgs)
         return self.snapshot_groups
 
-    def get_snapshots_using_group_id(self, gid):
+    def get_snapshots_using_group_id(self, gid, fresh=False):
         snapshots = None
+        get = self.rest_api.get_uncached if fresh else self.rest_api.get
         try:
-            snapshots = self.rest_api.get(
+            snapshots = get(
                 self.end_points.SNAPSHOTS_BY_GROUP_ID_WITH_RETAIN.format(gid)
             )
         except Exception as e:
-            snapshots = self.rest_api.get(
-                self.end_points.SNAPSHOTS_BY_GROUP_ID.format(gid)
-            )
+            snapshots = get(self.end_points.SNAPSHOTS_BY_GROUP_ID.format(gid))
         # snapshots=  DirectSnapshotsInfo().dump_to_object({"data": ss["snapshots"]})
         # sng_grps.snapshots = snapshots.data
         sng_grps = SnapshotGroupInfo(**snapshots)
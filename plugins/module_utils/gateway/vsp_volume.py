@@ -1,4 +1,4 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from .gateway_manager import VSPConnectionManager
@@ -23,6 +23,8 @@ try:
     from ..common.vsp_constants import PEGASUS_MODELS
     from .vsp_storage_system_gateway import VSPStorageSystemDirectGateway
     from ..common.ansible_common import calculate_3390_ldev_blocks
+    from ..common.ansible_common_constants import MAX_WORKER_THREADS
+    from ..common.hv_retry_policy import RetryPolicy
 
 except ImportError:
     from common.ansible_common import log_entry_exit
@@ -43,6 +45,8 @@ except ImportError:
     )
     from common.hv_log import Log
     from common.vsp_constants import PEGASUS_MODELS
+    from common.ansible_common_constants import MAX_WORKER_THREADS
+    from common.hv_retry_policy import RetryPolicy
     from .vsp_storage_system_gateway import VSPStorageSystemDirectGateway
 
 
@@ -54,6 +58,11 @@ class VSPVolumeDirectGateway:
     VSPVolumeDirectGateway
     """
 
+    # failed LDEV pages are read again after a backoff with jitter
+    page_retry_policy = RetryPolicy(
+        max_attempts=AutomationConstants.LDEV_PAGE_ATTEMPTS - 1
+    )
+
     def __init__(self, connection_info):
         self.rest_api = VSPConnectionManager(
             connection_info.address,
@@ -84,7 +93,7 @@ class VSPVolumeDirectGateway:
         end_point = self.end_points.GET_LDEVS.format(path)
         vol_data = self.rest_api.get(end_point)
         volumes = VSPVolumesInfo(
-            dicts_to_dataclass_list(vol_data["data"], VSPVolumeInfo)
+            dicts_to_dataclass_list(vol_data["data"], VSPVolumeInfo, compact=True)
         )
         return volumes
 
@@ -113,57 +122,129 @@ class VSPVolumeDirectGateway:
         if parity_group_id:
             path = VolumePayloadConst.PARITY_GROUP_ID.format(parity_group_id)
 
-        if count <= 1000:
+        # filtered lists cannot be split by LDEV ID, they are read at once
+        is_filtered = (
+            pool_id is not None or resource_group_id or journal_id or parity_group_id
+        )
+        if count <= AutomationConstants.LDEV_PAGE_SIZE or is_filtered:
             path += VolumePayloadConst.COUNT.format(count)
             end_point = self.end_points.GET_LDEVS.format(path)
             vol_data = self.rest_api.get(end_point)
             volumes = VSPVolumesInfo(
-                dicts_to_dataclass_list(vol_data["data"], VSPVolumeInfo)
+                dicts_to_dataclass_list(vol_data["data"], VSPVolumeInfo, compact=True)
             )
         else:
-
-            num_threads = (count + 999) // 1000
             all_volumes = []
+            for page in self.iter_volume_pages(start_ldev, ldev_option, count):
+                all_volumes.extend(page.data)
+            volumes = VSPVolumesInfo(all_volumes)
+        return volumes
 
-            def fetch_volumes_chunk(chunk_start, chunk_count):
-                chunk_path = VolumePayloadConst.LDEV_OPTION.format(ldev_option)
-                chunk_path += VolumePayloadConst.HEAD_LDEV_ID_NEXT.format(chunk_start)
-                chunk_path += VolumePayloadConst.COUNT.format(chunk_count)
-                chunk_end_point = self.end_points.GET_LDEVS.format(chunk_path)
-                return self.rest_api.get(chunk_end_point)
+    def iter_volume_pages(
+        self, start_ldev=0, ldev_option="defined", count=0, end_ldev=None
+    ):
+        """
+        Yields the first count LDEVs from start_ldev as VSPVolumesInfo pages of
+        at most LDEV_PAGE_SIZE LDEVs, in LDEV ID order. A count of 0 reads up to
+        the last LDEV ID.
+
+        Each page starts right after the last LDEV of the previous page, the
+        count of a request is a number of LDEVs and not a range of LDEV IDs.
+        Reading stops once count LDEVs were yielded, a page is not full or
+        end_ldev is passed, and closing the generator stops the remaining
+        requests. A page that keeps failing raises instead of being skipped.
+        """
+        page_size = AutomationConstants.LDEV_PAGE_SIZE
+        head = start_ldev
+        remaining = count if count > 0 else None
+        while head <= AutomationConstants.LDEV_ID_MAX:
+            page_count = page_size if remaining is None else min(page_size, remaining)
+            volumes = self._get_volume_page(ldev_option, head, page_count)
+            if not volumes.data:
+                return
+            last_ldev = volumes.data[-1].ldevId
+            if end_ldev is not None and last_ldev > end_ldev:
+                volumes.data = [v for v in volumes.data if v.ldevId <= end_ldev]
+                if volumes.data:
+                    yield volumes
+                return
+            yield volumes
+            if remaining is not None:
+                remaining -= len(volumes.data)
+                if remaining <= 0:
+                    return
+            if len(volumes.data) < page_count:
+                return
+            head = last_ldev + 1
+
+    def _get_volume_page(self, ldev_option, head_ldev, page_count):
+        path = VolumePayloadConst.LDEV_OPTION.format(ldev_option)
+        path += VolumePayloadConst.HEAD_LDEV_ID_NEXT.format(head_ldev)
+        path += VolumePayloadConst.COUNT.format(page_count)
+        end_point = self.end_points.GET_LDEVS.format(path)
 
-            executor = ThreadPoolExecutor(max_workers=num_threads)
+        retry_budget = self.page_retry_policy.new_budget()
+        while True:
             try:
-                futures = {}
-                current_start = start_ldev
-                remaining = count
-
-                for unused in range(num_threads):
-                    chunk_size = min(1000, remaining)
-                    if chunk_size <= 0:
-                        break
-                    future = executor.submit(
-                        fetch_volumes_chunk, current_start, chunk_size
-                    )
-                    futures[future] = current_start
-                    current_start += 1000
-                    remaining -= chunk_size
-
-                for future in as_completed(futures):
-                    try:
-                        vol_data = future.result()
-                        all_volumes.extend(vol_data.get("data", []))
-                    except Exception as ex:
-                        logger.writeDebug(f"GW: exception in get_volumes thread {ex}")
-            except KeyboardInterrupt:
-                executor.shutdown(wait=False, cancel_futures=True)
-                raise
-            finally:
-                executor.shutdown(wait=True)
+                vol_data = self.rest_api.get(end_point)
+                break
+            except Exception as ex:
+                logger.writeDebug(
+                    f"GW: LDEV page from {head_ldev}, attempt {retry_budget.attempt + 1} failed: {ex}"
+                )
+                if not retry_budget.wait():
+                    raise
 
-            volumes = VSPVolumesInfo(
-                dicts_to_dataclass_list(all_volumes, VSPVolumeInfo)
-            )
+        return VSPVolumesInfo(
+            dicts_to_dataclass_list(vol_data["data"], VSPVolumeInfo, compact=True)
+        )
+
+    @log_entry_exit
+    def get_volumes_by_ids(self, ldev_ids):
+        """
+        Returns a dict of LDEV ID to volume for the given LDEV IDs. IDs close
+        to each other are read together with a range query, isolated IDs and
+        IDs a range query did not return are read one by one. The requests
+        are sent concurrently.
+        """
+        ranges = []
+        for ldev_id in sorted({int(x) for x in ldev_ids}):
+            if (
+                ranges
+                and ldev_id - ranges[-1][-1] <= AutomationConstants.LDEV_BATCH_MAX_GAP
+                and ldev_id - ranges[-1][0] < AutomationConstants.LDEV_PAGE_SIZE
+            ):
+                ranges[-1].append(ldev_id)
+            else:
+                ranges.append([ldev_id])
+        if not ranges:
+            return {}
+
+        def fetch(ids):
+            if len(ids) == 1:
+                return {ids[0]: self.get_volume_by_id(ids[0])}
+            # at most this many defined LDEVs lie between the first and last id
+            page = self._get_volume_page("defined", ids[0], ids[-1] - ids[0] + 1)
+            wanted = set(ids)
+            found = {v.ldevId: v for v in page.data if v.ldevId in wanted}
+            for ldev_id in ids:
+                if ldev_id not in found:
+                    found[ldev_id] = self.get_volume_by_id(ldev_id)
+            return found
+
+        volumes = {}
+        executor = ThreadPoolExecutor(
+            max_workers=min(MAX_WORKER_THREADS, len(ranges)),
+            thread_name_prefix="FetchVolumesByIds",
+        )
+        try:
+            for found in executor.map(fetch, ranges):
+                volumes.update(found)
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            executor.shutdown(wait=True)
         return volumes
 
     @log_entry_exit
@@ -171,7 +252,9 @@ class VSPVolumeDirectGateway:
 
         end_point = self.end_points.GET_LDEVS_BY_POOL_ID.format(pool_id)
         vol_data = self.rest_api.get(end_point)
-        return VSPVolumesInfo(dicts_to_dataclass_list(vol_data["data"], VSPVolumeInfo))
+        return VSPVolumesInfo(
+            dicts_to_dataclass_list(vol_data["data"], VSPVolumeInfo, compact=True)
+        )
 
     @log_entry_exit
     def get_volume_by_id(self, ldev_id, include_drs=True) -> VSPVolumeInfo:
@@ -412,11 +495,16 @@ class VSPVolumeDirectGateway:
         return self.rest_api.delete(end_point)
 
     @log_entry_exit
-    def get_free_ldev_from_meta(self):
+    def get_free_ldev_from_meta(self, exclude=None):
         end_point = self.end_points.GET_FREE_LDEV_FROM_META
+        if exclude:
+            # the first free ldevs may all be excluded, read a longer list
+            end_point = self.end_points.GET_FREE_LDEVS_FROM_META_RES.format(0)
         vol_data = self.rest_api.get(end_point)
         # logger.writeDebug(f"Free Ldevs from meta: {vol_data}")
         for item in vol_data["data"]:
+            if exclude and item.get("ldevId") in exclude:
+                continue
             if "virtualLdevId" not in item:
                 undefined_vol_info = VSPUndefinedVolumeInfo(**item)
                 return VSPUndefinedVolumeInfoList(data=[undefined_vol_info])
@@ -622,6 +710,20 @@ class VSPVolumeDirectGateway:
             return VolumeQosParamsOutput(**qos_data.get("data")[0].get("qos"))
         return None
 
+    @log_entry_exit
+    def get_qos_settings_range(self, head_ldev_id, count):
+        """Returns the QoS settings of a range of LDEVs keyed by LDEV ID."""
+        end_point = self.end_points.GET_QOS_SETTINGS_RANGE.format(head_ldev_id, count)
+
+        qos_data = self.rest_api.get(end_point)
+        qos_settings = {}
+        for ldev in qos_data.get("data", []):
+            qos = ldev.get("qos")
+            qos_settings[ldev.get("ldevId")] = (
+                VolumeQosParamsOutput(**qos) if qos else None
+            )
+        return qos_settings
+
     @log_entry_exit
     def change_volume_status(self, ldev_id, is_block=False):
 
@@ -788,7 +890,9 @@ class VSPVolumeDirectGateway:
         )
         end_point = self.end_points.GET_LDEVS.format(query_params)
         vol_data = self.rest_api.get(end_point)
-        return VSPVolumesInfo(dicts_to_dataclass_list(vol_data["data"], VSPVolumeInfo))
+        return VSPVolumesInfo(
+            dicts_to_dataclass_list(vol_data["data"], VSPVolumeInfo, compact=True)
+        )
 
     @log_entry_exit
     def stop_volume_format(self):
@@ -139,3 +139,5 @@ class VSPVolValidationMsg(Enum):
         "Both ldev_id and vldev_id are required for this operation."
     )
     STOP_ALL_FORMAT_REQD = "should_stop_all_volume_format and should_format_volume both can't be declared together."
+    SPEC_OR_VOLUMES_REQD = "Exactly one of spec or volumes should be provided."
+    DUPLICATE_LDEV_IN_VOLUMES = "LDEV {} is specified more than once in volumes."
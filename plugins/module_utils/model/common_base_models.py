@@ -1,6 +1,8 @@
-from dataclasses import dataclass, field, asdict
+import copy
+from dataclasses import dataclass, field, fields
 from typing import Optional, List, get_type_hints, get_origin, get_args, Union
 import re
+import threading
 
 try:
     from ..common.hv_log import Log
@@ -54,6 +56,130 @@ def camel_to_snake(name: str) -> str:
     return name.lower()
 
 
+def _none_default(hint):
+    """Returns the value camel_to_snake_dict reports for a None field of type hint."""
+    field_type = get_origin(hint)
+    actual_types = set(get_args(hint)) if field_type is Union else set()
+    actual_types.discard(type(None))  # Remove NoneType if Optional
+
+    if hint == str or field_type == str or str in actual_types:
+        return ""
+    elif hint == int or field_type == int or int in actual_types:
+        return -1
+    elif hint == float or field_type == float or float in actual_types:
+        return -1.0
+    elif hint == bool or field_type == bool or bool in actual_types:
+        return None
+    elif (
+        field_type == list
+        or hint == List
+        or any(get_origin(t) == list for t in actual_types)
+    ):
+        return []
+    elif (
+        field_type == dict
+        or hint == dict
+        or any(get_origin(t) == dict for t in actual_types)
+    ):
+        return {}
+    return None  # Default for unsupported types
+
+
+class ConversionPlan:
+    """
+    Everything camel_to_snake_dict and to_dict need to know about a dataclass,
+    derived once per class instead of once per instance: the snake case key
+    and the None default of each field, and the fields asdict would visit.
+    """
+
+    _plans = {}
+
+    def __init__(self, cls):
+        type_hints = get_type_hints(cls)
+        # (field name, snake case key, default for None, default is mutable)
+        self.snake_fields = []
+        for key in cls.__dataclass_fields__.keys():
+            default = _none_default(type_hints.get(key))
+            self.snake_fields.append(
+                (key, camel_to_snake(key), default, isinstance(default, (list, dict)))
+            )
+        self.dict_fields = [f.name for f in fields(cls)]
+
+    @classmethod
+    def of(cls, dataclass_type):
+        plan = cls._plans.get(dataclass_type)
+        if plan is None:
+            plan = cls._plans[dataclass_type] = cls(dataclass_type)
+        return plan
+
+
+_ATOMIC_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+
+def _asdict_value(value):
+    """Same result as dataclasses.asdict, using the cached field lists."""
+    if isinstance(value, _ATOMIC_TYPES):
+        return value
+    if hasattr(type(value), "__dataclass_fields__"):
+        return {
+            name: _asdict_value(getattr(value, name))
+            for name in ConversionPlan.of(type(value)).dict_fields
+        }
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return type(value)(*[_asdict_value(v) for v in value])
+    if isinstance(value, (list, tuple)):
+        return type(value)(_asdict_value(v) for v in value)
+    if isinstance(value, dict):
+        items = ((_asdict_value(k), _asdict_value(v)) for k, v in value.items())
+        if hasattr(type(value), "default_factory"):
+            return type(value)(value.default_factory, items)
+        return type(value)(items)
+    return copy.deepcopy(value)
+
+
+_COMPACT_RECORDS = {}
+_COMPACT_RECORDS_LOCK = threading.Lock()
+
+
+def compact_record(cls):
+    """
+    Returns a subclass of the SingleBaseClass dataclass cls that stores its
+    fields in __slots__. Payload keys that are not fields still become
+    attributes, the instance __dict__ only gets created for them. Instances
+    are cls instances, compare equal to cls instances with the same fields
+    and show the same repr, they just take a fraction of the memory.
+    """
+    compact = _COMPACT_RECORDS.get(cls)
+    if compact is not None:
+        return compact
+    with _COMPACT_RECORDS_LOCK:
+        # another thread may have built it while this one waited
+        compact = _COMPACT_RECORDS.get(cls)
+        if compact is None:
+            compact = _build_compact_record(cls)
+            _COMPACT_RECORDS[cls] = compact
+    return compact
+
+
+def _build_compact_record(cls):
+    names = tuple(f.name for f in fields(cls))
+    namespace = {
+        "__slots__": names,
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+    }
+    if cls.__dataclass_params__.eq:
+
+        def __eq__(self, other):
+            if type(other) not in (cls, compact):
+                return NotImplemented
+            return all(getattr(self, n) == getattr(other, n) for n in names)
+
+        namespace["__eq__"] = __eq__
+    compact = type(cls.__name__, (cls,), namespace)
+    return compact
+
+
 # Define a parent class with the common functionality
 
 
@@ -106,7 +232,9 @@ class SingleBaseClass:
                 setattr(self, key, value)
 
     def to_dict(self):
-        return asdict(self)
+        if not hasattr(type(self), "__dataclass_fields__"):
+            raise TypeError("asdict() should be called on dataclass instances")
+        return _asdict_value(self)
 
     def snake_to_camel(self, name: str) -> str:
         """
@@ -119,53 +247,20 @@ class SingleBaseClass:
         Convert a camel case string to snake case and include type-based default values.
         """
         new_dict = {}
-        type_hints = get_type_hints(type(self))
-
-        for (
-            key,
-            unused,
-        ) in self.__dataclass_fields__.items():  # pylint: disable=no-member
+        for key, cased_key, default, mutable in ConversionPlan.of(
+            type(self)
+        ).snake_fields:
             value = getattr(self, key)
-            cased_key = camel_to_snake(key)
 
             # Determine the value to use
             if value is None:
-                origin = type_hints.get(key)
-                field_type = get_origin(origin)
-                actual_types = set(get_args(origin)) if field_type is Union else set()
-                actual_types.discard(type(None))  # Remove NoneType if Optional
-
-                if origin == str or field_type == str or str in actual_types:
-                    value = ""
-                elif origin == int or field_type == int or int in actual_types:
-                    value = -1
-                elif origin == float or field_type == float or float in actual_types:
-                    value = -1.0
-                elif origin == bool or field_type == bool or bool in actual_types:
-                    value = None
-                elif (
-                    field_type == list
-                    or origin == List
-                    or any(get_origin(t) == list for t in actual_types)
-                ):
-                    value = []
-                elif (
-                    field_type == dict
-                    or origin == dict
-                    or any(get_origin(t) == dict for t in actual_types)
-                ):
-                    value = {}
-                else:
-                    value = None  # Default for unsupported types
+                value = type(default)() if mutable else default
 
             # Handle nested SingleBaseClass instances or list of them
-            if (
-                isinstance(value, list)
-                and value
-                and isinstance(value[0], SingleBaseClass)
-            ):
-                value = [item.camel_to_snake_dict() for item in value]
-            if isinstance(value, SingleBaseClass):
+            elif isinstance(value, list):
+                if value and isinstance(value[0], SingleBaseClass):
+                    value = [item.camel_to_snake_dict() for item in value]
+            elif isinstance(value, SingleBaseClass):
                 value = value.camel_to_snake_dict()
 
             new_dict[cased_key] = value
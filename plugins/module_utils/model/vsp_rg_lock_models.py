@@ -14,6 +14,7 @@ except ImportError:
 class VSPResourceGroupLockSpec(SingleBaseClass):
     # is_resource_group_locked: Optional[bool] = None
     lock_timeout_sec: Optional[int] = None
+    refresh_storage_cache: Optional[bool] = None
     secondary_connection_info: Optional[ConnectionInfo] = None
     name: Optional[str] = None
     id: Optional[int] = None
@@ -34,3 +35,4 @@ class VSPResourceGroupLockInfo(SingleBaseClass):
     remote_lock_token: Optional[str] = None
     locked_resource_groups: Optional[List[str]] = None
     remote_locked_resource_groups: Optional[List[str]] = None
+    lock_acquire_seconds: Optional[float] = None
@@ -1,3 +1,6 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor
+
 try:
     from ..gateway.gateway_factory import GatewayFactory
     from ..common.hv_constants import GatewayClassTypes
@@ -10,6 +13,7 @@ try:
         log_entry_exit,
         volume_id_to_hex_format,
     )
+    from ..common.ansible_common_constants import MAX_WORKER_THREADS
     from ..message.vsp_external_volume_msgs import VSPSExternalVolumeValidateMsg
 
 except ImportError:
@@ -25,10 +29,55 @@ except ImportError:
         log_entry_exit,
         volume_id_to_hex_format,
     )
+    from common.ansible_common_constants import MAX_WORKER_THREADS
 
 logger = Log()
 
 
+class ExternalPathGroupIndex:
+    """Lookup tables over the external path groups of one storage system."""
+
+    def __init__(self, path_groups):
+        self.path_groups = path_groups
+        self.by_path = {}
+        self.by_lun = {}
+        self.parity_group_ids = set()
+        for path_group in path_groups.data:
+            if path_group.externalPaths is not None:
+                for path in path_group.externalPaths.data:
+                    self.by_path.setdefault((path.portId, path.externalWwn), []).append(
+                        path_group
+                    )
+            for epg in path_group.externalParityGroups or []:
+                externalParityGroupId = epg.get("externalParityGroupId")
+                if externalParityGroupId is None:
+                    continue
+                self.parity_group_ids.add(externalParityGroupId)
+                for extlun in epg.get("externalLuns") or []:
+                    if extlun is None:
+                        continue
+                    key = (
+                        extlun.get("portId"),
+                        extlun.get("externalWwn"),
+                        extlun.get("externalLun"),
+                    )
+                    if None in key:
+                        continue
+                    # keep the first match, as the linear scans did
+                    self.by_lun.setdefault(key, (path_group, epg))
+
+    def paths(self):
+        """Distinct (portId, externalWwn) pairs in path group order."""
+        return list(self.by_path)
+
+    def path_groups_with_path(self, portId, externalWwn):
+        return self.by_path.get((portId, externalWwn), [])
+
+    def find_lun(self, portId, externalWwn, externalLun):
+        """Returns the (path group, external parity group) mapping the LUN."""
+        return self.by_lun.get((portId, externalWwn, externalLun), (None, None))
+
+
 class VSPExternalVolumeProvisioner:
 
     def __init__(self, connection_info, serial):
@@ -45,6 +94,7 @@ class VSPExternalVolumeProvisioner:
         self.storage_prov = VSPStorageSystemProvisioner(connection_info)
         self.connection_info = connection_info
         self.connection_type = connection_info.connection_type
+        self.path_group_index = None
         self.serial = serial
         if self.serial is None:
             self.serial = self.get_storage_serial_number()
@@ -86,12 +136,46 @@ class VSPExternalVolumeProvisioner:
         logger.writeDebug("20250528 epg={}", epg)
         return epg
 
+    def get_external_path_group_index(self):
+        if self.path_group_index is None:
+            path_groups = self.gateway.get_external_path_groups()
+            if path_groups is None:
+                return None
+            self.path_group_index = ExternalPathGroupIndex(path_groups)
+        return self.path_group_index
+
+    def invalidate_external_path_group_index(self):
+        self.path_group_index = None
+
+    @staticmethod
+    def fetch_concurrently(fetch, keys, thread_name_prefix):
+        """Calls fetch for every key in parallel, returns a dict key -> result."""
+        results = {}
+        if not keys:
+            return results
+        executor = ThreadPoolExecutor(
+            max_workers=MAX_WORKER_THREADS,
+            thread_name_prefix=thread_name_prefix,
+        )
+        try:
+            futures = {key: executor.submit(fetch, *key) for key in keys}
+            for key, future in futures.items():
+                results[key] = future.result()
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            executor.shutdown(wait=True)
+        return results
+
     @log_entry_exit
     def get_next_external_parity_group(self):
-        epgs = self.pg_gateway.get_all_external_parity_groups()
-        pgids = []
-        for epg in epgs.data:
-            pgids.append(epg.externalParityGroupId)
+        index = self.get_external_path_group_index()
+        if index is not None:
+            pgids = index.parity_group_ids
+        else:
+            epgs = self.pg_gateway.get_all_external_parity_groups()
+            pgids = set(epg.externalParityGroupId for epg in epgs.data)
 
         ii = 1
         pgid = "1-" + str(ii)
@@ -108,83 +192,32 @@ class VSPExternalVolumeProvisioner:
         logger.writeDebug("20250228 portId={}", portId)
         logger.writeDebug("20250228 externalWwn={}", externalWwn)
 
-        external_path_groups = self.gateway.get_external_path_groups()
-        if external_path_groups is None:
+        index = self.get_external_path_group_index()
+        if index is None:
             return
 
-        result = []
-        for external_path_group in external_path_groups.data:
-            externalPaths = external_path_group.externalPaths
-            logger.writeDebug("20250228 externalPaths={}", externalPaths)
-            if externalPaths is None:
-                continue
-            for externalPath in externalPaths.data:
-                if portId != externalPath.portId:
-                    continue
-                if externalWwn != externalPath.externalWwn:
-                    continue
-                result.append(external_path_group)
-
-        return result
+        return list(index.path_groups_with_path(portId, externalWwn))
 
     @log_entry_exit
     def select_external_path_group(self, extvol):
-        portId = extvol.portId
-        externalWwn = extvol.externalWwn
-        logger.writeDebug("20250228 portId={}", portId)
-        logger.writeDebug("20250228 externalWwn={}", externalWwn)
+        external_path_groups = self.select_external_path_groups(extvol)
+        if external_path_groups:
+            return external_path_groups[0]
 
-        external_path_groups = self.gateway.get_external_path_groups()
-        if external_path_groups is None:
-            return
+    @log_entry_exit
+    def get_ldev_ids_in_external_parity_groups(self, external_parity_group_ids):
+        """Returns a dict of external parity group ID -> LDEV IDs carved from it."""
 
-        for external_path_group in external_path_groups.data:
-            externalPaths = external_path_group.externalPaths
-            logger.writeDebug("20250228 externalPaths={}", externalPaths)
-            if externalPaths is None:
-                continue
-            for externalPath in externalPaths.data:
-                if portId != externalPath.portId:
-                    continue
-                if externalWwn != externalPath.externalWwn:
-                    continue
-                return external_path_group
+        def fetch_ldev_ids(externalParityGroupId):
+            eprg = self.pg_gateway.get_external_parity_group(externalParityGroupId)
+            return [space.ldevId for space in eprg.spaces if space.ldevId is not None]
 
-    @log_entry_exit
-    # find the external_parity_group in the external_path_group, then get the ldevids from it
-    def get_ldev_ids_in_external_path_group(
-        self, external_path_groups, externalLun, portId, externalWwn
-    ):
-        for external_path_group in external_path_groups:
-            for epg in external_path_group.externalParityGroups:
-                externalLuns = epg.get("externalLuns")
-                if externalLuns is None:
-                    continue
-                for extlun in externalLuns:
-                    if extlun is None:
-                        continue
-                    pid = extlun.get("portId")
-                    wwn = extlun.get("externalWwn")
-                    lun = extlun.get("externalLun")
-                    if pid is None or pid != portId:
-                        continue
-                    if wwn is None or wwn != externalWwn:
-                        continue
-                    if lun is None or lun != externalLun:
-                        continue
-                    externalParityGroupId = epg.get("externalParityGroupId")
-                    if externalParityGroupId is None:
-                        continue
-                    eprg = self.pg_gateway.get_external_parity_group(
-                        externalParityGroupId
-                    )
-                    ldevIds = []
-                    for space in eprg.spaces:
-                        ldevId = space.ldevId
-                        if ldevId is not None:
-                            ldevIds.append(ldevId)
-                    return ldevIds
-        return []
+        ldev_ids = self.fetch_concurrently(
+            fetch_ldev_ids,
+            [(epg_id,) for epg_id in external_parity_group_ids],
+            "FetchExtParityGroups",
+        )
+        return {key[0]: value for key, value in ldev_ids.items()}
 
     @log_entry_exit
     # find the external_parity_group in the external_path_group
@@ -215,22 +248,35 @@ class VSPExternalVolumeProvisioner:
     def get_all_external_volumes(self):
         allExtvols = []
         allExtvolsObj = []
-        external_path_groups = self.gateway.get_external_path_groups()
-        if external_path_groups is None:
+        index = self.get_external_path_group_index()
+        if index is None:
             return None, None
 
-        for external_path_group in external_path_groups.data:
+        # every external path is queried once, in parallel, even when it
+        # belongs to several path groups
+        extvols_by_path = self.fetch_concurrently(
+            self.gateway.get_external_volumes_with_extpath,
+            index.paths(),
+            "FetchExtVolumes",
+        )
+
+        # get the external volumes for the externalPath
+        # ( filter by externalPath.portId, externalPath.externalWwn )
+        seen_paths = set()
+        for external_path_group in index.path_groups.data:
             externalPaths = external_path_group.externalPaths
-            logger.writeDebug("20250228 externalPaths={}", externalPaths)
             if externalPaths is None:
                 continue
             for externalPath in externalPaths.data:
-                extvols = self.gateway.get_external_volumes_with_extpath(
-                    externalPath.portId, externalPath.externalWwn
-                )
-                # get the external volumes for the externalPath
-                # ( filter by externalPath.portId, externalPath.externalWwn )
+                path = (externalPath.portId, externalPath.externalWwn)
+                extvols = extvols_by_path.get(path)
+                if extvols is None:
+                    continue
+                copies = path in seen_paths
+                seen_paths.add(path)
                 for extvol in extvols.data:
+                    if copies:
+                        extvol = copy.copy(extvol)
                     externalVolumeInfo = extvol.externalVolumeInfo
                     extvol.externalLdevId = int(externalVolumeInfo[-4:], 16)
                     extvol.externalVolumeCapacityInMb = (
@@ -241,25 +287,31 @@ class VSPExternalVolumeProvisioner:
                         external_path_group.externalSerialNumber
                     )
                     extvol.externalPathGroupId = external_path_group.externalPathGroupId
+                    allExtvolsObj.append(extvol)
 
-                    # look for the external volume from the external_parity_group in the external_path_group
-                    extvol.ldevIds = self.get_ldev_ids_in_external_path_group(
-                        external_path_groups.data,
-                        extvol.externalLun,
-                        extvol.portId,
-                        extvol.externalWwn,
-                    )
-                    logger.writeDebug("20250228 extvol.ldevIds={}", extvol.ldevIds)
-                    logger.writeDebug(
-                        "20250228 extvol.externalLdevId={}", extvol.externalLdevId
-                    )
+        # look for the external volume from the external_parity_group in the external_path_group
+        epg_ids = {}
+        for extvol in allExtvolsObj:
+            unused, epg = index.find_lun(
+                extvol.portId, extvol.externalWwn, extvol.externalLun
+            )
+            if epg is not None:
+                epg_ids[id(extvol)] = epg.get("externalParityGroupId")
+        ldev_ids = self.get_ldev_ids_in_external_parity_groups(set(epg_ids.values()))
+
+        for extvol in allExtvolsObj:
+            epg_id = epg_ids.get(id(extvol))
+            extvol.ldevIds = list(ldev_ids[epg_id]) if epg_id is not None else []
+            logger.writeDebug("20250228 extvol.ldevIds={}", extvol.ldevIds)
+            logger.writeDebug(
+                "20250228 extvol.externalLdevId={}", extvol.externalLdevId
+            )
 
-                    item = extvol.camel_to_snake_dict()
-                    item["external_ldev_id_hex"] = volume_id_to_hex_format(
-                        item.get("external_ldev_id")
-                    )
-                    allExtvols.append(item)
-                    allExtvolsObj.append(extvol)
+            item = extvol.camel_to_snake_dict()
+            item["external_ldev_id_hex"] = volume_id_to_hex_format(
+                item.get("external_ldev_id")
+            )
+            allExtvols.append(item)
 
         # logger.writeDebug("20250228 extvols={}", allExtvols)
         return allExtvols, allExtvolsObj
@@ -333,15 +385,15 @@ class VSPExternalVolumeProvisioner:
 
     @log_entry_exit
     def get_extern_path_groups(self, ext_serial):
-        resp = self.gateway.get_external_path_groups()
-        if resp is None:
+        index = self.get_external_path_group_index()
+        if index is None:
             return
 
-        extern_path_groups = []
-        for epg in resp.data:
-            if epg.externalSerialNumber != ext_serial:
-                continue
-            extern_path_groups.append(epg)
+        extern_path_groups = [
+            epg
+            for epg in index.path_groups.data
+            if epg.externalSerialNumber == ext_serial
+        ]
 
         logger.writeDebug("20250228 extern_path_groups={}", extern_path_groups)
         return extern_path_groups
@@ -448,6 +500,7 @@ class VSPExternalVolumeProvisioner:
             self.pg_gateway.delete_external_parity_group_force(
                 ext_vol.externalParityGroupId
             )
+            self.invalidate_external_path_group_index()
             return [], None
 
         return [], VSPSExternalVolumeValidateMsg.NO_PARITYGRP.value
@@ -480,31 +533,16 @@ class VSPExternalVolumeProvisioner:
     def find_external_parity_group(
         self, external_path_groups, portId, externalWwn, lunId
     ):
+        index = self.get_external_path_group_index()
+        path_group, epg = index.find_lun(portId, externalWwn, lunId)
+        if epg is not None and path_group in external_path_groups:
+            return (
+                path_group.externalPathGroupId,
+                epg["externalParityGroupId"],
+                epg,
+            )
 
-        for external_path_group in external_path_groups:
-            externalPathGroupId = external_path_group.externalPathGroupId
-            epgs = external_path_group.externalParityGroups
-            if epgs is None:
-                continue
-            for epg in epgs:
-                logger.writeDebug("20250228 epg={}", epg)
-                for externalLun in epg["externalLuns"]:
-                    logger.writeDebug("20250228 externalLun={}", externalLun)
-                    if portId != externalLun["portId"]:
-                        continue
-                    if externalWwn != externalLun["externalWwn"]:
-                        continue
-                    if (
-                        externalLun.get("externalLun")
-                        and lunId == externalLun["externalLun"]
-                    ):
-                        return (
-                            external_path_group.externalPathGroupId,
-                            epg["externalParityGroupId"],
-                            epg,
-                        )
-
-        return externalPathGroupId, None, None
+        return external_path_groups[-1].externalPathGroupId, None, None
 
     @log_entry_exit
     def create_external_volume(self, ldev_id, ext_serial, external_ldev_id):
@@ -579,6 +617,7 @@ class VSPExternalVolumeProvisioner:
                 externalWwn,
                 lunId,
             )
+            self.invalidate_external_path_group_index()
 
             # if it fails, check the lunId, which is the externalLun
             # loop thru the externalParityGroups in the externalPathGroups
@@ -115,6 +115,25 @@ class GADPairProvisioner:
         vsms = rr_prov.get_vsm_all()
         return vsms
 
+    @log_entry_exit
+    def get_volumes_by_ids_remote(self, spec, ldev_ids):
+        return self.get_gad_helper_for_svol(spec).get_volumes_by_ids(ldev_ids)
+
+    @log_entry_exit
+    def get_resource_groups_remote(self, spec):
+        return self.get_gad_helper_for_svol(spec).get_resource_groups()
+
+    def get_gad_helper_for_svol(self, spec):
+        secondary_storage_connection_info = spec.secondary_storage_connection_info
+        secondary_storage_connection_info.connection_type = ConnectionTypes.DIRECT
+        if spec.secondary_storage_serial_number is None:
+            spec.secondary_storage_serial_number = self.gateway.get_secondary_serial(
+                spec
+            )
+        return GadHelperForSvol(
+            secondary_storage_connection_info, spec.secondary_storage_serial_number
+        )
+
     @log_entry_exit
     def get_vol_remote(self, spec, ldev):
         secondary_storage_connection_info = spec.secondary_storage_connection_info
@@ -1012,6 +1031,14 @@ class GADPairProvisioner:
     def get_resource_group_by_id(self, resourceGroupId):
         return self.rg_gateway.get_resource_group_by_id(resourceGroupId)
 
+    @log_entry_exit
+    def get_resource_groups(self):
+        return self.rg_gateway.get_resource_groups()
+
+    @log_entry_exit
+    def get_volumes_by_ids(self, ldev_ids):
+        return self.vol_gw.get_volumes_by_ids(ldev_ids)
+
     @log_entry_exit
     def get_volume_by_id(self, primary_volume_id):
 
@@ -1037,11 +1064,19 @@ class GadHelperForSvol(RemoteReplicationHelperForSVol):
     def get_vsm_all(self):
         return self.rg_gateway.get_vsm_all()
 
+    @log_entry_exit
+    def get_resource_groups(self):
+        return self.rg_gateway.get_resource_groups()
+
     @log_entry_exit
     def get_volume_by_id(self, id):
         vol = self.vol_gateway.get_volume_by_id(id)
         return vol
 
+    @log_entry_exit
+    def get_volumes_by_ids(self, ldev_ids):
+        return self.vol_gateway.get_volumes_by_ids(ldev_ids)
+
     @log_entry_exit
     def delete_volume(self, secondary_vol_id, volume=None):
         if volume is None:
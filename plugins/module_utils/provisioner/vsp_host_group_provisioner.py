@@ -1,3 +1,4 @@
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
@@ -18,14 +19,51 @@ except ImportError:
     from gateway.vsp_host_group_gateway import VSPHostGroupDirectGateway
 
 
+class HostGroupIndex:
+    """Lookup tables over the full host group list of one storage system."""
+
+    def __init__(self, all_hgs):
+        self.all_hgs = all_hgs
+        self.by_port_and_number = {}
+        for hg in all_hgs.data:
+            # keep the first match, as the linear scan did
+            self.by_port_and_number.setdefault((hg.portId, hg.hostGroupNumber), hg)
+
+
 class VSPHostGroupProvisioner:
 
+    # built once per process, storage system and user, shared by all
+    # instances and dropped whenever host groups or their LUNs change
+    _hg_index_cache = {}
+    _hg_index_lock = threading.Lock()
+
     def __init__(self, connection_info):
         self.gateway = VSPHostGroupDirectGateway(connection_info)
         self.connection_info = connection_info
         self.serial = None
         self.all_hgs = None
 
+    def _host_group_index_key(self):
+        return (self.connection_info.address, self.connection_info.username)
+
+    def get_host_group_index(self):
+        key = self._host_group_index_key()
+        with self._hg_index_lock:
+            index = self._hg_index_cache.get(key)
+            if index is None:
+                all_hgs = self.get_all_host_groups(self.serial)
+                if not all_hgs:
+                    return None
+                index = HostGroupIndex(all_hgs)
+                self._hg_index_cache[key] = index
+        self.all_hgs = index.all_hgs
+        return index
+
+    def invalidate_host_group_index(self):
+        with self._hg_index_lock:
+            self._hg_index_cache.pop(self._host_group_index_key(), None)
+        self.all_hgs = None
+
     @log_entry_exit
     def get_host_groups(
         self,
@@ -93,16 +131,13 @@ class VSPHostGroupProvisioner:
     def get_one_host_group_using_hg_port_id(self, port_id, hg_id):
         logger = Log()
 
-        if not self.all_hgs:
-            self.all_hgs = self.get_all_host_groups(self.serial)
-
-        logger.writeDebug(f"self.all_hgs{self.all_hgs}")
-        if self.all_hgs:
-            for hg in self.all_hgs.data:
-                if hg.portId == port_id and hg.hostGroupNumber == hg_id:
-                    hg.port = hg.portId
-                    return hg
-        return None
+        index = self.get_host_group_index()
+        hg = index.by_port_and_number.get((port_id, hg_id)) if index else None
+        if hg is None:
+            return None
+        hg.port = hg.portId
+        logger.writeDebug(f"matched host group {hg}")
+        return hg
 
     @log_entry_exit
     def get_all_host_groups(self, serial):
@@ -121,6 +156,7 @@ class VSPHostGroupProvisioner:
         hg_number=None,
     ):
         logger = Log()
+        self.invalidate_host_group_index()
         try:
             errors, comments = self.gateway.create_host_group(
                 port,
@@ -140,6 +176,7 @@ class VSPHostGroupProvisioner:
 
     @log_entry_exit
     def delete_host_group(self, hg, is_delete_all_luns):
+        self.invalidate_host_group_index()
         hg = self.gateway.delete_host_group(hg, is_delete_all_luns)
 
     @log_entry_exit
@@ -152,18 +189,22 @@ class VSPHostGroupProvisioner:
 
     @log_entry_exit
     def add_luns_to_host_group(self, hg, luns):
+        self.invalidate_host_group_index()
         return self.gateway.add_luns_to_host_group(hg, luns)
 
     @log_entry_exit
     def add_lun_paths_to_host_group(self, hg, lun_paths):
+        self.invalidate_host_group_index()
         return self.gateway.add_lun_paths_to_host_group(hg, lun_paths)
 
     @log_entry_exit
     def delete_luns_from_host_group(self, hg, luns):
+        self.invalidate_host_group_index()
         return self.gateway.delete_luns_from_host_group(hg, luns)
 
     @log_entry_exit
     def set_host_mode(self, hg, host_mode, host_mode_options):
+        self.invalidate_host_group_index()
         self.gateway.set_host_mode(hg, host_mode, host_mode_options)
 
     @log_entry_exit
@@ -227,6 +268,7 @@ class VSPHostGroupProvisioner:
             executor.shutdown(wait=True)
 
         all_comments, all_errors = [], []
+        self.invalidate_host_group_index()
 
         if sub_state == VSPHostGroupConstant.STATE_PRESENT_LDEV:
 
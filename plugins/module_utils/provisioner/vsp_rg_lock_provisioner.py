@@ -5,6 +5,8 @@ try:
     from ..common.hv_constants import GatewayClassTypes, ConnectionTypes
     from ..common.hv_log import Log
     from ..common.ansible_common import log_entry_exit
+    from ..common.hv_job_waiter import JobWaiter, JobTimeoutError
+    from ..common.ansible_common_constants import RG_LOCK_WAIT_TIMEOUT
     from ..model.vsp_rg_lock_models import (
         VSPResourceGroupNameId,
         VSPResourceGroupLockInfo,
@@ -17,6 +19,8 @@ except ImportError:
     from common.hv_constants import GatewayClassTypes, ConnectionTypes
     from common.hv_log import Log
     from common.ansible_common import log_entry_exit
+    from common.hv_job_waiter import JobWaiter, JobTimeoutError
+    from common.ansible_common_constants import RG_LOCK_WAIT_TIMEOUT
     from model.vsp_rg_lock_models import (
         VSPResourceGroupNameId,
         VSPResourceGroupLockInfo,
@@ -27,6 +31,7 @@ logger = Log()
 
 
 class VSPResourceGroupLockProvisioner:
+    lock_waiter = JobWaiter(RG_LOCK_WAIT_TIMEOUT)
 
     def __init__(self, connection_info, serial=None):
         self.gateway = GatewayFactory.get_gateway(
@@ -68,9 +73,16 @@ class VSPResourceGroupLockProvisioner:
     @log_entry_exit
     def lock_resource_group_direct(self, spec):
         """Lock Resource Group"""
+        start_time = time.monotonic()
         lock_session_id, lock_token, remote_lock_session_id, remote_lock_token = (
             self.gateway.lock_resource_group(spec)
         )
+        if spec.refresh_storage_cache:
+            self.gateway.refresh_storage_cache(lock_token, remote_lock_token)
+        lock_acquire_seconds = round(time.monotonic() - start_time, 2)
+        logger.writeDebug(
+            f"PROV:lock_resource_group_direct:lock_acquire_seconds={lock_acquire_seconds}"
+        )
         locked_rgs = self.get_locked_resource_groups(lock_session_id)
 
         remote_locked_rgs = None
@@ -86,6 +98,7 @@ class VSPResourceGroupLockProvisioner:
             remote_lock_token,
             locked_rgs,
             remote_locked_rgs,
+            lock_acquire_seconds,
         )
 
     @log_entry_exit
@@ -105,29 +118,43 @@ class VSPResourceGroupLockProvisioner:
         if is_rg_locked:
             return rg
         else:
+            start_time = time.monotonic()
             rg_id = self.gateway.lock_resource_group(spec)
             logger.writeDebug(
                 f"PROV:lock_resource_group_gateway:is_rg_locked={is_rg_locked} rg_id={rg_id}"
             )
-            time.sleep(60)
-            new_rg = self.get_resource_group_by_id(rg_id)
-            if new_rg and new_rg.locked is True:
-                return new_rg
-            else:
-                retry_count = 0
-                while retry_count < 5:
-                    time.sleep(30)
-                    new_rg = self.get_resource_group_by_id(rg_id)
-                    logger.writeDebug(f"try number {retry_count + 1}")
-                    logger.writeDebug(f"new_rg={new_rg}")
-                    if new_rg and new_rg.locked is True:
-                        return new_rg
-                    else:
-                        retry_count += 1
-                if retry_count == 5:
-                    err_msg = "Did not get updated resource group after 5 retries. So waited for 3.5 minutes."
-                    logger.writeError(err_msg)
-                    return new_rg
+            new_rg = self.wait_for_lock_state(rg_id, locked=True)
+            logger.writeDebug(
+                "PROV:lock_resource_group_gateway:lock_acquire_seconds={:.2f}",
+                time.monotonic() - start_time,
+            )
+            return new_rg
+
+    @log_entry_exit
+    def wait_for_lock_state(self, rg_id, locked):
+        """
+        Polls the resource group until its lock state matches locked. The
+        first check is sent right away and the interval grows after that.
+        Returns the last resource group read once the deadline has passed.
+        """
+        last_rg = [None]
+
+        def probe():
+            rg = self.get_resource_group_by_id(rg_id)
+            last_rg[0] = rg
+            logger.writeDebug(f"PROV:wait_for_lock_state:rg={rg}")
+            if rg is not None and (rg.locked is True) == locked:
+                return rg
+            return None
+
+        try:
+            return self.lock_waiter.wait(probe)
+        except JobTimeoutError:
+            logger.writeError(
+                f"Resource group {rg_id} did not reach the requested lock state "
+                f"in {self.lock_waiter.timeout} seconds."
+            )
+            return last_rg[0]
 
     @log_entry_exit
     def unlock_resource_group_direct(self, spec):
@@ -158,8 +185,7 @@ class VSPResourceGroupLockProvisioner:
             logger.writeDebug(
                 f"PROV:unlock_resource_group_gateway:is_rg_locked={is_rg_locked} rg_id={rg_id}"
             )
-            time.sleep(60)
-            return self.get_resource_group_by_id(rg_id)
+            return self.wait_for_lock_state(rg_id, locked=False)
         else:
             return VSPResourceGroupValidateMsg.RG_ALREADY_UNLOCKED.value
 
@@ -1,5 +1,4 @@
 from typing import Optional, Any
-import time
 from typing import List, Dict
 
 try:
@@ -7,6 +6,11 @@ try:
     from ..gateway.gateway_factory import GatewayFactory
     from ..common.hv_constants import GatewayClassTypes
     from ..common.hv_log import Log
+    from ..common.hv_pair_state_watcher import PairStateWatcher
+    from ..common.ansible_common_constants import (
+        SNAPSHOT_PAIR_WAIT_TIMEOUT,
+        SNAPSHOT_RESTORE_WAIT_TIMEOUT,
+    )
     from ..common.vsp_constants import AutomationConstants
     from ..common.vsp_constants import (
         PairStatus,
@@ -33,6 +37,11 @@ except ImportError:
     from gateway.gateway_factory import GatewayFactory
     from common.hv_constants import GatewayClassTypes
     from common.hv_log import Log
+    from common.hv_pair_state_watcher import PairStateWatcher
+    from common.ansible_common_constants import (
+        SNAPSHOT_PAIR_WAIT_TIMEOUT,
+        SNAPSHOT_RESTORE_WAIT_TIMEOUT,
+    )
     from common.vsp_constants import AutomationConstants
     from common.vsp_constants import PairStatus, VolumePayloadConst, DEFAULT_NAME_PREFIX
     from message.vsp_snapshot_msgs import VSPSnapShotValidateMsg
@@ -54,6 +63,9 @@ except ImportError:
 
 # @LogDecorator.debug_methods
 class VSPHtiSnapshotProvisioner:
+    pair_watcher = PairStateWatcher(SNAPSHOT_PAIR_WAIT_TIMEOUT)
+    restore_watcher = PairStateWatcher(SNAPSHOT_RESTORE_WAIT_TIMEOUT)
+
     def __init__(self, connection_info, serial=None):
         self.logger = Log()
         self.gateway = GatewayFactory.get_gateway(
@@ -89,6 +101,24 @@ class VSPHtiSnapshotProvisioner:
             else:
                 raise ValueError(str(e))
 
+    @log_entry_exit
+    def get_one_snapshot_status(self, pvol: int, mirror_unit_id: int):
+        # status only read used while polling, the host group and
+        # nvm subsystem details are not filled and the GET cache is skipped
+        return self.gateway.get_one_snapshot(pvol, mirror_unit_id, fresh=True)
+
+    def wait_for_snapshot_status(self, pvol, mirror_unit_id, status, watcher=None):
+        watcher = watcher or self.pair_watcher
+        ssp, reached = watcher.watch(
+            lambda: self.get_one_snapshot_status(pvol, mirror_unit_id), status
+        )
+        if not reached:
+            self.logger.writeDebug(
+                f"Snapshot {pvol},{mirror_unit_id} not in {status} after "
+                f"{watcher.timeout} seconds, last status: {ssp.status}"
+            )
+        return self.get_one_snapshot(pvol, mirror_unit_id)
+
     @log_entry_exit
     # this version of the get_one_snapshot will return None instead of raising an exception,
     # if the snapshot does not exist
@@ -710,14 +740,7 @@ class VSPHtiSnapshotProvisioner:
         enable_quick_mode = enable_quick_mode or False
         unused = self.gateway.resync_snapshot(pvol, mirror_unit_id, enable_quick_mode)
 
-        retryCount = 0
-        while retryCount < 30:
-            ssp = self.get_one_snapshot(pvol, mirror_unit_id)
-            if ssp.status == PairStatus.PAIR:
-                break
-            retryCount = retryCount + 1
-            self.logger.writeDebug(f"Polling for resync status: {retryCount}")
-            time.sleep(20)
+        ssp = self.wait_for_snapshot_status(pvol, mirror_unit_id, PairStatus.PAIR)
 
         self.connection_info.changed = True
         return ssp
@@ -750,8 +773,8 @@ class VSPHtiSnapshotProvisioner:
                 return self.get_snapshots_by_gid(sg.snapshotGroupId)
 
     @log_entry_exit
-    def get_snapshots_by_gid(self, gid):
-        return self.gateway.get_snapshots_using_group_id(gid)
+    def get_snapshots_by_gid(self, gid, fresh=False):
+        return self.gateway.get_snapshots_using_group_id(gid, fresh)
 
     @log_entry_exit
     def get_snapshot_grp_by_name(self, grp_name):
@@ -853,15 +876,8 @@ class VSPHtiSnapshotProvisioner:
                 pvol, mirror_unit_id, enable_quick_mode
             )
 
-            #  20240816 - SPLIT: poll every 20 seconds for 10 mins for split status before returning
-            retryCount = 0
-            while retryCount < 30:
-                ssp = self.get_one_snapshot(pvol, mirror_unit_id)
-                if ssp.status == PairStatus.PSUS:
-                    break
-                retryCount = retryCount + 1
-                self.logger.writeDebug(f"Polling for split status: {retryCount}")
-                time.sleep(20)
+            #  20240816 - SPLIT: poll for up to 10 mins for split status before returning
+            ssp = self.wait_for_snapshot_status(pvol, mirror_unit_id, PairStatus.PSUS)
             self.connection_info.changed = True
 
         if retention_period:
@@ -889,14 +905,9 @@ class VSPHtiSnapshotProvisioner:
             auto_split=auto_split,
         )
 
-        retryCount = 0
-        while retryCount < 3:
-            ssp = self.get_one_snapshot(pvol, mirror_unit_id)
-            if ssp.status == PairStatus.PAIR:
-                break
-            retryCount = retryCount + 1
-            self.logger.writeDebug(f"Polling for restore status: {retryCount}")
-            time.sleep(20)
+        ssp = self.wait_for_snapshot_status(
+            pvol, mirror_unit_id, PairStatus.PAIR, self.restore_watcher
+        )
 
         self.connection_info.changed = True
         return ssp
@@ -943,14 +954,21 @@ class VSPHtiSnapshotProvisioner:
         return ret_value
 
     def __check_snapshot_group_status(self, spec, status):
-        retryCount = 0
-        while retryCount < 30:
-            snapshots = self.get_snapshots_by_grp_name(spec.snapshot_group_name)
-            all_in_pair = all(
-                snapshot.status == status for snapshot in snapshots.snapshots.data
+        # one query for the whole group per poll, looked up by id when known
+        gid = spec.snapshot_group_id
+        if gid is None:
+            sg = self.get_snapshot_grp_by_name(spec.snapshot_group_name)
+            gid = sg.snapshotGroupId if sg else None
+        if gid is None:
+            return
+
+        def read():
+            group = self.get_snapshots_by_gid(gid, fresh=True)
+            return group.snapshots.data if group.snapshots else []
+
+        snapshots, reached = self.pair_watcher.watch(read, status)
+        if not reached:
+            self.logger.writeDebug(
+                f"Snapshot group {gid} not in {status} after "
+                f"{self.pair_watcher.timeout} seconds"
             )
-            if all_in_pair:
-                break
-            retryCount = retryCount + 1
-            self.logger.writeDebug(f"Polling for restore by gid status: {retryCount}")
-            time.sleep(20)
@@ -1,3 +1,5 @@
+import threading
+
 try:
     from ..common.ansible_common import log_entry_exit
     from ..common.vsp_constants import VolumePayloadConst
@@ -19,6 +21,14 @@ logger = Log()
 
 class VSPVolumeProvisioner:
 
+    # widest LDEV range read by a single bulk QoS request
+    QOS_RANGE_SIZE = 256
+
+    # ldevs picked or named by creates still in progress, a free ldev is
+    # picked among the others while holding the lock
+    _free_ldev_lock = threading.Lock()
+    _reserved_ldevs = set()
+
     def __init__(self, connection_info, serial=None):
         self.gateway = VSPVolumeDirectGateway(connection_info)
         self.connection_info = connection_info
@@ -53,6 +63,18 @@ class VSPVolumeProvisioner:
         )
         return volumes
 
+    def iter_volumes(self, start_ldev=None, count=None, end_ldev=None):
+        """
+        Yields the defined LDEVs in LDEV ID order, one page at a time. Without
+        count and end_ldev every defined LDEV from start_ldev is read.
+        """
+        count = 0 if not count else int(count)
+        start_ldev = 0 if not start_ldev else int(start_ldev)
+        for page in self.gateway.iter_volume_pages(
+            start_ldev=start_ldev, count=count, end_ldev=end_ldev
+        ):
+            yield from page.data
+
     @log_entry_exit
     def unassign_vldev(self, ldev_id, vldev_id):
         return self.gateway.unassign_vldev(ldev_id, vldev_id)
@@ -123,19 +145,26 @@ class VSPVolumeProvisioner:
     @log_entry_exit
     def create_volume(self, spec):
         if (
-            not spec.ldev_id
+            spec.ldev_id is None
             and not spec.start_ldev_id
             and not spec.is_parallel_execution_enabled
         ):
-            free_ldev_object = self.get_free_ldev_object_from_meta()
-            spec.ldev_id = free_ldev_object.ldevId
-            if free_ldev_object.ssid is not None:
-                spec.ssid = free_ldev_object.ssid
-
-        if spec.cylinder is None:
-            vol_id = self.gateway.create_volume(spec)
+            # the free ldev stays free until the create job finishes, so
+            # it is reserved until then and concurrent creates skip it
+            with self._free_ldev_lock:
+                free_ldev_object = self.get_free_ldev_object_from_meta(
+                    exclude=set(self._reserved_ldevs)
+                )
+                spec.ldev_id = free_ldev_object.ldevId
+                if free_ldev_object.ssid is not None:
+                    spec.ssid = free_ldev_object.ssid
+                self._reserved_ldevs.add(spec.ldev_id)
+            try:
+                vol_id = self._create_volume(spec)
+            finally:
+                self.release_ldevs([spec.ldev_id])
         else:
-            vol_id = self.gateway.create_mainframe_volume(spec)
+            vol_id = self._create_volume(spec)
 
         vol_info = self.get_volume_by_ldev(vol_id)
         if vol_info.status == VolumePayloadConst.BLOCK:
@@ -156,6 +185,22 @@ class VSPVolumeProvisioner:
 
         return vol_id
 
+    @classmethod
+    def reserve_ldevs(cls, ldev_ids):
+        """Keeps the ldev_ids from being picked as free ldevs."""
+        with cls._free_ldev_lock:
+            cls._reserved_ldevs.update(ldev_ids)
+
+    @classmethod
+    def release_ldevs(cls, ldev_ids):
+        with cls._free_ldev_lock:
+            cls._reserved_ldevs.difference_update(ldev_ids)
+
+    def _create_volume(self, spec):
+        if spec.cylinder is None:
+            return self.gateway.create_volume(spec)
+        return self.gateway.create_mainframe_volume(spec)
+
     @log_entry_exit
     def get_free_ldev_from_meta(self):
         ldevs = self.gateway.get_free_ldev_from_meta()
@@ -166,8 +211,8 @@ class VSPVolumeProvisioner:
         return ldevs.data[0].ldevId
 
     @log_entry_exit
-    def get_free_ldev_object_from_meta(self):
-        ldevs = self.gateway.get_free_ldev_from_meta()
+    def get_free_ldev_object_from_meta(self, exclude=None):
+        ldevs = self.gateway.get_free_ldev_from_meta(exclude)
         if not ldevs.data:
             err_msg = VSPVolValidationMsg.NO_FREE_LDEV.value
             logger.writeError(err_msg)
@@ -277,6 +322,23 @@ class VSPVolumeProvisioner:
     def get_qos_settings(self, ldev_id):
         return self.gateway.get_qos_settings(ldev_id)
 
+    @log_entry_exit
+    def get_qos_settings_for_ldevs(self, ldev_ids):
+        """
+        Reads the QoS settings of many LDEVs with one request per range of
+        nearby LDEV IDs instead of one request per LDEV.
+        """
+        qos_settings = {}
+        ldev_ids = sorted(set(ldev_ids))
+        while ldev_ids:
+            head = ldev_ids[0]
+            in_range = [x for x in ldev_ids if x < head + self.QOS_RANGE_SIZE]
+            ldev_ids = ldev_ids[len(in_range) :]
+            qos_settings.update(
+                self.gateway.get_qos_settings_range(head, in_range[-1] - head + 1)
+            )
+        return qos_settings
+
     @log_entry_exit
     def shredding_volume(self, ldev_id, start):
         # set the volume status to block before shredding
@@ -1,9 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+
 try:
     from ..provisioner.sdsb_compute_node_provisioner import SDSBComputeNodeProvisioner
     from ..provisioner.sdsb_volume_provisioner import SDSBVolumeProvisioner
     from ..common.hv_constants import StateValue
     from ..common.hv_log import Log
     from ..common.ansible_common import log_entry_exit
+    from ..common.ansible_common_constants import MAX_WORKER_THREADS
     from ..model.sdsb_compute_node_models import (
         VolumeSummaryInfo,
         SDSBComputeNodeAndVolumeInfo,
@@ -19,6 +22,7 @@ except ImportError:
     from common.hv_constants import StateValue
     from common.hv_log import Log
     from common.ansible_common import log_entry_exit
+    from common.ansible_common_constants import MAX_WORKER_THREADS
     from model.sdsb_compute_node_models import (
         VolumeSummaryInfo,
         SDSBComputeNodeAndVolumeInfo,
@@ -55,16 +59,28 @@ class SDSBComputeNodeReconciler:
         self.vps_helper = SDSBVpsHelper(self.connection_info)
 
     @log_entry_exit
-    def get_volume_summary(self, cn_id):
+    def get_volume_summary(self, cn_id, volume_names=None):
+        """
+        volume_names, if given, is a dict of volume ID to name used instead
+        of reading every attached volume. Volumes missing from it are read.
+        """
         vol_ids = self.get_compute_node_volume_ids(cn_id)
         vol_prov = SDSBVolumeProvisioner(self.connection_info)
         vol_summary_list = []
         for id in vol_ids:
-            volume = vol_prov.get_volume_by_id(id)
-            vsi = VolumeSummaryInfo(id, volume.name)
+            if volume_names is not None and id in volume_names:
+                name = volume_names[id]
+            else:
+                name = vol_prov.get_volume_by_id(id).name
+            vsi = VolumeSummaryInfo(id, name)
             vol_summary_list.append(vsi)
         return vol_summary_list
 
+    @log_entry_exit
+    def get_volume_names_by_id(self):
+        vol_prov = SDSBVolumeProvisioner(self.connection_info)
+        return {volume.id: volume.name for volume in vol_prov.get_volumes().data}
+
     @log_entry_exit
     def get_compute_nodes(self, spec=None):
 
@@ -88,17 +104,37 @@ class SDSBComputeNodeReconciler:
         cnodes = self.provisioner.get_compute_nodes(spec)
         logger.writeDebug("RC:get_compute_nodes:cnodes={}", cnodes)
 
-        cn_list = []
-        cn_with_vol_list = []
-        for cn in cnodes.data:
+        # one volume list call resolves the names of all attached volumes
+        volume_names = None
+        if any(cn.numberOfVolumes > 0 for cn in cnodes.data):
+            volume_names = self.get_volume_names_by_id()
+
+        def get_compute_node_and_volumes(cn):
             cn_by_id = self.get_compute_node_details_by_id(cn.id)
             if cn_by_id.numberOfVolumes > 0:
-                vol_summary = self.get_volume_summary(cn.id)
+                vol_summary = self.get_volume_summary(cn.id, volume_names)
             else:
                 vol_summary = []
-            cn_with_vol = SDSBComputeNodeAndVolumeInfo(cn_by_id, vol_summary)
-            cn_list.append(cn_by_id)
-            cn_with_vol_list.append(cn_with_vol)
+            return SDSBComputeNodeAndVolumeInfo(cn_by_id, vol_summary)
+
+        cn_with_vol_list = []
+        if cnodes.data:
+            executor = ThreadPoolExecutor(
+                max_workers=MAX_WORKER_THREADS,
+                thread_name_prefix="FetchComputeNodes",
+            )
+            try:
+                futures = [
+                    executor.submit(get_compute_node_and_volumes, cn)
+                    for cn in cnodes.data
+                ]
+                for future in futures:
+                    cn_with_vol_list.append(future.result())
+            except KeyboardInterrupt:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            finally:
+                executor.shutdown(wait=True)
 
         # return cnodes
         # return SDSBComputeNodesInfo(data=cn_list)
@@ -1,4 +1,5 @@
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from ..provisioner.sdsb_volume_provisioner import SDSBVolumeProvisioner
@@ -8,6 +9,7 @@ try:
     from ..common.hv_constants import StateValue
     from ..common.hv_log import Log
     from ..common.ansible_common import log_entry_exit
+    from ..common.ansible_common_constants import MAX_WORKER_THREADS
     from ..message.sdsb_volume_msgs import SDSBVolValidationMsg
     from ..message.sdsb_vps_msgs import SDSBVpsValidationMsg
     from .sdsb_vps_helper import SDSBVpsHelper
@@ -19,6 +21,7 @@ except ImportError:
     from common.hv_constants import StateValue
     from common.hv_log import Log
     from common.ansible_common import log_entry_exit
+    from common.ansible_common_constants import MAX_WORKER_THREADS
     from message.sdsb_volume_msgs import SDSBVolValidationMsg
     from message.sdsb_vps_msgs import SDSBVpsValidationMsg
     from sdsb_vps_helper import SDSBVpsHelper
@@ -118,17 +121,30 @@ class SDSBVolumeReconciler:
             return None
 
     @log_entry_exit
-    def get_compute_nodes_summary(self, vol_id):
+    def get_compute_nodes_summary(self, vol_id, compute_node_names=None):
+        """
+        compute_node_names, if given, is a dict of compute node ID to nickname
+        used instead of reading every connected compute node. Compute nodes
+        missing from it are read.
+        """
         server_ids = self.get_volume_compute_node_ids(vol_id)
         cn_prov = SDSBComputeNodeProvisioner(self.connection_info)
         cn_summary_list = []
         for id in server_ids:
-            compute_node = cn_prov.get_compute_node_by_id(id)
-            cnsi = ComputeNodeSummaryInfo(id, compute_node.nickname)
+            if compute_node_names is not None and id in compute_node_names:
+                name = compute_node_names[id]
+            else:
+                name = cn_prov.get_compute_node_by_id(id).nickname
+            cnsi = ComputeNodeSummaryInfo(id, name)
             cn_summary_list.append(cnsi)
 
         return cn_summary_list
 
+    @log_entry_exit
+    def get_compute_node_names_by_id(self):
+        cn_prov = SDSBComputeNodeProvisioner(self.connection_info)
+        return {cn.id: cn.nickname for cn in cn_prov.get_compute_nodes().data}
+
     @log_entry_exit
     def get_volumes(self, volume_spec=None):
         if volume_spec.vps_id is None and volume_spec.vps_name:
@@ -148,9 +164,28 @@ class SDSBVolumeReconciler:
                 )
         volumes = self.provisioner.get_volumes(volume_spec)
 
-        for vol in volumes.data:
-            if vol.numberOfConnectingServers > 0:
-                vol.computeNodesInfo = self.get_compute_nodes_summary(vol.id)
+        connected = [vol for vol in volumes.data if vol.numberOfConnectingServers > 0]
+        if connected:
+            # one compute node list call resolves the names of all connections
+            compute_node_names = self.get_compute_node_names_by_id()
+            executor = ThreadPoolExecutor(
+                max_workers=MAX_WORKER_THREADS,
+                thread_name_prefix="FetchVolumeConnections",
+            )
+            try:
+                futures = {
+                    executor.submit(
+                        self.get_compute_nodes_summary, vol.id, compute_node_names
+                    ): vol
+                    for vol in connected
+                }
+                for future, vol in futures.items():
+                    vol.computeNodesInfo = future.result()
+            except KeyboardInterrupt:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            finally:
+                executor.shutdown(wait=True)
 
         # return volumes
         return volumes
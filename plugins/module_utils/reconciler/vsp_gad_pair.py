@@ -1,5 +1,4 @@
 from typing import Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
     from ..common.ansible_common import (
@@ -29,7 +28,6 @@ try:
     )
     from ..message.vsp_true_copy_msgs import VSPTrueCopyValidateMsg
     from ..common.uaig_utils import UAIGResourceID
-    from ..common.ansible_common_constants import MAX_WORKER_THREADS
 
 except ImportError:
     from message.vsp_gad_pair_msgs import GADPairValidateMSG
@@ -743,7 +741,8 @@ class VSPGadPairReconciler:
         if not isinstance(gad_copy_pairs, list):
             gad_copy_pairs = [gad_copy_pairs]
 
-        def process_pair(gad_copy_pair):
+        pairs_to_enrich = []
+        for gad_copy_pair in gad_copy_pairs:
             self.get_other_attributes_from_copy_group(
                 copy_group_list, gad_copy_pair, doSwap
             )
@@ -753,7 +752,7 @@ class VSPGadPairReconciler:
             gad_copy_pair["secondaryVirtualVolumeId"] = -1
 
             if not doMore:
-                return
+                continue
 
             primary_volume_storage_id = get_serial_number_from_device_id(
                 gad_copy_pair.get("pvolStorageDeviceId")
@@ -766,89 +765,92 @@ class VSPGadPairReconciler:
                     serial_str = get_serial_number_from_device_id(serial_str)
                 if int(serial_str) == int(primary_volume_storage_id):
                     local_do_swap = True
+            pairs_to_enrich.append((gad_copy_pair, local_do_swap))
 
-            pvol = gad_copy_pair["pvolLdevId"]
-            svol = gad_copy_pair["svolLdevId"]
-            spec.secondary_storage_connection_info = self.secondary_connection_info
-
-            # Fetch primary volume info
-            if local_do_swap:
-                vol = self.provisioner.get_vol_remote(spec, pvol)
-                rg = self.provisioner.get_resource_group_by_id_remote(
-                    spec, vol.resourceGroupId
-                )
-                vsms = self.provisioner.get_vsm_all_remote(spec)
-            else:
-                vol = self.provisioner.get_volume_by_id(pvol)
-                rg = self.provisioner.get_resource_group_by_id(vol.resourceGroupId)
-                vsms = self.provisioner.get_vsm_all()
+        if not pairs_to_enrich:
+            return
 
-            virtualStorageDeviceId, virtualSerialNumber = self.get_vsm_info(
-                vsms, vol.resourceGroupId
+        # with several pairs a failure only leaves that pair without the
+        # extra attributes, like a failure of a single pair does
+        many_pairs = len(gad_copy_pairs) > 1
+        spec.secondary_storage_connection_info = self.secondary_connection_info
+        try:
+            local_details, remote_details = self.get_pair_volume_details(
+                spec, pairs_to_enrich
             )
+        except Exception as e:
+            if not many_pairs:
+                raise
+            logger.writeDebug("Error processing pairs: {}", str(e))
+            return
 
-            if vol.virtualLdevId:
-                gad_copy_pair["primaryVirtualVolumeId"] = vol.virtualLdevId
-            if vol.isAluaEnabled:
-                gad_copy_pair["isAluaEnabled"] = vol.isAluaEnabled
+        for gad_copy_pair, local_do_swap in pairs_to_enrich:
+            try:
+                if local_do_swap:
+                    primary, secondary = remote_details, local_details
+                else:
+                    primary, secondary = local_details, remote_details
+
+                vol, rg_name, vsm = primary.lookup(gad_copy_pair["pvolLdevId"])
+                virtualStorageDeviceId, virtualSerialNumber = vsm
+                if vol.virtualLdevId:
+                    gad_copy_pair["primaryVirtualVolumeId"] = vol.virtualLdevId
+                if vol.isAluaEnabled:
+                    gad_copy_pair["isAluaEnabled"] = vol.isAluaEnabled
+                gad_copy_pair["primaryVSMResourceGroupName"] = rg_name
+                gad_copy_pair["primaryVirtualStorageDeviceId"] = virtualStorageDeviceId
+                gad_copy_pair["primaryVirtualSerialNumber"] = virtualSerialNumber
+
+                vol, rg_name, vsm = secondary.lookup(gad_copy_pair["svolLdevId"])
+                virtualStorageDeviceId, virtualSerialNumber = vsm
+                if vol.virtualLdevId:
+                    gad_copy_pair["secondaryVirtualVolumeId"] = vol.virtualLdevId
+                gad_copy_pair["secondaryVSMResourceGroupName"] = rg_name
+                gad_copy_pair["secondaryVirtualStorageDeviceId"] = (
+                    virtualStorageDeviceId
+                )
+                gad_copy_pair["secondaryVirtualSerialNumber"] = virtualSerialNumber
+            except Exception as e:
+                if not many_pairs:
+                    raise
+                logger.writeDebug("Error processing pair: {}", str(e))
 
-            gad_copy_pair["primaryVSMResourceGroupName"] = rg.resourceGroupName
-            gad_copy_pair["primaryVirtualStorageDeviceId"] = virtualStorageDeviceId
-            gad_copy_pair["primaryVirtualSerialNumber"] = virtualSerialNumber
+        return
 
-            # Fetch secondary volume info
+    def get_pair_volume_details(self, spec, pairs_to_enrich):
+        """
+        Reads the volumes of the pairs, with their resource groups and
+        virtual storage machines, once per storage system. Returns the
+        PairVolumeDetails of the local and of the remote storage system.
+        """
+        local_ids, remote_ids = set(), set()
+        for gad_copy_pair, local_do_swap in pairs_to_enrich:
             if local_do_swap:
-                vol = self.provisioner.get_volume_by_id(svol)
-                rg = self.provisioner.get_resource_group_by_id(vol.resourceGroupId)
-                vsms = self.provisioner.get_vsm_all()
+                remote_ids.add(gad_copy_pair["pvolLdevId"])
+                local_ids.add(gad_copy_pair["svolLdevId"])
             else:
-                vol = self.provisioner.get_vol_remote(spec, svol)
-                rg = self.provisioner.get_resource_group_by_id_remote(
-                    spec, vol.resourceGroupId
-                )
-                vsms = self.provisioner.get_vsm_all_remote(spec)
-
-            virtualStorageDeviceId, virtualSerialNumber = self.get_vsm_info(
-                vsms, vol.resourceGroupId
+                local_ids.add(gad_copy_pair["pvolLdevId"])
+                remote_ids.add(gad_copy_pair["svolLdevId"])
+
+        provisioner = self.provisioner
+        local_details = remote_details = None
+        if local_ids:
+            local_details = PairVolumeDetails(
+                provisioner.get_volumes_by_ids(local_ids),
+                provisioner.get_resource_groups(),
+                provisioner.get_vsm_all(),
+                provisioner.get_volume_by_id,
+                provisioner.get_resource_group_by_id,
             )
-
-            if vol.virtualLdevId:
-                gad_copy_pair["secondaryVirtualVolumeId"] = vol.virtualLdevId
-            gad_copy_pair["secondaryVSMResourceGroupName"] = rg.resourceGroupName
-            gad_copy_pair["secondaryVirtualStorageDeviceId"] = virtualStorageDeviceId
-            gad_copy_pair["secondaryVirtualSerialNumber"] = virtualSerialNumber
-
-        if len(gad_copy_pairs) > 1:
-            max_workers = min(len(gad_copy_pairs), MAX_WORKER_THREADS)
-            executor = ThreadPoolExecutor(
-                max_workers=max_workers, thread_name_prefix="ProcessGadPairs"
+        if remote_ids:
+            remote_details = PairVolumeDetails(
+                provisioner.get_volumes_by_ids_remote(spec, remote_ids),
+                provisioner.get_resource_groups_remote(spec),
+                provisioner.get_vsm_all_remote(spec),
+                lambda ldev_id: provisioner.get_vol_remote(spec, ldev_id),
+                lambda rg_id: provisioner.get_resource_group_by_id_remote(spec, rg_id),
             )
-            try:
-                futures = [
-                    executor.submit(process_pair, pair) for pair in gad_copy_pairs
-                ]
-                for future in as_completed(futures):
-                    try:
-                        future.result()
-                    except Exception as e:
-                        logger.writeDebug("Error processing pair: {}", str(e))
-            except KeyboardInterrupt:
-                executor.shutdown(wait=False, cancel_futures=True)
-                raise
-            finally:
-                executor.shutdown(wait=True)
-        else:
-            for pair in gad_copy_pairs:
-                process_pair(pair)
-
-        return
-
-    def get_vsm_info(self, vsms, resourceGroupId):
-        # VirtualStorageMachineInfoList
-        for vsm in vsms.data:
-            for rgid in vsm.resourceGroupIds:
-                if rgid == resourceGroupId:
-                    return vsm.virtualStorageDeviceId, vsm.virtualSerialNumber
+        return local_details, remote_details
 
     def get_other_attributes_from_copy_group(self, cglist, gad_copy_pair, doSwap):
         if cglist is None:
@@ -894,6 +896,39 @@ class VSPGadPairReconciler:
         return VspGadPairsInfo(data=items)
 
 
+class PairVolumeDetails:
+    """
+    Volumes of GAD pairs on one storage system with the name of their
+    resource group and the virtual storage machine the resource group
+    belongs to. Volumes and resource groups missing from the bulk reads
+    are read one by one.
+    """
+
+    def __init__(self, volumes, resource_groups, vsms, get_volume, get_resource_group):
+        self.volumes = volumes
+        self.resource_group_names = {
+            rg.resourceGroupId: rg.resourceGroupName for rg in resource_groups.data
+        }
+        self.vsms = {}
+        for vsm in vsms.data:
+            for rgid in vsm.resourceGroupIds or []:
+                self.vsms.setdefault(
+                    rgid, (vsm.virtualStorageDeviceId, vsm.virtualSerialNumber)
+                )
+        self.get_volume = get_volume
+        self.get_resource_group = get_resource_group
+
+    def lookup(self, ldev_id):
+        """Returns the volume, its resource group name and its VSM information."""
+        vol = self.volumes.get(int(ldev_id))
+        if vol is None:
+            vol = self.get_volume(ldev_id)
+        rg_name = self.resource_group_names.get(vol.resourceGroupId)
+        if rg_name is None:
+            rg_name = self.get_resource_group(vol.resourceGroupId).resourceGroupName
+        return vol, rg_name, self.vsms.get(vol.resourceGroupId)
+
+
 class DirectGADInfoExtractor:
     def __init__(self, serial):
         self.storage_serial_number = serial
@@ -81,6 +81,7 @@ class ResourceGroupLockInfoExtractor:
             "remote_lock_token": str,
             "locked_resource_groups": list,
             "remote_locked_resource_groups": list,
+            "lock_acquire_seconds": float,
             "resourceGroupName": str,
             "resourceGroupId": int,
             "virtualDeviceId": str,
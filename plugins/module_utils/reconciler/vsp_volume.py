@@ -1,4 +1,6 @@
+import copy
 import time
+from contextlib import closing
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
@@ -16,7 +18,11 @@ try:
     from ..common.uaig_utils import camel_to_snake_case_dict
     from ..common.hv_log import Log
     from ..common.hv_constants import StateValue
-    from ..common.vsp_constants import VolumePayloadConst, DEFAULT_NAME_PREFIX
+    from ..common.vsp_constants import (
+        VolumePayloadConst,
+        DEFAULT_NAME_PREFIX,
+        AutomationConstants,
+    )
     from ..model.common_base_models import ConnectionInfo
     from ..model.vsp_volume_models import (
         CreateVolumeSpec,
@@ -50,7 +56,11 @@ except ImportError:
     from common.uaig_utils import camel_to_snake_case_dict
     from common.hv_log import Log
     from common.hv_constants import StateValue
-    from common.vsp_constants import VolumePayloadConst, DEFAULT_NAME_PREFIX
+    from common.vsp_constants import (
+        VolumePayloadConst,
+        DEFAULT_NAME_PREFIX,
+        AutomationConstants,
+    )
     from model.common_base_models import ConnectionInfo
     from model.vsp_volume_models import (
         CreateVolumeSpec,
@@ -67,6 +77,7 @@ except ImportError:
     from provisioner.vsp_snapshot_provisioner import VSPHtiSnapshotProvisioner
     from message.vsp_lun_msgs import VSPVolValidationMsg
     from provisioner.vsp_host_group_provisioner import VSPHostGroupProvisioner
+    from common.ansible_common_constants import MAX_WORKER_THREADS
 
 
 logger = Log()
@@ -81,6 +92,18 @@ class VSPVolumeSubstates:
     REMOVE_HOST_NQN = "remove_host_nqn"
 
 
+class VolumeDetailCache:
+    """
+    Details shared by the volumes of one facts request, fetched once before
+    the volumes are filled in. A missing entry means it was not prefetched.
+    """
+
+    def __init__(self):
+        self.pool_encryption = {}
+        self.nvm_subsystems = {}
+        self.qos_settings = {}
+
+
 class VSPVolumeReconciler:
     """_summary_"""
 
@@ -92,6 +115,7 @@ class VSPVolumeReconciler:
         self.nvme_provisioner = VSPNvmeProvisioner(self.connection_info, self.serial)
         self.hg_prov = VSPHostGroupProvisioner(self.connection_info)
         self.snapshots = None
+        self.detail_cache = None
 
     @log_entry_exit
     def volume_reconcile(self, state: str, spec: CreateVolumeSpec):
@@ -248,6 +272,58 @@ class VSPVolumeReconciler:
                     logger.writeInfo("RC:volume_reconcile:shredding_volume finished")
                 self.delete_volume(volume)
 
+    @log_entry_exit
+    def volumes_reconcile(self, items):
+        """
+        Reconciles several (state, spec) items in parallel and returns a
+        (changed, result, error) tuple per item, in the order of the items.
+        The items share the sessions, the GET cache and the port and host
+        group caches of this reconciler, each one reports its own changed
+        flag.
+        """
+        if not items:
+            return []
+
+        def reconcile(state, spec):
+            connection_info = copy.copy(self.connection_info)
+            connection_info.changed = False
+            reconciler = VSPVolumeReconciler(connection_info, self.serial)
+            reconciler.port_prov = self.port_prov
+            reconciler.hg_prov = self.hg_prov
+            try:
+                result = reconciler.volume_reconcile(state, spec)
+            except Exception as e:
+                logger.writeError(f"RC:volumes_reconcile:ldev_id={spec.ldev_id} {e}")
+                return connection_info.changed, None, e
+            return connection_info.changed, result, None
+
+        # items without an ldev_id must not pick the ldev of another item
+        explicit_ids = [spec.ldev_id for _, spec in items if spec.ldev_id is not None]
+        VSPVolumeProvisioner.reserve_ldevs(explicit_ids)
+
+        results = [None] * len(items)
+        executor = ThreadPoolExecutor(
+            max_workers=min(MAX_WORKER_THREADS, len(items)),
+            thread_name_prefix="ReconcileVolumes",
+        )
+        try:
+            futures = {
+                executor.submit(reconcile, state, spec): index
+                for index, (state, spec) in enumerate(items)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            executor.shutdown(wait=True)
+            VSPVolumeProvisioner.release_ldevs(explicit_ids)
+
+        if any(changed for changed, _, _ in results):
+            self.connection_info.changed = True
+        return results
+
     @log_entry_exit
     def update_nvm_subsystem(self, spec):
         found = self.does_nvme_subsystem_exist(spec.nvm_subsystem_name)
@@ -828,8 +904,19 @@ class VSPVolumeReconciler:
         return result_list
 
     @log_entry_exit
-    def get_host_nqn_paths_for_nvm_subsystem(self, volume):
-        nvm_ss_paths = self.nvme_provisioner.get_namespace_paths(volume.nvmSubsystemId)
+    def get_nvm_subsystem_data(self, nvm_subsystem_id):
+        if self.detail_cache and nvm_subsystem_id in self.detail_cache.nvm_subsystems:
+            return self.detail_cache.nvm_subsystems[nvm_subsystem_id]
+        nvm_ss_paths = self.nvme_provisioner.get_namespace_paths(nvm_subsystem_id)
+        nvm_ss = self.nvme_provisioner.get_nvme_subsystem_by_id(nvm_subsystem_id)
+        return nvm_ss_paths, nvm_ss
+
+    @log_entry_exit
+    def get_host_nqn_paths_for_nvm_subsystem(self, volume, nvm_ss_paths=None):
+        if nvm_ss_paths is None:
+            nvm_ss_paths = self.nvme_provisioner.get_namespace_paths(
+                volume.nvmSubsystemId
+            )
         host_nqns = []
         for p in nvm_ss_paths.data:
             if p.namespaceId == int(volume.namespaceId) and p.ldevId == volume.ldevId:
@@ -839,12 +926,12 @@ class VSPVolumeReconciler:
 
     @log_entry_exit
     def get_nvm_subsystem_info(self, volume):
-        host_nqns = self.get_host_nqn_paths_for_nvm_subsystem(volume)
+        nvm_ss_paths, nvm_ss = self.get_nvm_subsystem_data(volume.nvmSubsystemId)
+        host_nqns = self.get_host_nqn_paths_for_nvm_subsystem(volume, nvm_ss_paths)
         volume.numOfPorts = len(host_nqns)
         logger.writeDebug("RC:get_nvm_subsystem_info:no_of_ports={}", volume.numOfPorts)
 
         result_list = []
-        nvm_ss = self.nvme_provisioner.get_nvme_subsystem_by_id(volume.nvmSubsystemId)
         logger.writeDebug("RC:get_nvm_subsystem_info:nvm_subsystem = {}", nvm_ss)
         item = VSPVolumeNvmSubsystenInfo(
             nvm_ss.nvmSubsystemId, nvm_ss.nvmSubsystemName, nvm_ss.portIds, host_nqns
@@ -882,6 +969,14 @@ class VSPVolumeReconciler:
     def get_volumes_detail_for_spec(self, volumes, spec):
         retList = []
         if volumes:
+            query = spec.query or []
+            detailed = spec.is_detailed is True
+            self.detail_cache = self.prefetch_volume_details(
+                volumes,
+                encryption=detailed or "encryption_settings" in query,
+                nvm=detailed or "nvm_subsystem_info" in query,
+                qos=detailed or "qos_settings" in query,
+            )
             executor = ThreadPoolExecutor(max_workers=MAX_WORKER_THREADS)
             try:
                 futures = {
@@ -897,8 +992,50 @@ class VSPVolumeReconciler:
                 raise
             finally:
                 executor.shutdown(wait=True)
+                self.detail_cache = None
         return VSPVolumesInfo(data=retList)
 
+    @log_entry_exit
+    def prefetch_volume_details(self, volumes, encryption=True, nvm=True, qos=True):
+        """
+        Fetches the details shared between volumes once for the whole batch:
+        the encryption state of each pool, each NVM subsystem and the QoS
+        settings of all volumes in range requests.
+        """
+        cache = VolumeDetailCache()
+        if encryption:
+            pool_ids = {
+                v.poolId
+                for v in volumes
+                if v.poolId is not None and not v.numOfParityGroups
+            }
+            for pool_id in pool_ids:
+                cache.pool_encryption[pool_id] = self.is_encryption_enabled_on_pool(
+                    pool_id
+                )
+        if nvm:
+            for nvm_subsystem_id in {
+                v.nvmSubsystemId for v in volumes if v.nvmSubsystemId
+            }:
+                cache.nvm_subsystems[nvm_subsystem_id] = self.get_nvm_subsystem_data(
+                    nvm_subsystem_id
+                )
+        if qos:
+            try:
+                cache.qos_settings = self.provisioner.get_qos_settings_for_ldevs(
+                    [v.ldevId for v in volumes]
+                )
+            except Exception as e:
+                # the volumes fall back to one QoS request each
+                logger.writeError(f"RC:prefetch_volume_details:qos_settings={e}")
+        return cache
+
+    @log_entry_exit
+    def get_qos_settings(self, ldev_id):
+        if self.detail_cache and ldev_id in self.detail_cache.qos_settings:
+            return self.detail_cache.qos_settings[ldev_id]
+        return self.provisioner.get_qos_settings(ldev_id)
+
     @log_entry_exit
     def get_volume_detail_for_spec(self, volume, spec):
         # host group and iSCSI target info are always included
@@ -928,7 +1065,7 @@ class VSPVolumeReconciler:
                         )
                         volume.nvmSubsystems = nvm_subsystems
                 if "qos_settings" in spec.query:
-                    qos_settings = self.provisioner.get_qos_settings(volume.ldevId)
+                    qos_settings = self.get_qos_settings(volume.ldevId)
                     if qos_settings:
                         volume.qosSettings = qos_settings
                 if "snapshots_info" in spec.query:
@@ -956,7 +1093,7 @@ class VSPVolumeReconciler:
 
         qos_settings = None
         if create_qos_setting:
-            qos_settings = self.provisioner.get_qos_settings(volume.ldevId)
+            qos_settings = self.get_qos_settings(volume.ldevId)
 
         volume.qosSettings = qos_settings
 
@@ -978,11 +1115,15 @@ class VSPVolumeReconciler:
             all_snapshots = self.get_all_snapshots()
             logger.writeDebug("RC:get_volumes_detail_info:snapshots={}", all_snapshots)
             single_vol = False if len(volumes) > 1 else True
-            for volume in volumes:
-                new_volume = self.get_volume_detail_info(
-                    volume, all_snapshots, single_vol
-                )
-                retList.append(new_volume)
+            self.detail_cache = self.prefetch_volume_details(volumes)
+            try:
+                for volume in volumes:
+                    new_volume = self.get_volume_detail_info(
+                        volume, all_snapshots, single_vol
+                    )
+                    retList.append(new_volume)
+            finally:
+                self.detail_cache = None
         return VSPVolumesInfo(data=retList)
 
     @log_entry_exit
@@ -999,21 +1140,29 @@ class VSPVolumeReconciler:
                 return False
 
         if volume.poolId is not None:
-            pool_volumes = self.provisioner.get_volumes_by_pool_id(volume.poolId)
-            logger.writeDebug(
-                "RC:is_encryption_enabled_on_volume:pool_volumes={}", pool_volumes
-            )
-            if pool_volumes and len(pool_volumes.data) > 0:
-                for v in pool_volumes.data:
-                    if v.attributes is not None:
-                        if "ENCD" not in v.attributes:
-                            return False
-                    else:
-                        return False
-                return True
+            if self.detail_cache and volume.poolId in self.detail_cache.pool_encryption:
+                return self.detail_cache.pool_encryption[volume.poolId]
+            return self.is_encryption_enabled_on_pool(volume.poolId)
 
         return False
 
+    @log_entry_exit
+    def is_encryption_enabled_on_pool(self, pool_id):
+        # a pool is encrypted when all of its pool volumes are
+        pool_volumes = self.provisioner.get_volumes_by_pool_id(pool_id)
+        logger.writeDebug(
+            "RC:is_encryption_enabled_on_pool:pool_volumes={}", pool_volumes
+        )
+        if pool_volumes and len(pool_volumes.data) > 0:
+            for v in pool_volumes.data:
+                if v.attributes is not None:
+                    if "ENCD" not in v.attributes:
+                        return False
+                else:
+                    return False
+            return True
+        return False
+
     @log_entry_exit
     def get_hostgroup_and_iscsi_target_info(self, volume, single_vol=True):
         hostgroups = []
@@ -1116,27 +1265,37 @@ class VSPVolumeReconciler:
             get_volume_spec.count = (
                 get_volume_spec.end_ldev_id - get_volume_spec.start_ldev_id + 1
             )
-        volume_data = self.provisioner.get_volumes(
-            get_volume_spec.start_ldev_id,
-            get_volume_spec.count,
-            get_volume_spec.pool_id,
-            get_volume_spec.resource_group_id,
-            get_volume_spec.journal_id,
-            get_volume_spec.parity_group_id,
-        )
+        if (
+            get_volume_spec.pool_id is None
+            and not get_volume_spec.resource_group_id
+            and not get_volume_spec.journal_id
+            and not get_volume_spec.parity_group_id
+        ):
+            volume_data = self.get_volumes_in_range(get_volume_spec)
+        else:
+            volume_data = self.provisioner.get_volumes(
+                get_volume_spec.start_ldev_id,
+                get_volume_spec.count,
+                get_volume_spec.pool_id,
+                get_volume_spec.resource_group_id,
+                get_volume_spec.journal_id,
+                get_volume_spec.parity_group_id,
+            )
 
-        if get_volume_spec.end_ldev_id:
-            end_ldev_id = get_volume_spec.end_ldev_id
-            volume_data.data = [
-                volume for volume in volume_data.data if volume.ldevId <= end_ldev_id
-            ]
-
-        if get_volume_spec.name:
-            volume_data.data = [
-                volume
-                for volume in volume_data.data
-                if volume.label == get_volume_spec.name
-            ]
+            if get_volume_spec.end_ldev_id:
+                end_ldev_id = get_volume_spec.end_ldev_id
+                volume_data.data = [
+                    volume
+                    for volume in volume_data.data
+                    if volume.ldevId <= end_ldev_id
+                ]
+
+            if get_volume_spec.name:
+                volume_data.data = [
+                    volume
+                    for volume in volume_data.data
+                    if volume.label == get_volume_spec.name
+                ]
         if (
             get_volume_spec.is_detailed is not None
             and get_volume_spec.is_detailed is True
@@ -1145,6 +1304,23 @@ class VSPVolumeReconciler:
         else:
             return self.get_volumes_with_hg_iscsi(volume_data.data)
 
+    @log_entry_exit
+    def get_volumes_in_range(self, get_volume_spec: VolumeFactSpec):
+        # count is a number of defined LDEVs, no page past end_ldev_id is read
+        count = get_volume_spec.count
+        if not count and not get_volume_spec.end_ldev_id:
+            count = AutomationConstants.LDEV_MAX_NUMBER
+        with closing(
+            self.provisioner.iter_volumes(
+                get_volume_spec.start_ldev_id,
+                count,
+                get_volume_spec.end_ldev_id or None,
+            )
+        ) as volumes:
+            if get_volume_spec.name:
+                volumes = (v for v in volumes if v.label == get_volume_spec.name)
+            return VSPVolumesInfo(data=list(volumes))
+
     @log_entry_exit
     def generate_volume_name(self, ldev_id, label):
         if label is None:
@@ -1159,18 +1335,17 @@ class VSPVolumeReconciler:
     @log_entry_exit
     def get_volume_by_name(self, name):
 
-        volumes = self.provisioner.get_volumes()
-        for volume in volumes.data:
-            if volume.label == name:
-                return volume
+        with closing(self.provisioner.iter_volumes()) as volumes:
+            for volume in volumes:
+                if volume.label == name:
+                    return volume
 
     @log_entry_exit
     def get_volume_by_id(self, id):
 
-        volumes = self.provisioner.get_volumes()
-        for volume in volumes.data:
-            if volume.ldevId == int(id):
-                return volume
+        volume = self.provisioner.get_volume_by_ldev(int(id))
+        if volume and volume.emulationType != VolumePayloadConst.NOT_DEFINED:
+            return volume
         raise ValueError(VSPVolValidationMsg.VOLUME_NOT_FOUND.value.format(id))
 
     @log_entry_exit
@@ -54,8 +54,9 @@ options:
         required: false
   spec:
     description: Specification for the LDEV.
+      Mutually exclusive with C(volumes), one of them is required.
     type: dict
-    required: true
+    required: false
     suboptions:
       pool_id:
         description: ID of the pool where the LDEV will be created. Options pool_id and parity_group_id are mutually exclusive.
@@ -400,6 +401,372 @@ options:
           It will use the existing SSID of the free LDEV if ssid is already assigned to any LDEV.
         type: str
         required: false
+  volumes:
+    description:
+      - List of LDEVs to manage in a single task, instead of looping over the module with C(spec).
+      - The items are reconciled in parallel, sharing the session and the storage port and host group
+        information. Every item must refer to a different LDEV.
+      - Items without an C(ldev_id) are created on a free LDEV that no other item of the list uses.
+      - The task fails if any item fails, after all the items were processed. The result of each item
+        is returned in C(volumes).
+      - Mutually exclusive with C(spec), one of them is required.
+    type: list
+    elements: dict
+    required: false
+    suboptions:
+      state:
+        description: The desired state of this LDEV. Defaults to C(state).
+        type: str
+        required: false
+        choices: ['present', 'absent', 'assign_virtual_ldev']
+      spec:
+        description: Specification for this LDEV, same as C(spec).
+        type: dict
+        required: true
+        suboptions:
+          pool_id:
+            description: ID of the pool where the LDEV will be created. Options pool_id and parity_group_id are mutually exclusive.
+              Required for the Create LDEV with a specific LDEV ID
+              /Create ldev with free ID and present to NVM System
+              /Create LDEV within a range of LDEV IDs using parallel execution
+              /Create LDEV with capacity saving and data_reduction_share
+              /Configuring QoS settings for a new volume
+              /Create new volume with tiering policy
+              /Create new volume with virtual ldev tasks.
+            type: int
+            required: false
+          parity_group:
+            description: ID of the parity_group where the LDEV will be created. Options pool_id and parity_group_id are mutually exclusive.
+              Required for the Create LDEV using a parity group and auto-free LDEV ID selection task.
+            type: str
+            required: false
+          size:
+            description: Size of the LDEV. Can be specified in units such as GB, TB, or MB (e.g., '10GB', '5TB', '100MB', 200).
+              Required for the Create LDEV with a specific LDEV ID
+              /Create ldev with free ID and present to NVM System
+              /Create LDEV within a range of LDEV IDs using parallel execution
+              /Expand the size of LDEV
+              /Create LDEV using a parity group and auto-free LDEV ID selection
+              /Create LDEV using external parity group and auto free LDEV ID selection
+              /Create LDEV with capacity saving and data_reduction_share
+              /Configuring QoS settings for a new volume
+              /Create new volume with tiering policy
+              /Create new volume with virtual ldev tasks.
+            type: str
+            required: false
+          ldev_id:
+            description: ID of the LDEV (required for delete and update operations), for new it will assigned to this ldev if it's free.
+              Can be decimal or hexadecimal.
+              Required for the Create LDEV with a specific LDEV ID
+              /Present existing volume to NVM System
+              /Expand the size of LDEV
+              /Remove host NQNs from existing volume of NVM System
+              /Delete LDEV
+              /Force delete LDEV removes the LDEV from hostgroups, iSCSI targets or NVM subsystem namespace
+              /Shredding an existing volume
+              /Shredding an existing volume before deleting
+              /Configuring QoS settings for an existing volume
+              /Assign virtual LDEV Id for a volume
+              /Unassign virtual LDEV Id for a volume
+              /Set MP blade ID of a volume
+              /Set CLPR id of a volume
+              /Reclaiming zero pages of a DP volume
+              /Format a volume
+              /Change volume settings tasks.
+            type: str
+            required: false
+          name:
+            description: Name of the LDEV (optional). If not given, it assigns the name of the LDEV to "smrha-<ldev_id>".
+              Optional for the Create ldev with free ID and present to NVM System
+              /Create LDEV within a range of LDEV IDs using parallel execution
+              /Create LDEV using a parity group and auto-free LDEV ID selection
+              /Create LDEV using external parity group and auto free LDEV ID selection tasks.
+            type: str
+            required: false
+          capacity_saving:
+            description: >
+              Whether to enable the capacity saving functions. Valid value is one of the following three options:
+              - 1. compression -  Enable the capacity saving function (compression).
+              - 2. compression_deduplication - Enable the capacity saving function (compression and deduplication).
+              - 3 disabled - Disable the capacity saving function (compression and deduplication)
+              Default value is disabled.
+              Optional for the Create ldev with free ID and present to NVM System
+              /Create LDEV within a range of LDEV IDs using parallel execution tasks.
+              Required for the Create LDEV with capacity saving and data_reduction_share task.
+            type: str
+            required: false
+          data_reduction_share:
+            description: Specify whether to create a data reduction shared volume.
+              This value is set to true for Thin Image Advance.
+              Optional for the Create ldev with free ID and present to NVM System task.
+              Required for the Create LDEV with capacity saving and data_reduction_share task.
+            type: bool
+            required: false
+          nvm_subsystem_name:
+            description: Specify whether the LDEV created will be part of an NVM subsystem.
+              Required for the Create ldev with free ID and present to NVM System
+              /Present existing volume to NVM System
+              /Remove host NQNs from existing volume of NVM System tasks.
+            type: str
+            required: false
+          state:
+            description:
+              - State of the NVM subsystems task. This is valid only when nvm_subsystem_name is specified.
+              - C(add_host_nqn) - Add the host NQNs to the LDEV.
+              - C(remove_host_nqn) - Remove the host NQNs from the LDEV.
+              - Optional for the Create ldev with free ID and present to NVM System task.
+            type: str
+            required: false
+            choices: ['add_host_nqn', 'remove_host_nqn']
+            default: 'add_host_nqn'
+          host_nqns:
+            description: List of host nqns to add to or remove from the LDEV depending on the state value.
+              Required for the Create ldev with free ID and present to NVM System
+              /Remove host NQNs from existing volume of NVM System tasks.
+              Optional for the Present existing volume to NVM System task.
+            type: list
+            required: false
+            elements: str
+          is_relocation_enabled:
+            description: Specify whether to enable the tier relocation setting for the HDT volume.
+              Required for the Create new volume with tiering policy task.
+              Optional for the Change volume settings task.
+            type: bool
+            required: false
+          tier_level_for_new_page_allocation:
+            description: Specify which tier of the HDT pool will be prioritized when a new page is allocated.
+              Required for the Create new volume with tiering policy task.
+            type: str
+            required: false
+          tiering_policy:
+            description: Tiering policy for the LDEV.
+              Required for the Create new volume with tiering policy task.
+            type: dict
+            required: false
+            suboptions:
+              tier_level:
+                description: Tier level, a value from 0 to 31.
+                  Optional for the Create new volume with tiering policy task.
+                type: int
+                required: false
+              tier1_allocation_rate_min:
+                description: Tier1 min, a value from 1 to 100.
+                  Optional for the Create new volume with tiering policy task.
+                type: int
+                required: false
+              tier1_allocation_rate_max:
+                description: Tier1 max, a value from 1 to 100.
+                  Optional for the Create new volume with tiering policy task.
+                type: int
+                required: false
+              tier3_allocation_rate_min:
+                description: Tier3 min, a value from 1 to 100.
+                  Optional for the Create new volume with tiering policy task.
+                type: int
+                required: false
+              tier3_allocation_rate_max:
+                description: Tier3 max, a value from 1 to 100.
+                  Optional for the Create new volume with tiering policy task.
+                type: int
+                required: false
+          vldev_id:
+            description: Specify the virtual LDEV id. Specify -1 if you want to unassign the vldev_id.
+              Can be decimal or hexadecimal.
+              Required for the Create new volume with virtual ldev
+              /Assign virtual LDEV Id for a volume
+              /Unassign virtual LDEV Id for a volume tasks.
+            type: str
+            required: false
+          force:
+            description: Force delete. Delete the LDEV and removes the LDEV from hostgroups, iscsi targets or NVM subsystem namespace.
+              Required for the Force delete LDEV removes the LDEV from hostgroups,
+              iSCSI targets or NVM subsystem namespace task.
+            type: bool
+            required: false
+          should_shred_volume_enable:
+            description: It shreds an LDEV (basic volume) or DP volume. Overwrites the volume three times with dummy data.
+              Required for the Shredding an existing volume
+              /Shredding an existing volume before deleting task.
+            type: bool
+            required: false
+          qos_settings:
+            description: QoS settings for the LDEV.
+              Required for the Configuring QoS settings for an existing volume
+              /Configuring QoS settings for a new volume tasks.
+            type: dict
+            required: false
+            suboptions:
+              upper_iops:
+                description: Upper IOPS limit.
+                  Optional for the Configuring QoS settings for an existing volume
+                  /Configuring QoS settings for a new volume tasks.
+                type: int
+                required: false
+              lower_iops:
+                description: Lower IOPS limit.
+                  Optional for the Configuring QoS settings for an existing volume
+                  /Configuring QoS settings for a new volume tasks.
+                type: int
+                required: false
+              upper_transfer_rate:
+                description: Upper transfer rate limit.
+                  Optional for the Configuring QoS settings for an existing volume
+                  /Configuring QoS settings for a new volume tasks.
+                type: int
+                required: false
+              lower_transfer_rate:
+                description: Lower transfer rate limit.
+                  Optional for the Configuring QoS settings for an existing volume
+                  /Configuring QoS settings for a new volume tasks.
+                type: int
+                required: false
+              upper_alert_allowable_time:
+                description: Upper alert allowable time.
+                  Optional for the Configuring QoS settings for an existing volume
+                  /Configuring QoS settings for a new volume tasks.
+                type: int
+                required: false
+              lower_alert_allowable_time:
+                description: Lower alert allowable time.
+                  Optional for the Configuring QoS settings for an existing volume
+                  /Configuring QoS settings for a new volume tasks.
+                type: int
+                required: false
+              response_priority:
+                description: Response priority.
+                  Optional for the Configuring QoS settings for an existing volume
+                  /Configuring QoS settings for a new volume tasks.
+                type: int
+                required: false
+              response_alert_allowable_time:
+                description: Response alert allowable time.
+                  Optional for the Configuring QoS settings for an existing volume
+                  /Configuring QoS settings for a new volume tassk.
+                type: int
+                required: false
+          is_compression_acceleration_enabled:
+            description: Whether the compression accelerator of the capacity saving function is enabled.
+              Optional for the Create LDEV within a range of LDEV IDs using parallel execution
+              /Change volume settings tasks.
+            type: bool
+            required: false
+          data_reduction_process_mode:
+            description: >
+              The data reduction process mode of the capacity saving function.
+              Valid values are:
+              - "post_process" -  Post-process mode.
+              - "inline" - Inline mode.
+              Optional for the Change volume settings task.
+            choices: ["post_process", "inline"]
+            type: str
+          is_alua_enabled:
+            description: Whether the ALUA (Asymmetric Logical Unit Access) is enabled for the LDEV.
+              Optional for the Change volume settings task.
+            type: bool
+            required: false
+          is_full_allocation_enabled:
+            description: Whether the LDEV is a full allocation volume.
+              Optional for the Change volume settings task.
+            type: bool
+            required: false
+          should_format_volume:
+            description: Whether to format the volume after creation or existing volume.
+              Required for the Format a volume task.
+            type: bool
+            required: false
+          format_type:
+            description: >
+              The format type of the volume. Valid values are:
+              - "quick" - Quick formatting.
+              - "normal" - Normal formatting, It may take time to finish the formatting process.
+              Optional for the Format a volume task.
+            type: str
+            required: false
+            choices: ["quick", "normal"]
+            default: "quick"
+          start_ldev_id:
+            description: >
+              The starting LDEV ID for the range of LDEVs to be created. This is used when creating multiple LDEVs.
+              If not specified, a free LDEV ID will be assigned. Can be decimal or hexadecimal.
+              Required for the Create LDEV within a range of LDEV IDs using parallel execution task.
+            type: str
+            required: false
+          end_ldev_id:
+            description: >
+              The ending LDEV ID for the range of LDEVs to be created. This is used when creating multiple LDEVs.
+              If not specified, only one LDEV will be created. Can be decimal or hexadecimal.
+              Required for the Create LDEV within a range of LDEV IDs using parallel execution task.
+            type: str
+            required: false
+          mp_blade_id:
+            description: >
+              The MP blade ID to which the LDEV will be assigned. This is used for specifying the MP blade for the LDEV.
+              If not specified, the LDEV will be assigned to the default MP blade.
+              Optional for the Set MP blade ID of a volume task.
+            type: int
+            required: false
+          clpr_id:
+            description: >
+              The CLPR (Control Logical Partition) ID to which the LDEV will be assigned. This is used for specifying the CLPR for the LDEV.
+              If not specified, the LDEV will be assigned to the default CLPR.
+              Required for the Set CLPR id of a volume task.
+            type: int
+            required: false
+          should_reclaim_zero_pages:
+            description: >
+              Whether to reclaim zero pages of a DP volume. This is used to reclaim space in a DP volume.
+              If set to true, it will reclaim the zero pages of the DP volume.
+              Required for the Reclaiming zero pages of a DP volume task.
+            type: bool
+            required: false
+          external_parity_group:
+            description: >
+              The external parity group ID to which the LDEV will be assigned. This is used for specifying the external parity group for the LDEV.
+              If not specified, the LDEV will be assigned to the default parity group.
+              Optional for the Create LDEV using external parity group and auto free LDEV ID selection task.
+            type: str
+            required: false
+          is_parallel_execution_enabled:
+            description: >
+              Whether to enable parallel execution for the LDEV operations. This is used to speed up the LDEV operations.
+              If set to true, it will enable parallel execution for the LDEV operations.
+              Required for the Create LDEV within a range of LDEV IDs using parallel execution task.
+            type: bool
+            required: false
+          should_stop_all_volume_format:
+            description: >
+              Whether to stop all volume format operations. This is used to stop ongoing volume format tasks.
+              If set to true, it will stop all volume format operations.
+              Optional for stopping all volume format operations.
+            type: bool
+          cylinder:
+            description: >
+              The cylinder number for the Mainframe LDEV. This is used for specifying the cylinder for the LDEV.
+            type: int
+            required: false
+          emulation_type:
+            description: >
+              The emulation type for the Mainframe LDEV. This is used for specifying the emulation type for the LDEV.
+              Example values are 3390-A and 3390-V.
+            type: str
+            required: false
+          is_tse_volume:
+            description: >
+              Whether the LDEV is a TSE (Thin Provisioning with Space Efficiency) volume. This is used for specifying if the LDEV is a TSE volume.
+            type: bool
+            required: false
+          is_ese_volume:
+            description: >
+              Whether the LDEV is an ESE (Enhanced Space Efficiency) volume. This is used for specifying if the LDEV is an ESE volume.
+            type: bool
+            required: false
+          ssid:
+            description: >
+              The SSID (Subsystem ID) for the Mainframe LDEV. This is used for specifying the SSID for the LDEV.
+              if not specified, the default SSID will be used. if specified, it will use the specified ssid if ssid id is not assigned
+              It will use the existing SSID of the free LDEV if ssid is already assigned to any LDEV.
+            type: str
+            required: false
 """
 
 EXAMPLES = """
@@ -521,12 +888,62 @@ EXAMPLES = """
       is_compression_acceleration_enabled: true
       is_relocation_enabled: true
       data_reduction_process_mode: "inline"
+
+- name: Create several ldevs and delete one in a single task
+  hitachivantara.vspone_block.vsp.hv_ldev:
+    connection_info:
+      address: storage.company.com
+      username: "admin"
+      password: "passw0rd"
+    volumes:
+      - spec:
+          pool_id: 1
+          size: "10GB"
+          name: "App_LDEV_1"
+      - spec:
+          ldev_id: 301
+          pool_id: 1
+          size: "20GB"
+          name: "App_LDEV_2"
+      - state: absent
+        spec:
+          ldev_id: 120
 """
 
 RETURN = r"""
+volumes:
+  description: Result of each item of C(volumes), in the same order.
+  returned: when C(volumes) is given
+  type: list
+  elements: dict
+  contains:
+    changed:
+      description: Whether this item changed the storage system.
+      type: bool
+      sample: true
+    ldev_id:
+      description: LDEV ID of the item, the LDEV picked for items created with a free LDEV ID.
+      type: int
+      sample: 301
+    volume:
+      description: Storage volume with its attributes, same as C(volume).
+      type: dict
+      sample: {"ldev_id": 301, "name": "App_LDEV_2"}
+    comment:
+      description: Additional information about the operation on this item.
+      type: str
+      sample: "Volume formatted successfully,"
+    failed:
+      description: Present and true when this item failed.
+      type: bool
+      sample: true
+    msg:
+      description: Error message of a failed item.
+      type: str
+      sample: "either pool_id or parity_group or external_parity_group should be provided."
 volume:
   description: Storage volume with its attributes.
-  returned: success
+  returned: success and C(spec) is given
   type: dict
   contains:
     canonical_name:
@@ -787,7 +1204,12 @@ class VSPVolume:
 
         try:
             params_manager = VSPParametersManager(self.module.params)
-            self.spec = params_manager.set_volume_spec()
+            if self.module.params.get("volumes") is not None:
+                self.spec = None
+                self.items = params_manager.set_volume_specs()
+            else:
+                self.spec = params_manager.set_volume_spec()
+                self.items = None
             self.connection_info = params_manager.get_connection_info()
             self.serial = params_manager.get_serial()
             self.state = params_manager.get_state()
@@ -799,50 +1221,14 @@ class VSPVolume:
         self.logger.writeInfo("=== Start of LDEV operation ===")
         registration_message = validate_ansible_product_registration()
 
-        try:
-            comment = ""
+        if self.items is not None:
+            self.apply_volumes(registration_message)
 
+        try:
             volume_data = self.direct_volume()
-
-            if self.state == StateValue.ABSENT and not volume_data:
-                volume_response = "Volume deleted"
-            else:
-                if isinstance(volume_data, str):
-                    volume_response = volume_data
-                else:
-                    if isinstance(volume_data, dict):
-                        comment = volume_data.get("comment", None)
-                    volume_response = self.extract_volume_properties(volume_data)
-                if self.spec.should_shred_volume_enable:
-                    comment = "Volume shredded successfully," + comment
-                if self.spec.should_format_volume:
-                    if self.spec.is_task_timeout:
-                        comment = (
-                            "Volume format task is still in progress. It will finish after sometime "
-                            + comment
-                        )
-                    else:
-                        comment = "Volume formatted successfully," + comment
-                if self.spec.should_reclaim_zero_pages:
-                    comment = "Volume reclaimed to zero pages successfully," + comment
-
-                if self.spec.vldev_id:
-                    vldev_id = self.spec.vldev_id
-                    if comment is None:
-                        comment = ""
-                    else:
-                        comment = comment + " "
-                    if vldev_id == -1:
-                        comment = "Unassigned vldev_id successfully." + comment
-                    else:
-                        comment = (
-                            "Assigned vldev_id "
-                            + str(self.spec.vldev_id)
-                            + " successfully."
-                            + comment
-                        )
-                if self.spec.comment:
-                    comment = f"{self.spec.comment} " + comment
+            volume_response, comment = self.volume_result(
+                self.state, self.spec, volume_data
+            )
 
         except Exception as e:
             self.logger.writeError(f"An error occurred: {str(e)}")
@@ -860,6 +1246,91 @@ class VSPVolume:
         self.logger.writeInfo("=== End of LDEV operation ===")
         self.module.exit_json(**response)
 
+    def apply_volumes(self, registration_message):
+        try:
+            results = vsp_volume.VSPVolumeReconciler(
+                self.connection_info,
+                self.serial,
+            ).volumes_reconcile(self.items)
+        except Exception as e:
+            self.logger.writeError(f"An error occurred: {str(e)}")
+            self.logger.writeInfo("=== End of LDEV operation ===")
+            self.module.fail_json(msg=str(e))
+
+        volumes = []
+        failed = 0
+        for (state, spec), (changed, volume_data, error) in zip(self.items, results):
+            item = {"changed": changed, "ldev_id": spec.ldev_id}
+            if error is None:
+                try:
+                    item["volume"], comment = self.volume_result(
+                        state, spec, volume_data
+                    )
+                    if comment:
+                        item["comment"] = comment
+                except Exception as e:
+                    error = e
+            if error is not None:
+                failed += 1
+                item["failed"] = True
+                item["msg"] = str(error)
+            volumes.append(item)
+
+        response = {"changed": self.connection_info.changed, "volumes": volumes}
+        if registration_message:
+            response["user_consent_required"] = registration_message
+
+        self.logger.writeInfo(f"{response}")
+        self.logger.writeInfo("=== End of LDEV operation ===")
+        if failed:
+            self.module.fail_json(
+                msg=f"{failed} of {len(volumes)} volumes failed.", **response
+            )
+        self.module.exit_json(**response)
+
+    def volume_result(self, state, spec, volume_data):
+        comment = ""
+        if state == StateValue.ABSENT and not volume_data:
+            return "Volume deleted", comment
+
+        if isinstance(volume_data, str):
+            volume_response = volume_data
+        else:
+            if isinstance(volume_data, dict):
+                comment = volume_data.get("comment", None)
+            volume_response = self.extract_volume_properties(volume_data)
+        if spec.should_shred_volume_enable:
+            comment = "Volume shredded successfully," + comment
+        if spec.should_format_volume:
+            if spec.is_task_timeout:
+                comment = (
+                    "Volume format task is still in progress. It will finish after sometime "
+                    + comment
+                )
+            else:
+                comment = "Volume formatted successfully," + comment
+        if spec.should_reclaim_zero_pages:
+            comment = "Volume reclaimed to zero pages successfully," + comment
+
+        if spec.vldev_id:
+            vldev_id = spec.vldev_id
+            if comment is None:
+                comment = ""
+            else:
+                comment = comment + " "
+            if vldev_id == -1:
+                comment = "Unassigned vldev_id successfully." + comment
+            else:
+                comment = (
+                    "Assigned vldev_id "
+                    + str(spec.vldev_id)
+                    + " successfully."
+                    + comment
+                )
+        if spec.comment:
+            comment = f"{spec.comment} " + comment
+        return volume_response, comment
+
     def direct_volume(self):
 
         result = vsp_volume.VSPVolumeReconciler(
@@ -85,6 +85,12 @@ options:
           Required for the Lock Resource Groups task.
         type: int
         required: false
+      refresh_storage_cache:
+        description: Refreshes the storage cache service after the resource groups are locked and waits for
+          the refresh to finish, so that the lock state is up to date for the following tasks.
+        type: bool
+        required: false
+        default: false
 """
 
 EXAMPLES = """
@@ -154,6 +160,10 @@ locked_resource_groups:
           description: Name of the resource group.
           type: str
           sample: "test-rg-2"
+    lock_acquire_seconds:
+      description: Time taken to lock the resource groups, including the storage cache refresh when requested.
+      type: float
+      sample: 1.35
 """
 
 